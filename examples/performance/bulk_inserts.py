@@ -3,10 +3,16 @@ of rows in bulk.
 
 
 """
+import datetime
+import decimal
+
 from sqlalchemy import bindparam
+from sqlalchemy import Boolean
 from sqlalchemy import Column
 from sqlalchemy import create_engine
+from sqlalchemy import DateTime
 from sqlalchemy import Integer
+from sqlalchemy import Numeric
 from sqlalchemy import String
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
@@ -24,6 +30,15 @@ class Customer(Base):
     description = Column(String(255))
 
 
+class Invoice(Base):
+    __tablename__ = "invoice"
+    id = Column(Integer, primary_key=True)
+    customer_name = Column(String(255))
+    amount = Column(Numeric(10, 2))
+    created = Column(DateTime)
+    paid = Column(Boolean)
+
+
 Profiler.init("bulk_inserts", num=100000)
 
 
@@ -138,6 +153,25 @@ def test_core_insert(n):
     )
 
 
+@Profiler.profile
+def test_core_insert_typed(n):
+    """A single Core INSERT of mappings with bind-processed datatypes."""
+    conn = engine.connect()
+    created = datetime.datetime(2020, 1, 1, 12, 30)
+    conn.execute(
+        Invoice.__table__.insert(),
+        [
+            dict(
+                customer_name="customer name %d" % i,
+                amount=decimal.Decimal("%d.50" % i),
+                created=created,
+                paid=bool(i % 2),
+            )
+            for i in range(n)
+        ],
+    )
+
+
 @Profiler.profile
 def test_dbapi_raw(n):
     """The DBAPI's API inserting rows in bulk."""
@@ -3128,9 +3128,12 @@ class MSDialect(default.DefaultDialect):
             .order_by(RR.c.constraint_name, R.c.ordinal_position)
         )
 
-        # group rows by constraint ID, to handle multi-column FKs
-        fkeys = []
+        return self._get_foreign_keys_info(
+            connection.execute(s).fetchall(), dbname, owner, schema
+        )
 
+    def _get_foreign_keys_info(self, rows, dbname, owner, schema):
+        # group rows by constraint ID, to handle multi-column FKs
         def fkey_rec():
             return {
                 "name": None,
@@ -3142,8 +3145,10 @@ class MSDialect(default.DefaultDialect):
 
         fkeys = util.defaultdict(fkey_rec)
 
-        for r in connection.execute(s).fetchall():
-            scol, rschema, rtbl, rcol, rfknm, fkmatch, fkuprule, fkdelrule = r
+        for r in rows:
+            scol, rschema, rtbl, rcol, rfknm, fkmatch, fkuprule, fkdelrule = r[
+                0:8
+            ]
 
             rec = fkeys[rfknm]
             rec["name"] = rfknm
@@ -3163,3 +3168,207 @@ class MSDialect(default.DefaultDialect):
             remote_cols.append(rcol)
 
         return list(fkeys.values())
+
+    def _get_multi_table_names(self, connection, owner, filter_names):
+        """Return a dictionary of table names as stored in the database,
+        against the names they were requested with."""
+        tables = ischema.tables
+
+        if filter_names is None:
+            s = sql.select(tables.c.table_name).where(
+                sql.and_(
+                    tables.c.table_schema == owner,
+                    tables.c.table_type == "BASE TABLE",
+                )
+            )
+            return util.OrderedDict(
+                (row[0], row[0])
+                for row in connection.execute(s.order_by(tables.c.table_name))
+            )
+
+        requested = dict(
+            (util.text_type(name).lower(), name) for name in filter_names
+        )
+        table_names = util.OrderedDict()
+        for names in self._chunk_names(list(filter_names)):
+            s = sql.select(tables.c.table_name).where(
+                sql.and_(
+                    tables.c.table_schema == owner,
+                    tables.c.table_name.in_(self._table_names_param(names)),
+                )
+            )
+            for row in connection.execute(s):
+                table_names[row[0]] = requested.get(row[0].lower(), row[0])
+        return table_names
+
+    def _table_names_param(self, names):
+        # a plain Unicode type, as the CAST rendered for CoerceUnicode
+        # can't be applied to an expanded IN list
+        return sql.bindparam(
+            "table_names", names, sqltypes.Unicode(), expanding=True
+        )
+
+    def _chunk_names(self, names):
+        # stay well below the limit of 2100 parameters per statement
+        for start in range(0, len(names), 500):
+            yield names[start : start + 500]
+
+    @_db_plus_owner_listing
+    def get_multi_pk_constraint(
+        self, connection, dbname, owner, schema, filter_names=None, **kw
+    ):
+        table_names = self._get_multi_table_names(
+            connection, owner, filter_names
+        )
+        TC = ischema.constraints
+        C = ischema.key_constraints.alias("C")
+
+        result = util.OrderedDict(
+            (name, {"constrained_columns": [], "name": None})
+            for name in table_names
+        )
+        for names in self._chunk_names(list(table_names)):
+            s = sql.select(
+                C.c.column_name,
+                TC.c.constraint_type,
+                C.c.constraint_name,
+                C.c.table_name,
+            ).where(
+                sql.and_(
+                    TC.c.constraint_name == C.c.constraint_name,
+                    TC.c.table_schema == C.c.table_schema,
+                    C.c.table_name.in_(self._table_names_param(names)),
+                    C.c.table_schema == owner,
+                ),
+            )
+            c = connection.execution_options(future_result=True).execute(s)
+            for row in c.mappings():
+                if "PRIMARY" in row[TC.c.constraint_type.name]:
+                    pk = result[row[C.c.table_name.name]]
+                    pk["constrained_columns"].append(row["COLUMN_NAME"])
+                    if pk["name"] is None:
+                        pk["name"] = row[C.c.constraint_name.name]
+        return dict(
+            ((schema, table_names[name]), value)
+            for name, value in result.items()
+        )
+
+    @_db_plus_owner_listing
+    def get_multi_foreign_keys(
+        self, connection, dbname, owner, schema, filter_names=None, **kw
+    ):
+        table_names = self._get_multi_table_names(
+            connection, owner, filter_names
+        )
+        RR = ischema.ref_constraints
+        C = ischema.key_constraints.alias("C")
+        R = ischema.key_constraints.alias("R")
+
+        rows = util.OrderedDict((name, []) for name in table_names)
+        for names in self._chunk_names(list(table_names)):
+            s = (
+                sql.select(
+                    C.c.column_name,
+                    R.c.table_schema,
+                    R.c.table_name,
+                    R.c.column_name,
+                    RR.c.constraint_name,
+                    RR.c.match_option,
+                    RR.c.update_rule,
+                    RR.c.delete_rule,
+                    C.c.table_name,
+                )
+                .where(
+                    sql.and_(
+                        C.c.table_name.in_(self._table_names_param(names)),
+                        C.c.table_schema == owner,
+                        RR.c.constraint_schema == C.c.table_schema,
+                        C.c.constraint_name == RR.c.constraint_name,
+                        R.c.constraint_name == RR.c.unique_constraint_name,
+                        R.c.constraint_schema == RR.c.unique_constraint_schema,
+                        C.c.ordinal_position == R.c.ordinal_position,
+                    )
+                )
+                .order_by(
+                    C.c.table_name, RR.c.constraint_name, R.c.ordinal_position
+                )
+            )
+            for row in connection.execute(s).fetchall():
+                rows[row[8]].append(row)
+        return dict(
+            (
+                (schema, table_names[name]),
+                self._get_foreign_keys_info(table_rows, dbname, owner, schema),
+            )
+            for name, table_rows in rows.items()
+        )
+
+    @_db_plus_owner_listing
+    def get_multi_indexes(
+        self, connection, dbname, owner, schema, filter_names=None, **kw
+    ):
+        table_names = self._get_multi_table_names(
+            connection, owner, filter_names
+        )
+        # using system catalogs, don't support index reflection
+        # below MS 2005
+        if self.server_version_info < MS_2005_VERSION:
+            return dict(((schema, name), []) for name in table_names.values())
+
+        indexes = util.OrderedDict(
+            (name, util.OrderedDict()) for name in table_names
+        )
+        for names in self._chunk_names(list(table_names)):
+            rp = connection.execution_options(future_result=True).execute(
+                sql.text(
+                    "select ind.index_id, ind.is_unique, ind.name, "
+                    "tab.name as table_name "
+                    "from sys.indexes as ind join sys.tables as tab on "
+                    "ind.object_id=tab.object_id "
+                    "join sys.schemas as sch on sch.schema_id=tab.schema_id "
+                    "where tab.name in :table_names "
+                    "and sch.name=:schname "
+                    "and ind.is_primary_key=0 and ind.type != 0"
+                )
+                .bindparams(
+                    self._table_names_param(names),
+                    sql.bindparam("schname", owner, ischema.CoerceUnicode()),
+                )
+                .columns(name=sqltypes.Unicode())
+            )
+            for row in rp.mappings():
+                indexes[row["table_name"]][row["index_id"]] = {
+                    "name": row["name"],
+                    "unique": row["is_unique"] == 1,
+                    "column_names": [],
+                }
+            rp = connection.execution_options(future_result=True).execute(
+                sql.text(
+                    "select ind_col.index_id, ind_col.object_id, col.name, "
+                    "tab.name as table_name "
+                    "from sys.columns as col "
+                    "join sys.tables as tab on tab.object_id=col.object_id "
+                    "join sys.index_columns as ind_col on "
+                    "(ind_col.column_id=col.column_id and "
+                    "ind_col.object_id=tab.object_id) "
+                    "join sys.schemas as sch on sch.schema_id=tab.schema_id "
+                    "where tab.name in :table_names "
+                    "and sch.name=:schname"
+                )
+                .bindparams(
+                    self._table_names_param(names),
+                    sql.bindparam("schname", owner, ischema.CoerceUnicode()),
+                )
+                .columns(name=sqltypes.Unicode())
+            )
+            for row in rp.mappings():
+                table_indexes = indexes[row["table_name"]]
+                if row["index_id"] in table_indexes:
+                    table_indexes[row["index_id"]]["column_names"].append(
+                        row["name"]
+                    )
+
+        return dict(
+            ((schema, table_names[name]), list(table_indexes.values()))
+            for name, table_indexes in indexes.items()
+        )
@@ -48,6 +48,10 @@ from .base import VARCHAR
 from .base import YEAR
 from .dml import Insert
 from .dml import insert
+from ...util import compat
+
+if compat.py36:
+    from . import aiomysql  # noqa
 
 
 # default dialect
@@ -888,6 +888,7 @@ import re
 
 from sqlalchemy import literal_column
 from sqlalchemy.sql import visitors
+from . import dml
 from . import reflection as _reflection
 from .enumerated import ENUM
 from .enumerated import SET
@@ -2445,6 +2446,19 @@ class MySQLDialect(default.DefaultDialect):
         else:
             return None
 
+    def _bulk_upsert_construct(self, table, index_elements, set_columns):
+        # ON DUPLICATE KEY UPDATE applies to a conflict on any unique key,
+        # so index_elements aren't rendered; a "do nothing" is emitted
+        # as an assignment of one of those columns to itself
+        stmt = dml.insert(table)
+        if set_columns:
+            return stmt.on_duplicate_key_update(
+                dict((col.key, stmt.inserted[col.key]) for col in set_columns)
+            )
+        else:
+            col = index_elements[0]
+            return stmt.on_duplicate_key_update({col.key: col})
+
     _isolation_lookup = set(
         [
             "SERIALIZABLE",
@@ -2859,7 +2873,34 @@ class MySQLDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_foreign_keys(self, connection, table_name, schema=None, **kw):
+        fkeys = self._get_foreign_keys_info(
+            connection, table_name, schema, **kw
+        )
 
+        if self._needs_correct_for_88718_96365:
+            self._correct_for_mysql_bugs_88718_96365(fkeys, connection)
+
+        return fkeys
+
+    def get_multi_foreign_keys(self, connection, schema=None, **kw):
+        result = self._default_multi_reflect(
+            self._get_foreign_keys_info, connection, schema=schema, **kw
+        )
+
+        # the table definitions are parsed one at a time, however the
+        # information_schema lookup that corrects the casing of the
+        # referred names is run once for all the tables
+        if self._needs_correct_for_88718_96365:
+            self._correct_for_mysql_bugs_88718_96365(
+                [fkey for fkeys in result.values() for fkey in fkeys],
+                connection,
+            )
+
+        return result
+
+    def _get_foreign_keys_info(
+        self, connection, table_name, schema=None, **kw
+    ):
         parsed_state = self._parsed_state_or_create(
             connection, table_name, schema, **kw
         )
@@ -2895,9 +2936,6 @@ class MySQLDialect(default.DefaultDialect):
             }
             fkeys.append(fkey_d)
 
-        if self._needs_correct_for_88718_96365:
-            self._correct_for_mysql_bugs_88718_96365(fkeys, connection)
-
         return fkeys
 
     def _correct_for_mysql_bugs_88718_96365(self, fkeys, connection):
@@ -178,10 +178,13 @@ class MySQLDialect_mysqldb(MySQLDialect):
             connection, additional_tests
         )
 
-    def create_connect_args(self, url):
-        opts = url.translate_connect_args(
-            database="db", username="user", password="passwd"
-        )
+    def create_connect_args(self, url, _translate_args=None):
+        if _translate_args is None:
+            _translate_args = dict(
+                database="db", username="user", password="passwd"
+            )
+
+        opts = url.translate_connect_args(**_translate_args)
         opts.update(url.query)
 
         util.coerce_kw_type(opts, "compress", bool)
@@ -213,16 +216,24 @@ class MySQLDialect_mysqldb(MySQLDialect):
         # supports_sane_rowcount.
         client_flag = opts.get("client_flag", 0)
         if self.dbapi is not None:
-            try:
-                CLIENT_FLAGS = __import__(
-                    self.dbapi.__name__ + ".constants.CLIENT"
-                ).constants.CLIENT
-                client_flag |= CLIENT_FLAGS.FOUND_ROWS
-            except (AttributeError, ImportError):
+            found_rows = self._found_rows_client_flag()
+            if found_rows is None:
                 self.supports_sane_rowcount = False
+            else:
+                client_flag |= found_rows
             opts["client_flag"] = client_flag
         return [[], opts]
 
+    def _found_rows_client_flag(self):
+        try:
+            CLIENT_FLAGS = __import__(
+                self.dbapi.__name__ + ".constants.CLIENT"
+            ).constants.CLIENT
+        except (AttributeError, ImportError):
+            return None
+        else:
+            return CLIENT_FLAGS.FOUND_ROWS
+
     def _extract_error_code(self, exception):
         return exception.args[0]
 
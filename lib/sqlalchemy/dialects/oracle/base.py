@@ -1364,6 +1364,9 @@ class OracleDialect(default.DefaultDialect):
     supports_default_values = False
     supports_empty_insert = False
 
+    # Oracle allows at most 1000 expressions in an IN list
+    in_list_chunksize = 1000
+
     statement_compiler = OracleCompiler
     ddl_compiler = OracleDDLCompiler
     type_compiler = OracleTypeCompiler
@@ -1810,61 +1813,64 @@ class OracleDialect(default.DefaultDialect):
         c = connection.execute(sql.text(text), params)
 
         for row in c:
-            colname = self.normalize_name(row[0])
-            orig_colname = row[0]
-            coltype = row[1]
-            length = row[2]
-            precision = row[3]
-            scale = row[4]
-            nullable = row[5] == "Y"
-            default = row[6]
-            comment = row[7]
-            generated = row[8]
-
-            if coltype == "NUMBER":
-                if precision is None and scale == 0:
-                    coltype = INTEGER()
-                else:
-                    coltype = NUMBER(precision, scale)
-            elif coltype == "FLOAT":
-                # TODO: support "precision" here as "binary_precision"
-                coltype = FLOAT()
-            elif coltype in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
-                coltype = self.ischema_names.get(coltype)(length)
-            elif "WITH TIME ZONE" in coltype:
-                coltype = TIMESTAMP(timezone=True)
-            else:
-                coltype = re.sub(r"\(\d+\)", "", coltype)
-                try:
-                    coltype = self.ischema_names[coltype]
-                except KeyError:
-                    util.warn(
-                        "Did not recognize type '%s' of column '%s'"
-                        % (coltype, colname)
-                    )
-                    coltype = sqltypes.NULLTYPE
+            columns.append(self._get_column_info(row))
+        return columns
 
-            if generated == "YES":
-                computed = dict(sqltext=default)
-                default = None
+    def _get_column_info(self, row):
+        colname = self.normalize_name(row[0])
+        orig_colname = row[0]
+        coltype = row[1]
+        length = row[2]
+        precision = row[3]
+        scale = row[4]
+        nullable = row[5] == "Y"
+        default = row[6]
+        comment = row[7]
+        generated = row[8]
+
+        if coltype == "NUMBER":
+            if precision is None and scale == 0:
+                coltype = INTEGER()
             else:
-                computed = None
-
-            cdict = {
-                "name": colname,
-                "type": coltype,
-                "nullable": nullable,
-                "default": default,
-                "autoincrement": "auto",
-                "comment": comment,
-            }
-            if orig_colname.lower() == orig_colname:
-                cdict["quote"] = True
-            if computed is not None:
-                cdict["computed"] = computed
+                coltype = NUMBER(precision, scale)
+        elif coltype == "FLOAT":
+            # TODO: support "precision" here as "binary_precision"
+            coltype = FLOAT()
+        elif coltype in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
+            coltype = self.ischema_names.get(coltype)(length)
+        elif "WITH TIME ZONE" in coltype:
+            coltype = TIMESTAMP(timezone=True)
+        else:
+            coltype = re.sub(r"\(\d+\)", "", coltype)
+            try:
+                coltype = self.ischema_names[coltype]
+            except KeyError:
+                util.warn(
+                    "Did not recognize type '%s' of column '%s'"
+                    % (coltype, colname)
+                )
+                coltype = sqltypes.NULLTYPE
 
-            columns.append(cdict)
-        return columns
+        if generated == "YES":
+            computed = dict(sqltext=default)
+            default = None
+        else:
+            computed = None
+
+        cdict = {
+            "name": colname,
+            "type": coltype,
+            "nullable": nullable,
+            "default": default,
+            "autoincrement": "auto",
+            "comment": comment,
+        }
+        if orig_colname.lower() == orig_colname:
+            cdict["quote"] = True
+        if computed is not None:
+            cdict["computed"] = computed
+
+        return cdict
 
     @reflection.cache
     def get_table_comment(
@@ -1922,7 +1928,6 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=info_cache,
         )
-        indexes = []
 
         params = {"table_name": table_name}
         text = (
@@ -1947,8 +1952,6 @@ class OracleDialect(default.DefaultDialect):
 
         q = sql.text(text)
         rp = connection.execute(q, params)
-        indexes = []
-        last_index_name = None
         pk_constraint = self.get_pk_constraint(
             connection,
             table_name,
@@ -1957,6 +1960,11 @@ class OracleDialect(default.DefaultDialect):
             dblink=dblink,
             info_cache=kw.get("info_cache"),
         )
+        return self._get_indexes_info(rp, pk_constraint)
+
+    def _get_indexes_info(self, rows, pk_constraint):
+        indexes = []
+        last_index_name = None
 
         uniqueness = dict(NONUNIQUE=False, UNIQUE=True)
         enabled = dict(DISABLED=False, ENABLED=True)
@@ -1964,7 +1972,7 @@ class OracleDialect(default.DefaultDialect):
         oracle_sys_col = re.compile(r"SYS_NC\d+\$", re.IGNORECASE)
 
         index = None
-        for rset in rp:
+        for rset in rows:
             index_name_normalized = self.normalize_name(rset.index_name)
 
             # skip primary key index.  This is refined as of
@@ -2062,8 +2070,6 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=info_cache,
         )
-        pkeys = []
-        constraint_name = None
         constraint_data = self._get_constraint_data(
             connection,
             table_name,
@@ -2071,7 +2077,11 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=kw.get("info_cache"),
         )
+        return self._get_pk_constraint_info(constraint_data)
 
+    def _get_pk_constraint_info(self, constraint_data):
+        pkeys = []
+        constraint_name = None
         for row in constraint_data:
             (
                 cons_name,
@@ -2119,7 +2129,24 @@ class OracleDialect(default.DefaultDialect):
             dblink,
             info_cache=kw.get("info_cache"),
         )
+        return self._get_foreign_keys_info(
+            connection,
+            constraint_data,
+            requested_schema,
+            schema,
+            resolve_synonyms,
+            dblink,
+        )
 
+    def _get_foreign_keys_info(
+        self,
+        connection,
+        constraint_data,
+        requested_schema,
+        schema,
+        resolve_synonyms,
+        dblink,
+    ):
         def fkey_rec():
             return {
                 "name": None,
@@ -2223,13 +2250,16 @@ class OracleDialect(default.DefaultDialect):
             info_cache=kw.get("info_cache"),
         )
 
-        unique_keys = filter(lambda x: x[1] == "U", constraint_data)
-        uniques_group = groupby(unique_keys, lambda x: x[0])
-
         index_names = {
             ix["name"]
             for ix in self.get_indexes(connection, table_name, schema=schema)
         }
+        return self._get_unique_constraints_info(constraint_data, index_names)
+
+    def _get_unique_constraints_info(self, constraint_data, index_names):
+        unique_keys = filter(lambda x: x[1] == "U", constraint_data)
+        uniques_group = groupby(unique_keys, lambda x: x[0])
+
         return [
             {
                 "name": name,
@@ -2305,6 +2335,9 @@ class OracleDialect(default.DefaultDialect):
             info_cache=kw.get("info_cache"),
         )
 
+        return self._get_check_constraints_info(constraint_data, include_all)
+
+    def _get_check_constraints_info(self, constraint_data, include_all):
         check_constraints = filter(lambda x: x[1] == "C", constraint_data)
 
         return [
@@ -2313,6 +2346,370 @@ class OracleDialect(default.DefaultDialect):
             if include_all or not re.match(r"..+?. IS NOT NULL$", cons[8])
         ]
 
+    def _use_default_multi_reflect(self, kw):
+        # synonyms and dblinks are resolved on a per-table basis, so
+        # these fall back to calling the single-table methods
+        return kw.get("oracle_resolve_synonyms", False) or kw.get("dblink")
+
+    @reflection.cache
+    def _get_multi_table_names(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if filter_names is None:
+            return self.get_table_names(
+                connection, schema, info_cache=kw.get("info_cache")
+            )
+
+        owner = self.denormalize_name(schema or self.default_schema_name)
+        text = sql.text(
+            "SELECT object_name FROM all_objects "
+            "WHERE owner = :owner "
+            "AND object_type IN ('TABLE', 'VIEW') "
+            "AND object_name IN :table_names"
+        ).bindparams(sql.bindparam("table_names", expanding=True))
+
+        existing = set()
+        for names in self._chunk_names(
+            [self.denormalize_name(name) for name in filter_names]
+        ):
+            existing.update(
+                row[0]
+                for row in connection.execute(
+                    text, dict(owner=owner, table_names=names)
+                )
+            )
+        return [
+            name
+            for name in filter_names
+            if self.denormalize_name(name) in existing
+        ]
+
+    def _chunk_names(self, names):
+        # Oracle limits an IN list to 1000 expressions
+        for start in range(0, len(names), 500):
+            yield names[start : start + 500]
+
+    def _get_multi_by_names(
+        self, by_names_method, connection, schema=None, filter_names=None, **kw
+    ):
+        kw.pop("unreflectable", None)
+        table_names = self._get_multi_table_names(
+            connection,
+            schema,
+            filter_names=tuple(filter_names)
+            if filter_names is not None
+            else None,
+            info_cache=kw.get("info_cache"),
+        )
+        owner = self.denormalize_name(schema or self.default_schema_name)
+
+        result = {}
+        for names in self._chunk_names(
+            [self.denormalize_name(name) for name in table_names]
+        ):
+            for name, value in by_names_method(
+                connection, schema, owner, table_names=tuple(names), **kw
+            ).items():
+                result[(schema, self.normalize_name(name))] = value
+        return result
+
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self._use_default_multi_reflect(kw):
+            return super(OracleDialect, self).get_multi_columns(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        return self._get_multi_by_names(
+            self._get_columns_by_names, connection, schema, filter_names, **kw
+        )
+
+    @reflection.cache
+    def _get_columns_by_names(
+        self, connection, schema, owner, table_names=(), **kw
+    ):
+        if self._supports_char_length:
+            char_length_col = "char_length"
+        else:
+            char_length_col = "data_length"
+
+        text = """
+            SELECT col.column_name, col.data_type, col.%(char_length_col)s,
+              col.data_precision, col.data_scale, col.nullable,
+              col.data_default, com.comments, col.virtual_column,
+              col.table_name
+            FROM all_tab_cols col
+            LEFT JOIN all_col_comments com
+            ON col.table_name = com.table_name
+            AND col.column_name = com.column_name
+            AND col.owner = com.owner
+            WHERE col.table_name IN :table_names
+            AND col.hidden_column = 'NO'
+            AND col.owner = :owner
+            ORDER BY col.table_name, col.column_id
+        """ % {
+            "char_length_col": char_length_col
+        }
+        c = connection.execute(
+            sql.text(text).bindparams(
+                sql.bindparam("table_names", expanding=True)
+            ),
+            dict(owner=owner, table_names=list(table_names)),
+        )
+
+        columns = dict((table_name, []) for table_name in table_names)
+        for row in c:
+            columns[row[9]].append(self._get_column_info(row))
+        return columns
+
+    def get_multi_table_comment(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self._use_default_multi_reflect(kw):
+            return super(OracleDialect, self).get_multi_table_comment(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        return self._get_multi_by_names(
+            self._get_table_comment_by_names,
+            connection,
+            schema,
+            filter_names,
+            **kw
+        )
+
+    def _get_table_comment_by_names(
+        self, connection, schema, owner, table_names=(), **kw
+    ):
+        c = connection.execute(
+            sql.text(
+                "SELECT table_name, comments FROM all_tab_comments "
+                "WHERE table_name IN :table_names AND owner = :schema_name"
+            ).bindparams(sql.bindparam("table_names", expanding=True)),
+            dict(table_names=list(table_names), schema_name=owner),
+        )
+        comments = dict(
+            (table_name, {"text": None}) for table_name in table_names
+        )
+        for table_name, comment in c:
+            comments[table_name] = {"text": comment}
+        return comments
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self._use_default_multi_reflect(kw):
+            return super(OracleDialect, self).get_multi_indexes(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+        return self._get_multi_by_names(
+            self._get_indexes_by_names, connection, schema, filter_names, **kw
+        )
+
+    @reflection.cache
+    def _get_indexes_by_names(
+        self, connection, schema, owner, table_names=(), **kw
+    ):
+        text = (
+            "SELECT a.index_name, a.column_name, "
+            "\nb.index_type, b.uniqueness, b.compression, b.prefix_length, "
+            "\na.table_name "
+            "\nFROM ALL_IND_COLUMNS a, "
+            "\nALL_INDEXES b "
+            "\nWHERE "
+            "\na.index_name = b.index_name "
+            "\nAND a.table_owner = b.table_owner "
+            "\nAND a.table_name = b.table_name "
+            "\nAND a.table_name IN :table_names "
+            "\nAND a.table_owner = :schema "
+            "ORDER BY a.table_name, a.index_name, a.column_position"
+        )
+        rp = connection.execute(
+            sql.text(text).bindparams(
+                sql.bindparam("table_names", expanding=True)
+            ),
+            dict(schema=owner, table_names=list(table_names)),
+        )
+        constraint_data = self._get_constraint_data_by_names(
+            connection,
+            schema,
+            owner,
+            table_names=table_names,
+            info_cache=kw.get("info_cache"),
+        )
+        return dict(
+            (
+                table_name,
+                self._get_indexes_info(
+                    rows,
+                    self._get_pk_constraint_info(constraint_data[table_name]),
+                ),
+            )
+            for table_name, rows in self._group_by_table_name(
+                table_names, rp, 6
+            ).items()
+        )
+
+    def _group_by_table_name(self, table_names, rows, index):
+        grouped = dict((table_name, []) for table_name in table_names)
+        for row in rows:
+            grouped[row[index]].append(row)
+        return grouped
+
+    @reflection.cache
+    def _get_constraint_data_by_names(
+        self, connection, schema, owner, table_names=(), **kw
+    ):
+        text = (
+            "SELECT"
+            "\nac.constraint_name,"  # 0
+            "\nac.constraint_type,"  # 1
+            "\nloc.column_name AS local_column,"  # 2
+            "\nrem.table_name AS remote_table,"  # 3
+            "\nrem.column_name AS remote_column,"  # 4
+            "\nrem.owner AS remote_owner,"  # 5
+            "\nloc.position as loc_pos,"  # 6
+            "\nrem.position as rem_pos,"  # 7
+            "\nac.search_condition,"  # 8
+            "\nac.delete_rule,"  # 9
+            "\nac.table_name"  # 10
+            "\nFROM all_constraints ac,"
+            "\nall_cons_columns loc,"
+            "\nall_cons_columns rem"
+            "\nWHERE ac.table_name IN :table_names"
+            "\nAND ac.constraint_type IN ('R','P', 'U', 'C')"
+            "\nAND ac.owner = :owner"
+            "\nAND ac.owner = loc.owner"
+            "\nAND ac.constraint_name = loc.constraint_name"
+            "\nAND ac.r_owner = rem.owner(+)"
+            "\nAND ac.r_constraint_name = rem.constraint_name(+)"
+            "\nAND (rem.position IS NULL or loc.position=rem.position)"
+            "\nORDER BY ac.table_name, ac.constraint_name, loc.position"
+        )
+        rp = connection.execute(
+            sql.text(text).bindparams(
+                sql.bindparam("table_names", expanding=True)
+            ),
+            dict(owner=owner, table_names=list(table_names)),
+        )
+        return self._group_by_table_name(table_names, rp, 10)
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self._use_default_multi_reflect(kw):
+            return super(OracleDialect, self).get_multi_pk_constraint(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        def get_pk_constraint(connection, schema, owner, table_names, **kw):
+            constraint_data = self._get_constraint_data_by_names(
+                connection, schema, owner, table_names=table_names, **kw
+            )
+            return dict(
+                (table_name, self._get_pk_constraint_info(rows))
+                for table_name, rows in constraint_data.items()
+            )
+
+        return self._get_multi_by_names(
+            get_pk_constraint, connection, schema, filter_names, **kw
+        )
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self._use_default_multi_reflect(kw):
+            return super(OracleDialect, self).get_multi_foreign_keys(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        def get_foreign_keys(connection, schema, owner, table_names, **kw):
+            constraint_data = self._get_constraint_data_by_names(
+                connection,
+                schema,
+                owner,
+                table_names=table_names,
+                info_cache=kw.get("info_cache"),
+            )
+            return dict(
+                (
+                    table_name,
+                    self._get_foreign_keys_info(
+                        connection, rows, schema, owner, False, ""
+                    ),
+                )
+                for table_name, rows in constraint_data.items()
+            )
+
+        return self._get_multi_by_names(
+            get_foreign_keys, connection, schema, filter_names, **kw
+        )
+
+    def get_multi_unique_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self._use_default_multi_reflect(kw):
+            return super(OracleDialect, self).get_multi_unique_constraints(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        def get_unique_constraints(
+            connection, schema, owner, table_names, **kw
+        ):
+            constraint_data = self._get_constraint_data_by_names(
+                connection, schema, owner, table_names=table_names, **kw
+            )
+            indexes = self._get_indexes_by_names(
+                connection, schema, owner, table_names=table_names, **kw
+            )
+            return dict(
+                (
+                    table_name,
+                    self._get_unique_constraints_info(
+                        rows, {ix["name"] for ix in indexes[table_name]}
+                    ),
+                )
+                for table_name, rows in constraint_data.items()
+            )
+
+        return self._get_multi_by_names(
+            get_unique_constraints, connection, schema, filter_names, **kw
+        )
+
+    def get_multi_check_constraints(
+        self,
+        connection,
+        schema=None,
+        filter_names=None,
+        include_all=False,
+        **kw
+    ):
+        if self._use_default_multi_reflect(kw):
+            return super(OracleDialect, self).get_multi_check_constraints(
+                connection,
+                schema=schema,
+                filter_names=filter_names,
+                include_all=include_all,
+                **kw
+            )
+
+        def get_check_constraints(
+            connection, schema, owner, table_names, **kw
+        ):
+            constraint_data = self._get_constraint_data_by_names(
+                connection, schema, owner, table_names=table_names, **kw
+            )
+            return dict(
+                (
+                    table_name,
+                    self._get_check_constraints_info(rows, include_all),
+                )
+                for table_name, rows in constraint_data.items()
+            )
+
+        return self._get_multi_by_names(
+            get_check_constraints, connection, schema, filter_names, **kw
+        )
+
 
 class _OuterJoinColumn(sql.ClauseElement):
     __visit_name__ = "outer_join_column"
@@ -1030,6 +1030,7 @@ import re
 from uuid import UUID as _python_UUID
 
 from . import array as _array
+from . import dml
 from . import hstore as _hstore
 from . import json as _json
 from . import ranges as _ranges
@@ -2597,6 +2598,7 @@ class PGDialect(default.DefaultDialect):
 
     implicit_returning = True
     full_returning = True
+    in_list_use_any = True
 
     construct_arguments = [
         (
@@ -2646,6 +2648,8 @@ class PGDialect(default.DefaultDialect):
 
         if self.server_version_info <= (8, 2):
             self.full_returning = self.implicit_returning = False
+            self.use_insertmanyvalues = False
+            self.insert_executemany_returning = False
 
         self.supports_native_enum = self.server_version_info >= (8, 3)
         if not self.supports_native_enum:
@@ -2683,6 +2687,18 @@ class PGDialect(default.DefaultDialect):
         else:
             return None
 
+    def _bulk_upsert_construct(self, table, index_elements, set_columns):
+        stmt = dml.insert(table)
+        if set_columns:
+            return stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_=dict(
+                    (col.key, stmt.excluded[col.key]) for col in set_columns
+                ),
+            )
+        else:
+            return stmt.on_conflict_do_nothing(index_elements=index_elements)
+
     _isolation_lookup = set(
         [
             "SERIALIZABLE",
@@ -3021,13 +3037,175 @@ class PGDialect(default.DefaultDialect):
         )
         return view_def
 
+    @reflection.cache
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        # LATERAL requires PG 9.3
+        if self.server_version_info < (9, 3):
+            return None
+
+        # every DDL statement writes new versions of the catalog rows it
+        # affects, so the transaction ids (xmin) of the rows that describe
+        # the relations in the schema change along with their definition.
+        # pg_rewrite covers CREATE OR REPLACE VIEW, which may leave
+        # pg_class untouched; pg_enum covers ALTER TYPE .. ADD VALUE /
+        # RENAME VALUE on the ENUM types (or arrays of them) used by a
+        # column.  Changes to a DOMAIN's definition are not detected.
+        fingerprint = sql.text(
+            """
+            SELECT md5(string_agg(f.entry, ',' ORDER BY f.entry))
+            FROM (
+                SELECT 'c' || c.oid || ':' || c.xmin::text AS entry,
+                    c.oid AS relid
+                FROM pg_catalog.pg_class c
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = :schema
+            ) AS r
+            CROSS JOIN LATERAL (
+                SELECT r.entry
+                UNION ALL
+                SELECT 'a' || a.attnum || ':' || a.xmin::text
+                FROM pg_catalog.pg_attribute a WHERE a.attrelid = r.relid
+                UNION ALL
+                SELECT 'd' || d.oid || ':' || d.xmin::text
+                FROM pg_catalog.pg_attrdef d WHERE d.adrelid = r.relid
+                UNION ALL
+                SELECT 'k' || k.oid || ':' || k.xmin::text
+                FROM pg_catalog.pg_constraint k WHERE k.conrelid = r.relid
+                UNION ALL
+                SELECT 'm' || m.objsubid || ':' || m.xmin::text
+                FROM pg_catalog.pg_description m
+                WHERE m.objoid = r.relid
+                AND m.classoid = 'pg_catalog.pg_class'::regclass
+                UNION ALL
+                SELECT 'w' || w.oid || ':' || w.xmin::text
+                FROM pg_catalog.pg_rewrite w WHERE w.ev_class = r.relid
+                UNION ALL
+                SELECT 'e' || e.oid || ':' || e.xmin::text
+                FROM pg_catalog.pg_attribute a
+                JOIN pg_catalog.pg_type t ON t.oid = a.atttypid
+                JOIN pg_catalog.pg_enum e
+                ON e.enumtypid = t.oid OR e.enumtypid = t.typelem
+                WHERE a.attrelid = r.relid
+            ) AS f(entry)
+            """
+        )
+        return connection.scalar(
+            fingerprint.bindparams(
+                sql.bindparam(
+                    "schema",
+                    schema or self.default_schema_name,
+                    type_=sqltypes.Unicode,
+                )
+            )
+        )
+
+    @reflection.cache
+    def _get_table_oids(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Fetch the oids of the relations to be reflected by the
+        ``get_multi_*`` methods.
+
+        Returns a dictionary of oid to relation name.  When
+        ``filter_names`` is omitted, all tables in the schema are included,
+        as with :meth:`.get_table_names`; otherwise the relations with the
+        given names are located in the same way as :meth:`.get_table_oid`.
+
+        """
+        if filter_names is not None and not filter_names:
+            return {}
+
+        params = {}
+        if filter_names is not None:
+            relation_where_clause = (
+                "c.relname IN :filter_names AND c.relkind in "
+                "('r', 'v', 'm', 'f', 'p')"
+            )
+            params["filter_names"] = [
+                util.text_type(name) for name in filter_names
+            ]
+        else:
+            relation_where_clause = "c.relkind in ('r', 'p')"
+            if schema is None:
+                schema = self.default_schema_name
+
+        if schema is not None:
+            schema_where_clause = "n.nspname = :schema"
+            params["schema"] = util.text_type(schema)
+        else:
+            schema_where_clause = "pg_catalog.pg_table_is_visible(c.oid)"
+        query = """
+            SELECT c.oid, c.relname
+            FROM pg_catalog.pg_class c
+            LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE (%s)
+            AND %s
+            ORDER BY c.relname
+        """ % (
+            schema_where_clause,
+            relation_where_clause,
+        )
+        s = sql.text(query).columns(
+            oid=sqltypes.Integer, relname=sqltypes.Unicode
+        )
+        if "schema" in params:
+            s = s.bindparams(sql.bindparam("schema", type_=sqltypes.Unicode))
+        if "filter_names" in params:
+            s = s.bindparams(
+                sql.bindparam(
+                    "filter_names", expanding=True, type_=sqltypes.Unicode
+                )
+            )
+        c = connection.execute(s, params)
+        return util.OrderedDict(c.fetchall())
+
+    def _get_multi_by_oid(
+        self, by_oid_method, connection, schema=None, filter_names=None, **kw
+    ):
+        kw.pop("unreflectable", None)
+        tables = self._get_table_oids(
+            connection,
+            schema,
+            filter_names=tuple(filter_names)
+            if filter_names is not None
+            else None,
+            info_cache=kw.pop("info_cache", None),
+        )
+        if not tables:
+            return {}
+        result = by_oid_method(connection, list(tables), schema, **kw)
+        return dict(
+            ((schema, tables[table_oid]), value)
+            for table_oid, value in result.items()
+        )
+
+    def _table_oids_param(self, table_oids):
+        return sql.bindparam(
+            "table_oids", table_oids, expanding=True, type_=sqltypes.Integer
+        )
+
     @reflection.cache
     def get_columns(self, connection, table_name, schema=None, **kw):
 
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_columns_by_oid(connection, [table_oid], schema)[
+            table_oid
+        ]
+
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi_by_oid(
+            self._get_columns_by_oid,
+            connection,
+            schema=schema,
+            filter_names=filter_names,
+            **kw
+        )
 
+    def _get_columns_by_oid(self, connection, table_oids, schema, **kw):
         generated = (
             "a.attgenerated as generated"
             if self.server_version_info >= (12,)
@@ -3048,18 +3226,18 @@ class PGDialect(default.DefaultDialect):
             FROM pg_catalog.pg_attribute a
             LEFT JOIN pg_catalog.pg_description pgd ON (
                 pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
-            WHERE a.attrelid = :table_oid
+            WHERE a.attrelid IN :table_oids
             AND a.attnum > 0 AND NOT a.attisdropped
-            ORDER BY a.attnum
+            ORDER BY a.attrelid, a.attnum
         """
             % generated
         )
         s = (
             sql.text(SQL_COLS)
-            .bindparams(sql.bindparam("table_oid", type_=sqltypes.Integer))
+            .bindparams(self._table_oids_param(table_oids))
             .columns(attname=sqltypes.Unicode, default=sqltypes.Unicode)
         )
-        c = connection.execute(s, dict(table_oid=table_oid))
+        c = connection.execute(s)
         rows = c.fetchall()
 
         # dictionary with (name, ) if default search path or (schema, name)
@@ -3076,7 +3254,7 @@ class PGDialect(default.DefaultDialect):
         )
 
         # format columns
-        columns = []
+        columns = dict((table_oid, []) for table_oid in table_oids)
 
         for (
             name,
@@ -3099,7 +3277,7 @@ class PGDialect(default.DefaultDialect):
                 comment,
                 generated,
             )
-            columns.append(column_info)
+            columns[table_oid].append(column_info)
         return columns
 
     def _get_column_info(
@@ -3270,18 +3448,33 @@ class PGDialect(default.DefaultDialect):
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_pk_constraint_by_oid(connection, [table_oid], schema)[
+            table_oid
+        ]
 
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi_by_oid(
+            self._get_pk_constraint_by_oid,
+            connection,
+            schema=schema,
+            filter_names=filter_names,
+            **kw
+        )
+
+    def _get_pk_constraint_by_oid(self, connection, table_oids, schema, **kw):
         if self.server_version_info < (8, 4):
             PK_SQL = """
-                SELECT a.attname
+                SELECT t.oid, a.attname
                 FROM
                     pg_class t
                     join pg_index ix on t.oid = ix.indrelid
                     join pg_attribute a
                         on t.oid=a.attrelid AND %s
                  WHERE
-                  t.oid = :table_oid and ix.indisprimary = 't'
-                ORDER BY a.attnum
+                  t.oid IN :table_oids and ix.indisprimary = 't'
+                ORDER BY t.oid, a.attnum
             """ % self._pg_index_any(
                 "a.attnum", "ix.indkey"
             )
@@ -3290,31 +3483,47 @@ class PGDialect(default.DefaultDialect):
             # unnest() and generate_subscripts() both introduced in
             # version 8.4
             PK_SQL = """
-                SELECT a.attname
+                SELECT a.attrelid, a.attname
                 FROM pg_attribute a JOIN (
-                    SELECT unnest(ix.indkey) attnum,
+                    SELECT ix.indrelid,
+                           unnest(ix.indkey) attnum,
                            generate_subscripts(ix.indkey, 1) ord
                     FROM pg_index ix
-                    WHERE ix.indrelid = :table_oid AND ix.indisprimary
-                    ) k ON a.attnum=k.attnum
-                WHERE a.attrelid = :table_oid
-                ORDER BY k.ord
+                    WHERE ix.indrelid IN :table_oids AND ix.indisprimary
+                    ) k ON a.attrelid=k.indrelid AND a.attnum=k.attnum
+                ORDER BY a.attrelid, k.ord
             """
-        t = sql.text(PK_SQL).columns(attname=sqltypes.Unicode)
-        c = connection.execute(t, dict(table_oid=table_oid))
-        cols = [r[0] for r in c.fetchall()]
+        t = (
+            sql.text(PK_SQL)
+            .bindparams(self._table_oids_param(table_oids))
+            .columns(attname=sqltypes.Unicode)
+        )
+        c = connection.execute(t)
+
+        result = dict(
+            (table_oid, {"constrained_columns": [], "name": None})
+            for table_oid in table_oids
+        )
+        for table_oid, attname in c.fetchall():
+            result[table_oid]["constrained_columns"].append(attname)
 
         PK_CONS_SQL = """
-        SELECT conname
+        SELECT r.conrelid, conname
            FROM  pg_catalog.pg_constraint r
-           WHERE r.conrelid = :table_oid AND r.contype = 'p'
-           ORDER BY 1
+           WHERE r.conrelid IN :table_oids AND r.contype = 'p'
+           ORDER BY 1, 2
         """
-        t = sql.text(PK_CONS_SQL).columns(conname=sqltypes.Unicode)
-        c = connection.execute(t, dict(table_oid=table_oid))
-        name = c.scalar()
+        t = (
+            sql.text(PK_CONS_SQL)
+            .bindparams(self._table_oids_param(table_oids))
+            .columns(conname=sqltypes.Unicode)
+        )
+        c = connection.execute(t)
+        for table_oid, name in c.fetchall():
+            if result[table_oid]["name"] is None:
+                result[table_oid]["name"] = name
 
-        return {"constrained_columns": cols, "name": name}
+        return result
 
     @reflection.cache
     def get_foreign_keys(
@@ -3325,24 +3534,51 @@ class PGDialect(default.DefaultDialect):
         postgresql_ignore_search_path=False,
         **kw
     ):
-        preparer = self.identifier_preparer
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_foreign_keys_by_oid(
+            connection,
+            [table_oid],
+            schema,
+            postgresql_ignore_search_path=postgresql_ignore_search_path,
+        )[table_oid]
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi_by_oid(
+            self._get_foreign_keys_by_oid,
+            connection,
+            schema=schema,
+            filter_names=filter_names,
+            **kw
+        )
+
+    def _get_foreign_keys_by_oid(
+        self,
+        connection,
+        table_oids,
+        schema,
+        postgresql_ignore_search_path=False,
+        **kw
+    ):
+        preparer = self.identifier_preparer
 
         FK_SQL = """
-          SELECT r.conname,
+          SELECT r.conrelid,
+                r.conname,
                 pg_catalog.pg_get_constraintdef(r.oid, true) as condef,
                 n.nspname as conschema
           FROM  pg_catalog.pg_constraint r,
                 pg_namespace n,
                 pg_class c
 
-          WHERE r.conrelid = :table AND
+          WHERE r.conrelid IN :table_oids AND
                 r.contype = 'f' AND
                 c.oid = confrelid AND
                 n.oid = c.relnamespace
-          ORDER BY 1
+          ORDER BY 1, 2
         """
         # http://www.postgresql.org/docs/9.0/static/sql-createtable.html
         FK_REGEX = re.compile(
@@ -3356,12 +3592,14 @@ class PGDialect(default.DefaultDialect):
             r"[\s]?(INITIALLY (DEFERRED|IMMEDIATE)+)?"
         )
 
-        t = sql.text(FK_SQL).columns(
-            conname=sqltypes.Unicode, condef=sqltypes.Unicode
+        t = (
+            sql.text(FK_SQL)
+            .bindparams(self._table_oids_param(table_oids))
+            .columns(conname=sqltypes.Unicode, condef=sqltypes.Unicode)
         )
-        c = connection.execute(t, dict(table=table_oid))
-        fkeys = []
-        for conname, condef, conschema in c.fetchall():
+        c = connection.execute(t)
+        fkeys = dict((table_oid, []) for table_oid in table_oids)
+        for table_oid, conname, condef, conschema in c.fetchall():
             m = re.search(FK_REGEX, condef).groups()
 
             (
@@ -3428,7 +3666,7 @@ class PGDialect(default.DefaultDialect):
                 "referred_columns": referred_columns,
                 "options": options,
             }
-            fkeys.append(fkey_d)
+            fkeys[table_oid].append(fkey_d)
         return fkeys
 
     def _pg_index_any(self, col, compare_to):
@@ -3450,13 +3688,29 @@ class PGDialect(default.DefaultDialect):
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_indexes_by_oid(connection, [table_oid], schema)[
+            table_oid
+        ]
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi_by_oid(
+            self._get_indexes_by_oid,
+            connection,
+            schema=schema,
+            filter_names=filter_names,
+            **kw
+        )
 
+    def _get_indexes_by_oid(self, connection, table_oids, schema, **kw):
         # cast indkey as varchar since it's an int2vector,
         # returned as a list by some drivers such as pypostgresql
 
         if self.server_version_info < (8, 5):
             IDX_SQL = """
               SELECT
+                  t.oid as table_oid,
                   i.relname as relname,
                   ix.indisunique, ix.indexprs, ix.indpred,
                   a.attname, a.attnum, NULL, ix.indkey%s,
@@ -3474,10 +3728,10 @@ class PGDialect(default.DefaultDialect):
                             on i.relam = am.oid
               WHERE
                   t.relkind IN ('r', 'v', 'f', 'm')
-                  and t.oid = :table_oid
+                  and t.oid IN :table_oids
                   and ix.indisprimary = 'f'
               ORDER BY
-                  t.relname,
+                  t.oid,
                   i.relname
             """ % (
                 # version 8.3 here was based on observing the
@@ -3495,6 +3749,7 @@ class PGDialect(default.DefaultDialect):
         else:
             IDX_SQL = """
               SELECT
+                  t.oid as table_oid,
                   i.relname as relname,
                   ix.indisunique, ix.indexprs, ix.indpred,
                   a.attname, a.attnum, c.conrelid, ix.indkey::varchar,
@@ -3517,10 +3772,10 @@ class PGDialect(default.DefaultDialect):
                             on i.relam = am.oid
               WHERE
                   t.relkind IN ('r', 'v', 'f', 'm', 'p')
-                  and t.oid = :table_oid
+                  and t.oid IN :table_oids
                   and ix.indisprimary = 'f'
               ORDER BY
-                  t.relname,
+                  t.oid,
                   i.relname
             """ % (
                 "ix.indnkeyatts"
@@ -3528,16 +3783,21 @@ class PGDialect(default.DefaultDialect):
                 else "NULL",
             )
 
-        t = sql.text(IDX_SQL).columns(
-            relname=sqltypes.Unicode, attname=sqltypes.Unicode
+        t = (
+            sql.text(IDX_SQL)
+            .bindparams(self._table_oids_param(table_oids))
+            .columns(relname=sqltypes.Unicode, attname=sqltypes.Unicode)
         )
-        c = connection.execute(t, dict(table_oid=table_oid))
+        c = connection.execute(t)
 
-        indexes = defaultdict(lambda: defaultdict(dict))
+        table_indexes = dict(
+            (table_oid, util.OrderedDict()) for table_oid in table_oids
+        )
 
         sv_idx_name = None
         for row in c.fetchall():
             (
+                table_oid,
                 idx_name,
                 unique,
                 expr,
@@ -3568,7 +3828,10 @@ class PGDialect(default.DefaultDialect):
                 )
                 sv_idx_name = idx_name
 
+            indexes = table_indexes[table_oid]
             has_idx = idx_name in indexes
+            if not has_idx:
+                indexes[idx_name] = defaultdict(dict)
             index = indexes[idx_name]
             if col is not None:
                 index["cols"][col_num] = col
@@ -3623,6 +3886,12 @@ class PGDialect(default.DefaultDialect):
                 if amname and amname != "btree":
                     index["amname"] = amname
 
+        return dict(
+            (table_oid, self._get_index_entries(indexes))
+            for table_oid, indexes in table_indexes.items()
+        )
+
+    def _get_index_entries(self, indexes):
         result = []
         for name, idx in indexes.items():
             entry = {
@@ -3655,9 +3924,27 @@ class PGDialect(default.DefaultDialect):
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_unique_constraints_by_oid(
+            connection, [table_oid], schema
+        )[table_oid]
 
+    def get_multi_unique_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi_by_oid(
+            self._get_unique_constraints_by_oid,
+            connection,
+            schema=schema,
+            filter_names=filter_names,
+            **kw
+        )
+
+    def _get_unique_constraints_by_oid(
+        self, connection, table_oids, schema, **kw
+    ):
         UNIQUE_SQL = """
             SELECT
+                cons.conrelid as table_oid,
                 cons.conname as name,
                 cons.conkey as key,
                 a.attnum as col_num,
@@ -3668,44 +3955,86 @@ class PGDialect(default.DefaultDialect):
                   on cons.conrelid = a.attrelid AND
                     a.attnum = ANY(cons.conkey)
             WHERE
-                cons.conrelid = :table_oid AND
+                cons.conrelid IN :table_oids AND
                 cons.contype = 'u'
+            ORDER BY cons.conrelid, cons.conname
         """
 
-        t = sql.text(UNIQUE_SQL).columns(col_name=sqltypes.Unicode)
-        c = connection.execute(t, dict(table_oid=table_oid))
+        t = (
+            sql.text(UNIQUE_SQL)
+            .bindparams(self._table_oids_param(table_oids))
+            .columns(col_name=sqltypes.Unicode)
+        )
+        c = connection.execute(t)
 
-        uniques = defaultdict(lambda: defaultdict(dict))
+        table_uniques = dict(
+            (table_oid, util.OrderedDict()) for table_oid in table_oids
+        )
         for row in c.fetchall():
+            uniques = table_uniques[row.table_oid]
+            if row.name not in uniques:
+                uniques[row.name] = defaultdict(dict)
             uc = uniques[row.name]
             uc["key"] = row.key
             uc["cols"][row.col_num] = row.col_name
 
-        return [
-            {"name": name, "column_names": [uc["cols"][i] for i in uc["key"]]}
-            for name, uc in uniques.items()
-        ]
+        return dict(
+            (
+                table_oid,
+                [
+                    {
+                        "name": name,
+                        "column_names": [uc["cols"][i] for i in uc["key"]],
+                    }
+                    for name, uc in uniques.items()
+                ],
+            )
+            for table_oid, uniques in table_uniques.items()
+        )
 
     @reflection.cache
     def get_table_comment(self, connection, table_name, schema=None, **kw):
         table_oid = self.get_table_oid(
             connection, table_name, schema, info_cache=kw.get("info_cache")
         )
+        return self._get_table_comment_by_oid(connection, [table_oid], schema)[
+            table_oid
+        ]
+
+    def get_multi_table_comment(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi_by_oid(
+            self._get_table_comment_by_oid,
+            connection,
+            schema=schema,
+            filter_names=filter_names,
+            **kw
+        )
 
+    def _get_table_comment_by_oid(self, connection, table_oids, schema, **kw):
         COMMENT_SQL = """
             SELECT
+                pgd.objoid as table_oid,
                 pgd.description as table_comment
             FROM
                 pg_catalog.pg_description pgd
             WHERE
                 pgd.objsubid = 0 AND
-                pgd.objoid = :table_oid
+                pgd.objoid IN :table_oids
         """
 
         c = connection.execute(
-            sql.text(COMMENT_SQL), dict(table_oid=table_oid)
+            sql.text(COMMENT_SQL).bindparams(
+                self._table_oids_param(table_oids)
+            )
         )
-        return {"text": c.scalar()}
+        comments = dict(
+            (table_oid, {"text": None}) for table_oid in table_oids
+        )
+        for table_oid, text in c.fetchall():
+            comments[table_oid]["text"] = text
+        return comments
 
     @reflection.cache
     def get_check_constraints(self, connection, table_name, schema=None, **kw):
@@ -3726,31 +4055,66 @@ class PGDialect(default.DefaultDialect):
 
         c = connection.execute(sql.text(CHECK_SQL), dict(table_oid=table_oid))
 
-        ret = []
-        for name, src in c:
-            # samples:
-            # "CHECK (((a > 1) AND (a < 5)))"
-            # "CHECK (((a = 1) OR ((a > 2) AND (a < 5))))"
-            # "CHECK (((a > 1) AND (a < 5))) NOT VALID"
-            # "CHECK (some_boolean_function(a))"
-            # "CHECK (((a\n < 1)\n OR\n (a\n >= 5))\n)"
-
-            m = re.match(
-                r"^CHECK *\((.+)\)( NOT VALID)?$", src, flags=re.DOTALL
+        return [self._get_check_constraint_info(name, src) for name, src in c]
+
+    def get_multi_check_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        return self._get_multi_by_oid(
+            self._get_check_constraints_by_oid,
+            connection,
+            schema=schema,
+            filter_names=filter_names,
+            **kw
+        )
+
+    def _get_check_constraints_by_oid(
+        self, connection, table_oids, schema, **kw
+    ):
+        CHECK_SQL = """
+            SELECT
+                cons.conrelid as table_oid,
+                cons.conname as name,
+                pg_get_constraintdef(cons.oid) as src
+            FROM
+                pg_catalog.pg_constraint cons
+            WHERE
+                cons.conrelid IN :table_oids AND
+                cons.contype = 'c'
+            ORDER BY cons.conrelid, cons.conname
+        """
+
+        c = connection.execute(
+            sql.text(CHECK_SQL).bindparams(self._table_oids_param(table_oids))
+        )
+
+        checks = dict((table_oid, []) for table_oid in table_oids)
+        for table_oid, name, src in c:
+            checks[table_oid].append(
+                self._get_check_constraint_info(name, src)
             )
-            if not m:
-                util.warn("Could not parse CHECK constraint text: %r" % src)
-                sqltext = ""
-            else:
-                sqltext = re.compile(
-                    r"^[\s\n]*\((.+)\)[\s\n]*$", flags=re.DOTALL
-                ).sub(r"\1", m.group(1))
-            entry = {"name": name, "sqltext": sqltext}
-            if m and m.group(2):
-                entry["dialect_options"] = {"not_valid": True}
-
-            ret.append(entry)
-        return ret
+        return checks
+
+    def _get_check_constraint_info(self, name, src):
+        # samples:
+        # "CHECK (((a > 1) AND (a < 5)))"
+        # "CHECK (((a = 1) OR ((a > 2) AND (a < 5))))"
+        # "CHECK (((a > 1) AND (a < 5))) NOT VALID"
+        # "CHECK (some_boolean_function(a))"
+        # "CHECK (((a\n < 1)\n OR\n (a\n >= 5))\n)"
+
+        m = re.match(r"^CHECK *\((.+)\)( NOT VALID)?$", src, flags=re.DOTALL)
+        if not m:
+            util.warn("Could not parse CHECK constraint text: %r" % src)
+            sqltext = ""
+        else:
+            sqltext = re.compile(
+                r"^[\s\n]*\((.+)\)[\s\n]*$", flags=re.DOTALL
+            ).sub(r"\1", m.group(1))
+        entry = {"name": name, "sqltext": sqltext}
+        if m and m.group(2):
+            entry["dialect_options"] = {"not_valid": True}
+        return entry
 
     def _load_enums(self, connection, schema=None):
         schema = schema or self.default_schema_name
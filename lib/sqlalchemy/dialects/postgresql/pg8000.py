@@ -268,6 +268,7 @@ class PGDialect_pg8000(PGDialect):
 
     default_paramstyle = "format"
     supports_sane_multi_rowcount = True
+    use_insertmanyvalues = True
     execution_ctx_cls = PGExecutionContext_pg8000
     statement_compiler = PGCompiler_pg8000
     preparer = PGIdentifierPreparer_pg8000
@@ -402,6 +402,56 @@ resolution algorithm is applied to the constraint itself::
         PRIMARY KEY (id) ON CONFLICT FAIL
     )
 
+.. _sqlite_on_conflict_insert:
+
+INSERT...ON CONFLICT (Upsert)
+-----------------------------
+
+Starting with version 3.24.0, SQLite allows "upserts" (update or insert) of
+rows into a table via the ``ON CONFLICT`` clause of the ``INSERT`` statement.
+A candidate row will only be inserted if that row does not violate any unique
+constraints.  In the case of a unique constraint violation, a secondary action
+can occur which can be either "DO UPDATE", indicating that the data in the
+target row should be updated, or "DO NOTHING", which indicates to silently skip
+this row.  This is distinct from the ``ON CONFLICT`` clause that applies to
+constraints in DDL, described at :ref:`sqlite_on_conflict_ddl`.
+
+Conflicts are determined using existing unique constraints and indexes,
+which are *inferred* by stating the columns and conditions that comprise
+the indexes.
+
+SQLAlchemy provides ``ON CONFLICT`` support via the SQLite-specific
+:func:`_sqlite.insert()` function, which provides
+the generative methods :meth:`~.sqlite.Insert.on_conflict_do_update`
+and :meth:`~.sqlite.Insert.on_conflict_do_nothing`::
+
+    from sqlalchemy.dialects.sqlite import insert
+
+    insert_stmt = insert(my_table).values(
+        id='some_existing_id',
+        data='inserted value')
+
+    do_nothing_stmt = insert_stmt.on_conflict_do_nothing(
+        index_elements=['id']
+    )
+
+    conn.execute(do_nothing_stmt)
+
+    do_update_stmt = insert_stmt.on_conflict_do_update(
+        index_elements=['id'],
+        set_=dict(data=insert_stmt.excluded.data)
+    )
+
+    conn.execute(do_update_stmt)
+
+As with the PostgreSQL construct described at
+:ref:`postgresql_insert_on_conflict`, the ``excluded`` namespace refers to
+the row proposed for insertion, and the ``where`` argument of
+:meth:`~.sqlite.Insert.on_conflict_do_update` limits which conflicting rows
+are updated.
+
+.. versionadded:: 1.4
+
 .. _sqlite_type_reflection:
 
 Type Reflection
@@ -585,10 +635,13 @@ When using the per-:class:`_engine.Engine` execution option, note that
 
 """  # noqa
 
+import collections
 import datetime
+import hashlib
 import numbers
 import re
 
+from . import dml
 from .json import JSON
 from .json import JSONIndexType
 from .json import JSONPathType
@@ -600,8 +653,11 @@ from ... import types as sqltypes
 from ... import util
 from ...engine import default
 from ...engine import reflection
+from ...sql import coercions
 from ...sql import ColumnElement
 from ...sql import compiler
+from ...sql import elements
+from ...sql import roles
 from ...types import BLOB  # noqa
 from ...types import BOOLEAN  # noqa
 from ...types import CHAR  # noqa
@@ -1077,6 +1133,97 @@ class SQLiteCompiler(compiler.SQLCompiler):
             ", ".join("1" for type_ in element_types or [INTEGER()]),
         )
 
+    def _on_conflict_target(self, clause, **kw):
+        if clause.inferred_target_elements is not None:
+            target_text = "(%s)" % ", ".join(
+                (
+                    self.preparer.quote(c)
+                    if isinstance(c, util.string_types)
+                    else self.process(c, include_table=False, use_schema=False)
+                )
+                for c in clause.inferred_target_elements
+            )
+            if clause.inferred_target_whereclause is not None:
+                target_text += " WHERE %s" % self.process(
+                    clause.inferred_target_whereclause,
+                    include_table=False,
+                    use_schema=False,
+                )
+        else:
+            target_text = ""
+
+        return target_text
+
+    def visit_on_conflict_do_nothing(self, on_conflict, **kw):
+
+        target_text = self._on_conflict_target(on_conflict, **kw)
+
+        if target_text:
+            return "ON CONFLICT %s DO NOTHING" % target_text
+        else:
+            return "ON CONFLICT DO NOTHING"
+
+    def visit_on_conflict_do_update(self, on_conflict, **kw):
+        clause = on_conflict
+
+        target_text = self._on_conflict_target(on_conflict, **kw)
+
+        action_set_ops = []
+
+        set_parameters = dict(clause.update_values_to_set)
+        # create a list of column assignment clauses as tuples
+
+        insert_statement = self.stack[-1]["selectable"]
+        cols = insert_statement.table.c
+        for c in cols:
+            col_key = c.key
+            if col_key in set_parameters:
+                value = set_parameters.pop(col_key)
+                if coercions._is_literal(value):
+                    value = elements.BindParameter(None, value, type_=c.type)
+
+                else:
+                    if (
+                        isinstance(value, elements.BindParameter)
+                        and value.type._isnull
+                    ):
+                        value = value._clone()
+                        value.type = c.type
+                value_text = self.process(value.self_group(), use_schema=False)
+
+                key_text = self.preparer.quote(col_key)
+                action_set_ops.append("%s = %s" % (key_text, value_text))
+
+        # check for names that don't match columns
+        if set_parameters:
+            util.warn(
+                "Additional column names not matching "
+                "any column keys in table '%s': %s"
+                % (
+                    self.statement.table.name,
+                    (", ".join("'%s'" % c for c in set_parameters)),
+                )
+            )
+            for k, v in set_parameters.items():
+                key_text = (
+                    self.preparer.quote(k)
+                    if isinstance(k, util.string_types)
+                    else self.process(k, use_schema=False)
+                )
+                value_text = self.process(
+                    coercions.expect(roles.ExpressionElementRole, v),
+                    use_schema=False,
+                )
+                action_set_ops.append("%s = %s" % (key_text, value_text))
+
+        action_text = ", ".join(action_set_ops)
+        if clause.update_whereclause is not None:
+            action_text += " WHERE %s" % self.process(
+                clause.update_whereclause, include_table=True, use_schema=False
+            )
+
+        return "ON CONFLICT %s DO UPDATE SET %s" % (target_text, action_text)
+
 
 class SQLiteDDLCompiler(compiler.DDLCompiler):
     def get_column_specification(self, column, **kwargs):
@@ -1449,6 +1596,9 @@ class SQLiteDialect(default.DefaultDialect):
     supports_multivalues_insert = True
     tuple_in_values = True
 
+    # SQLITE_MAX_VARIABLE_NUMBER defaults to 999 before SQLite 3.32
+    in_list_max_parameters = 999
+
     default_paramstyle = "qmark"
     execution_ctx_cls = SQLiteExecutionContext
     statement_compiler = SQLiteCompiler
@@ -1600,6 +1750,26 @@ class SQLiteDialect(default.DefaultDialect):
         else:
             return None
 
+    def _bulk_upsert_construct(self, table, index_elements, set_columns):
+        # the "upsert" form of ON CONFLICT is new in SQLite 3.24
+        if self.dbapi is not None and self.dbapi.sqlite_version_info < (
+            3,
+            24,
+            0,
+        ):
+            return None
+
+        stmt = dml.insert(table)
+        if set_columns:
+            return stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_=dict(
+                    (col.key, stmt.excluded[col.key]) for col in set_columns
+                ),
+            )
+        else:
+            return stmt.on_conflict_do_nothing(index_elements=index_elements)
+
     @reflection.cache
     def get_schema_names(self, connection, **kw):
         s = "PRAGMA database_list"
@@ -1702,6 +1872,13 @@ class SQLiteDialect(default.DefaultDialect):
         info = self._get_table_pragma(
             connection, pragma, table_name, schema=schema
         )
+        return self._get_columns_from_pragma(
+            info,
+            pragma == "table_xinfo",
+            lambda: self._get_table_sql(connection, table_name, schema, **kw),
+        )
+
+    def _get_columns_from_pragma(self, info, xinfo, get_tablesql):
         columns = []
         tablesql = None
         for row in info:
@@ -1710,7 +1887,7 @@ class SQLiteDialect(default.DefaultDialect):
             nullable = not row[3]
             default = row[4]
             primary_key = row[5]
-            hidden = row[6] if pragma == "table_xinfo" else 0
+            hidden = row[6] if xinfo else 0
 
             # hidden has value 0 for normal columns, 1 for hidden columns,
             # 2 for computed virtual columns and 3 for computed stored columns
@@ -1722,9 +1899,7 @@ class SQLiteDialect(default.DefaultDialect):
             persisted = hidden == 3
 
             if tablesql is None and generated:
-                tablesql = self._get_table_sql(
-                    connection, table_name, schema, **kw
-                )
+                tablesql = get_tablesql()
 
             columns.append(
                 self._get_column_info(
@@ -1839,12 +2014,7 @@ class SQLiteDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_pk_constraint(self, connection, table_name, schema=None, **kw):
-        constraint_name = None
         table_data = self._get_table_sql(connection, table_name, schema=schema)
-        if table_data:
-            PK_PATTERN = r"CONSTRAINT (\w+) PRIMARY KEY"
-            result = re.search(PK_PATTERN, table_data, re.I)
-            constraint_name = result.group(1) if result else None
 
         cols = self.get_columns(connection, table_name, schema, **kw)
         pkeys = []
@@ -1852,6 +2022,15 @@ class SQLiteDialect(default.DefaultDialect):
             if col["primary_key"]:
                 pkeys.append(col["name"])
 
+        return self._get_pk_constraint_from_sql(table_data, pkeys)
+
+    def _get_pk_constraint_from_sql(self, table_data, pkeys):
+        constraint_name = None
+        if table_data:
+            PK_PATTERN = r"CONSTRAINT (\w+) PRIMARY KEY"
+            result = re.search(PK_PATTERN, table_data, re.I)
+            constraint_name = result.group(1) if result else None
+
         return {"constrained_columns": pkeys, "name": constraint_name}
 
     @reflection.cache
@@ -1861,7 +2040,15 @@ class SQLiteDialect(default.DefaultDialect):
         pragma_fks = self._get_table_pragma(
             connection, "foreign_key_list", table_name, schema=schema
         )
+        table_data = self._get_table_sql(connection, table_name, schema=schema)
+
+        return self._get_foreign_keys_from_pragma(
+            connection, table_name, schema, pragma_fks, table_data, **kw
+        )
 
+    def _get_foreign_keys_from_pragma(
+        self, connection, table_name, schema, pragma_fks, table_data, **kw
+    ):
         fks = {}
 
         for row in pragma_fks:
@@ -1928,7 +2115,6 @@ class SQLiteDialect(default.DefaultDialect):
             for fk in fks.values()
         )
 
-        table_data = self._get_table_sql(connection, table_name, schema=schema)
         if table_data is None:
             # system tables, etc.
             return []
@@ -2015,22 +2201,26 @@ class SQLiteDialect(default.DefaultDialect):
         self, connection, table_name, schema=None, **kw
     ):
 
-        auto_index_by_sig = {}
-        for idx in self.get_indexes(
+        indexes = self.get_indexes(
             connection,
             table_name,
             schema=schema,
             include_auto_indexes=True,
             **kw
-        ):
+        )
+        table_data = self._get_table_sql(
+            connection, table_name, schema=schema, **kw
+        )
+        return self._get_unique_constraints_from_sql(table_data, indexes)
+
+    def _get_unique_constraints_from_sql(self, table_data, indexes):
+        auto_index_by_sig = {}
+        for idx in indexes:
             if not idx["name"].startswith("sqlite_autoindex"):
                 continue
             sig = tuple(idx["column_names"])
             auto_index_by_sig[sig] = idx
 
-        table_data = self._get_table_sql(
-            connection, table_name, schema=schema, **kw
-        )
         if not table_data:
             return []
 
@@ -2070,6 +2260,9 @@ class SQLiteDialect(default.DefaultDialect):
         table_data = self._get_table_sql(
             connection, table_name, schema=schema, **kw
         )
+        return self._get_check_constraints_from_sql(table_data)
+
+    def _get_check_constraints_from_sql(self, table_data):
         if not table_data:
             return []
 
@@ -2122,6 +2315,326 @@ class SQLiteDialect(default.DefaultDialect):
                     idx["column_names"].append(row[2])
         return indexes
 
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (3, 16):
+            return super(SQLiteDialect, self).get_multi_columns(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        # computed columns are threaded as hidden, they require table_xinfo
+        xinfo = self.server_version_info >= (3, 31)
+        tables = self._get_multi_pragma(
+            connection,
+            'p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk%s'
+            % (", p.hidden" if xinfo else ""),
+            " JOIN pragma_%s(m.name, %%(schema)s) AS p"
+            % ("table_xinfo" if xinfo else "table_info"),
+            "p.cid",
+            schema,
+            filter_names,
+        )
+        result = {}
+        for table_name, (table_data, info) in tables.items():
+            result[(schema, table_name)] = self._get_columns_from_pragma(
+                info, xinfo, lambda: table_data
+            )
+        return self._get_multi_unlisted(
+            self.get_columns, connection, schema, filter_names, result, **kw
+        )
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (3, 16):
+            return super(SQLiteDialect, self).get_multi_pk_constraint(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        tables = self._get_multi_pragma(
+            connection,
+            "p.name, p.pk",
+            " JOIN pragma_table_info(m.name, %(schema)s) AS p",
+            "p.cid",
+            schema,
+            filter_names,
+        )
+        result = dict(
+            (
+                (schema, table_name),
+                self._get_pk_constraint_from_sql(
+                    table_data, [name for name, pk in info if pk]
+                ),
+            )
+            for table_name, (table_data, info) in tables.items()
+        )
+        return self._get_multi_unlisted(
+            self.get_pk_constraint,
+            connection,
+            schema,
+            filter_names,
+            result,
+            **kw
+        )
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (3, 16):
+            return super(SQLiteDialect, self).get_multi_foreign_keys(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        kw.pop("unreflectable", None)
+        tables = self._get_multi_pragma(
+            connection,
+            'p.id, p.seq, p."table", p."from", p."to"',
+            " LEFT JOIN pragma_foreign_key_list(m.name, %(schema)s) AS p",
+            "p.id, p.seq",
+            schema,
+            filter_names,
+        )
+        result = dict(
+            (
+                (schema, table_name),
+                self._get_foreign_keys_from_pragma(
+                    connection,
+                    table_name,
+                    schema,
+                    [row for row in pragma_fks if row[0] is not None],
+                    table_data,
+                    **kw
+                ),
+            )
+            for table_name, (table_data, pragma_fks) in tables.items()
+        )
+        return self._get_multi_unlisted(
+            self.get_foreign_keys,
+            connection,
+            schema,
+            filter_names,
+            result,
+            **kw
+        )
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (3, 16):
+            return super(SQLiteDialect, self).get_multi_indexes(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        result = dict(
+            ((schema, table_name), indexes)
+            for table_name, (table_data, indexes) in self._get_multi_indexes(
+                connection,
+                schema,
+                filter_names,
+                kw.get("include_auto_indexes", False),
+            ).items()
+        )
+        return self._get_multi_unlisted(
+            self.get_indexes, connection, schema, filter_names, result, **kw
+        )
+
+    def _get_multi_indexes(
+        self, connection, schema, filter_names, include_auto_indexes
+    ):
+        tables = self._get_multi_pragma(
+            connection,
+            'il.name, il."unique", ii.name',
+            " LEFT JOIN pragma_index_list(m.name, %(schema)s) AS il"
+            " LEFT JOIN pragma_index_info(il.name, %(schema)s) AS ii",
+            "il.seq, ii.seqno",
+            schema,
+            filter_names,
+        )
+        result = {}
+        for table_name, (table_data, rows) in tables.items():
+            indexes = util.OrderedDict()
+            skipped = set()
+            for idx_name, unique, col_name in rows:
+                # ignore implicit primary key index.
+                # http://www.mail-archive.com/sqlite-users@sqlite.org/msg30517.html
+                if (
+                    idx_name is None
+                    or idx_name in skipped
+                    or (
+                        not include_auto_indexes
+                        and idx_name.startswith("sqlite_autoindex")
+                    )
+                ):
+                    continue
+                if col_name is None:
+                    util.warn(
+                        "Skipped unsupported reflection of "
+                        "expression-based index %s" % idx_name
+                    )
+                    indexes.pop(idx_name, None)
+                    skipped.add(idx_name)
+                    continue
+                if idx_name not in indexes:
+                    indexes[idx_name] = dict(
+                        name=idx_name, column_names=[], unique=unique
+                    )
+                indexes[idx_name]["column_names"].append(col_name)
+            result[table_name] = (table_data, list(indexes.values()))
+        return result
+
+    def get_multi_unique_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (3, 16):
+            return super(SQLiteDialect, self).get_multi_unique_constraints(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        result = dict(
+            (
+                (schema, table_name),
+                self._get_unique_constraints_from_sql(table_data, indexes),
+            )
+            for table_name, (table_data, indexes) in self._get_multi_indexes(
+                connection, schema, filter_names, True
+            ).items()
+        )
+        return self._get_multi_unlisted(
+            self.get_unique_constraints,
+            connection,
+            schema,
+            filter_names,
+            result,
+            **kw
+        )
+
+    def get_multi_check_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        if self.server_version_info < (3, 16):
+            return super(SQLiteDialect, self).get_multi_check_constraints(
+                connection, schema=schema, filter_names=filter_names, **kw
+            )
+
+        tables = self._get_multi_pragma(
+            connection, None, "", None, schema, filter_names
+        )
+        result = dict(
+            (
+                (schema, table_name),
+                self._get_check_constraints_from_sql(table_data),
+            )
+            for table_name, (table_data, rows) in tables.items()
+        )
+        return self._get_multi_unlisted(
+            self.get_check_constraints,
+            connection,
+            schema,
+            filter_names,
+            result,
+            **kw
+        )
+
+    def _get_multi_unlisted(
+        self, single_tbl_method, connection, schema, filter_names, result, **kw
+    ):
+        # sqlite_master and sqlite_temp_master are not themselves listed
+        # in sqlite_master; reflect these using the single-table method
+        if filter_names is not None:
+            unlisted = [
+                name
+                for name in filter_names
+                if (schema, name) not in result
+                and util.text_type(name).lower().startswith("sqlite_")
+            ]
+            if unlisted:
+                result.update(
+                    self._default_multi_reflect(
+                        single_tbl_method,
+                        connection,
+                        schema=schema,
+                        filter_names=unlisted,
+                        **kw
+                    )
+                )
+        return result
+
+    def _get_multi_pragma(
+        self, connection, columns, joins, order_by, schema, filter_names
+    ):
+        """Query sqlite_master joined to the given table-valued PRAGMA
+        functions for all tables in scope.
+
+        Returns a dictionary of table name to a tuple of the table's
+        CREATE statement and its list of PRAGMA rows.  Each table in scope
+        is present, with an empty list if its PRAGMA returned no rows.
+
+        """
+        quote = self.identifier_preparer.quote_identifier
+        if schema is not None:
+            scopes = [schema]
+        else:
+            # as in _get_table_pragma(), 'temp' tables share the
+            # namespace of the 'main' schema
+            scopes = ["main", "temp"]
+
+        if filter_names is None:
+            batches = [None]
+        else:
+            # table names are matched case insensitively, as is the case
+            # for the PRAGMA statements; results are keyed on the name
+            # that was requested.  quoted_name.lower() is a no-op for
+            # quoted names, so fold case on the plain string
+            requested = collections.defaultdict(list)
+            for name in filter_names:
+                requested[util.text_type(name).lower()].append(name)
+
+            # stay well within SQLITE_MAX_VARIABLE_NUMBER
+            filter_names = list(requested)
+            batches = [
+                filter_names[idx : idx + 500]
+                for idx in range(0, len(filter_names), 500)
+            ]
+
+        result = util.OrderedDict()
+        for scope in scopes:
+            in_prior_scope = set(result)
+            stmt = "SELECT m.name, m.sql%s FROM %s.sqlite_master AS m%s" % (
+                ", " + columns if columns else "",
+                quote(scope),
+                joins % {"schema": "'%s'" % scope.replace("'", "''")},
+            )
+            for batch in batches:
+                if batch is None:
+                    where = " WHERE m.type = 'table'"
+                    params = ()
+                else:
+                    where = (
+                        " WHERE m.type IN ('table', 'view') "
+                        "AND m.name COLLATE NOCASE IN (%s)"
+                        % ", ".join("?" for _ in batch)
+                    )
+                    params = tuple(batch)
+                order = " ORDER BY m.name%s" % (
+                    ", " + order_by if order_by else ""
+                )
+                for row in connection.exec_driver_sql(
+                    stmt + where + order, params
+                ):
+                    if batch is None:
+                        names = [row[0]]
+                    else:
+                        names = requested[row[0].lower()]
+                    for name in names:
+                        if name in in_prior_scope:
+                            continue
+                        if name not in result:
+                            result[name] = (row[1], [])
+                        if columns:
+                            result[name][1].append(tuple(row[2:]))
+        return result
+
     @reflection.cache
     def _get_table_sql(self, connection, table_name, schema=None, **kw):
         if schema:
@@ -2148,6 +2661,39 @@ class SQLiteDialect(default.DefaultDialect):
             rs = connection.exec_driver_sql(s, (table_name,))
         return rs.scalar()
 
+    @reflection.cache
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        # a digest of the DDL of all the objects in the schema; this is
+        # a single small query against sqlite_master and is exact, unlike
+        # PRAGMA schema_version which restarts from the same values when
+        # a database file is recreated
+        if schema:
+            schema_expr = "%s." % (
+                self.identifier_preparer.quote_identifier(schema)
+            )
+        else:
+            schema_expr = ""
+        try:
+            s = (
+                "SELECT type, name, tbl_name, sql FROM "
+                " (SELECT * FROM %(schema)ssqlite_master UNION ALL "
+                "  SELECT * FROM %(schema)ssqlite_temp_master) "
+                "ORDER BY type, name" % {"schema": schema_expr}
+            )
+            rs = connection.exec_driver_sql(s)
+        except exc.DBAPIError:
+            s = (
+                "SELECT type, name, tbl_name, sql FROM "
+                "%(schema)ssqlite_master "
+                "ORDER BY type, name" % {"schema": schema_expr}
+            )
+            rs = connection.exec_driver_sql(s)
+
+        digest = hashlib.sha1()
+        for row in rs:
+            digest.update(util.text_type(tuple(row)).encode("utf-8"))
+        return digest.hexdigest()
+
     def _get_table_pragma(self, connection, pragma, table_name, schema=None):
         quote = self.identifier_preparer.quote_identifier
         if schema is not None:
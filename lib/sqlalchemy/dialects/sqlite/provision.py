@@ -16,7 +16,7 @@ def _sqlite_follower_url_from_main(url, ident):
     if not url.database or url.database == ":memory:":
         return url
     else:
-        return sa_url.make_url("sqlite:///%s.db" % ident)
+        return sa_url.make_url("%s:///%s.db" % (url.drivername, ident))
 
 
 @post_configure_engine.for_db("sqlite")
@@ -33,11 +33,11 @@ def _sqlite_post_configure_engine(url, engine, follower_ident):
             # ways corresponds to the "test.test_schema" schema that's
             # expected to be already present, so for now it just stays
             # in a given checkout directory.
-            dbapi_connection.execute(
+            dbapi_connection.cursor().execute(
                 'ATTACH DATABASE "test_schema.db" AS test_schema'
             )
         else:
-            dbapi_connection.execute(
+            dbapi_connection.cursor().execute(
                 'ATTACH DATABASE "%s_test_schema.db" AS test_schema'
                 % follower_ident
             )
@@ -17,6 +17,9 @@ constructor ``create_engine()``.
 
 from . import events  # noqa
 from . import util  # noqa
+from .base import CompiledCacheEntry  # noqa
+from .base import CompiledCacheStats  # noqa
+from .base import SharedCompiledCache  # noqa
 from .base import Connection  # noqa
 from .base import Engine  # noqa
 from .base import NestedTransaction  # noqa
@@ -6,6 +6,7 @@
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 from __future__ import with_statement
 
+import collections
 import contextlib
 import sys
 
@@ -310,6 +311,18 @@ class Connection(Connectable):
           of many DBAPIs.  The flag is currently understood only by the
           psycopg2, mysqldb and pymysql dialects.
 
+        :param expanding_parameter_padding: Available on: Connection,
+          Engine, statement.
+          When ``True``, the lists of values given to "expanding" parameters,
+          such as those used by :meth:`_sql.ColumnOperators.in_`, are padded
+          up to the next power of two in length by repeating the last value.
+          This bounds the number of distinct SQL strings generated for IN
+          lists of varying length, so that the expanded statements cached
+          on each compiled construct, as well as server-side statement and
+          plan caches, are reused more often.
+
+          .. versionadded:: 1.4
+
         :param schema_translate_map: Available on: Connection, Engine.
           A dictionary mapping schema names to schema names, that will be
           applied to the :paramref:`_schema.Table.schema` element of each
@@ -1273,8 +1286,9 @@ class Connection(Connectable):
             "schema_translate_map", None
         )
 
+        engine = self.engine
         compiled_cache = execution_options.get(
-            "compiled_cache", self.engine._compiled_cache
+            "compiled_cache", engine._compiled_cache
         )
 
         compiled_sql, extracted_params, cache_hit = elem._compile_w_cache(
@@ -1285,6 +1299,20 @@ class Connection(Connectable):
             schema_translate_map=schema_translate_map,
             linting=self.dialect.compiler_linting | compiler.WARN_LINTING,
         )
+
+        if cache_hit is dialect.CACHE_HIT:
+            if compiled_cache is engine._compiled_cache:
+                engine.compiled_cache_stats.hits += 1
+        elif cache_hit is dialect.CACHE_MISS:
+            compile_time = compiled_sql._compile_time
+            if compiled_cache is engine._compiled_cache:
+                engine.compiled_cache_stats._record_miss(
+                    compiled_sql, compile_time
+                )
+            if has_events:
+                self.dispatch.compiled_cache_miss(
+                    self, elem, compiled_sql, compile_time
+                )
         ret = self._execute_context(
             dialect,
             dialect.execution_ctx_cls._init_compiled,
@@ -2425,6 +2453,243 @@ class TwoPhaseTransaction(RootTransaction):
         self.connection._commit_twophase_impl(self.xid, self._is_prepared)
 
 
+CompiledCacheEntry = collections.namedtuple(
+    "CompiledCacheEntry", ["statement", "compile_count", "compile_time"]
+)
+
+
+class CompiledCacheStats(object):
+    """Statistics for the SQL compilation cache of an
+    :class:`_engine.Engine`.
+
+    An instance of this object is available from the
+    :attr:`_engine.Engine.compiled_cache_stats` attribute when the
+    :paramref:`_sa.create_engine.query_cache_size` parameter is non-zero.
+    Only statements which use the cache of the :class:`_engine.Engine`
+    itself are counted; caches passed using the
+    :paramref:`.Connection.execution_options.compiled_cache` option, such
+    as those used by the ORM unit of work, are not.  When the
+    :class:`_engine.Engine` uses a :class:`.SharedCompiledCache`, the
+    statistics are those of the shared cache, and count the statements of
+    all of the engines which use it.
+
+    The counts are maintained without locking, and may be approximate when
+    the :class:`_engine.Engine` is used by many threads at once.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :ref:`sql_caching_stats`
+
+    """
+
+    hits = 0
+    """Number of statements that were found in the cache."""
+
+    misses = 0
+    """Number of statements that were not found in the cache, and were
+    compiled."""
+
+    evictions = 0
+    """Number of statements that were pruned from the cache."""
+
+    compile_time = 0.0
+    """Total time spent compiling statements that were not found in the
+    cache, in seconds."""
+
+    def __init__(self, cache):
+        self._cache = cache
+        self.reset()
+
+    def reset(self):
+        """Reset all counters to zero.
+
+        The contents of the cache itself are not affected; use
+        :meth:`_engine.Engine.clear_compiled_cache` for that.
+
+        """
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compile_time = 0.0
+
+        # a bounded record of how many times each statement was compiled.
+        # a statement that's compiled repeatedly was pruned from the cache
+        # between uses, so this is sized to see beyond a single cache's
+        # worth of statements
+        self._compile_counts = util.LRUCache(max(self._cache.capacity, 1) * 3)
+
+    @property
+    def size(self):
+        """The number of statements currently in the cache."""
+        return len(self._cache)
+
+    @property
+    def capacity(self):
+        """The size to which the cache is pruned, which is the value of
+        :paramref:`_sa.create_engine.query_cache_size`."""
+        return self._cache.capacity
+
+    @property
+    def hit_ratio(self):
+        """The fraction of statements that were found in the cache, or
+        ``None`` if no statements have been executed."""
+        total = self.hits + self.misses
+        if not total:
+            return None
+        return self.hits / float(total)
+
+    def most_compiled(self, limit=10):
+        """Return the statements that were compiled most often.
+
+        Returns a list of up to ``limit`` :class:`.CompiledCacheEntry`
+        named tuples ``(statement, compile_count, compile_time)``, where
+        ``statement`` is the SQL string, ordered by ``compile_count``
+        descending.  Statements which render the same SQL string are
+        counted together.  A statement that is compiled more than once was
+        pruned from the cache between uses, which suggests that
+        :paramref:`_sa.create_engine.query_cache_size` should be increased.
+
+        """
+        entries = sorted(
+            self._compile_counts.values(),
+            key=lambda entry: entry.compile_count,
+            reverse=True,
+        )
+        return entries[0:limit]
+
+    def _record_miss(self, compiled, compile_time):
+        self.misses += 1
+        self.compile_time += compile_time
+
+        # keyed on the SQL string rather than the cache key, as the latter
+        # refers to the statement's Table, mapper and other objects, which
+        # shouldn't be kept alive once they're gone from the cache
+        key = compiled.string
+        entry = self._compile_counts.get(key)
+        if entry is None:
+            entry = CompiledCacheEntry(key, 1, compile_time)
+        else:
+            entry = CompiledCacheEntry(
+                key, entry.compile_count + 1, entry.compile_time + compile_time
+            )
+        self._compile_counts[key] = entry
+
+    def _record_pruning(self, cache):
+        self.evictions += len(cache) - cache.capacity
+
+    def __repr__(self):
+        return "<%s hits=%d misses=%d evictions=%d size=%d capacity=%d>" % (
+            self.__class__.__name__,
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.size,
+            self.capacity,
+        )
+
+
+class SharedCompiledCache(util.LRUCache):
+    """A SQL compilation cache which may be shared among any number of
+    :class:`_engine.Engine` objects.
+
+    By default, each :class:`_engine.Engine` maintains its own cache of
+    compiled SQL statements, so that an application which makes use of
+    many engines against the same kind of database, such as one engine per
+    tenant database, compiles each statement once for every engine.  A
+    :class:`.SharedCompiledCache` is passed to each of these engines using
+    the :paramref:`_sa.create_engine.query_cache` parameter instead::
+
+        from sqlalchemy.engine import SharedCompiledCache
+
+        cache = SharedCompiledCache(1200)
+
+        engines = {
+            tenant: create_engine(url, query_cache=cache)
+            for tenant, url in tenant_urls.items()
+        }
+
+    Compiled statements are then shared among those engines whose dialects
+    have the same fingerprint, which consists of the dialect class, the
+    arguments passed to it by :func:`_sa.create_engine`, and the settings
+    established when it first connected to the database, including the
+    server version.  Engines which differ in any of these continue to use
+    distinct entries in the cache.  Statements executed by an engine before
+    its first connection has been established are not shared.
+
+    :param size: the number of statements which the cache will store; the
+     cache is pruned in the same way as that configured by
+     :paramref:`_sa.create_engine.query_cache_size`.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :ref:`sql_caching_shared`
+
+    """
+
+    __slots__ = ("stats", "_identities")
+
+    def __init__(self, size=500):
+        super(SharedCompiledCache, self).__init__(
+            size, size_alert=self._size_alert
+        )
+
+        self.stats = CompiledCacheStats(self)
+        """The :class:`.CompiledCacheStats` for this cache, which is also
+        available as the :attr:`_engine.Engine.compiled_cache_stats`
+        attribute of each :class:`_engine.Engine` using it."""
+
+        self._identities = {}
+
+    def _size_alert(self, cache):
+        self.stats._record_pruning(cache)
+
+    def _identity_for(self, dialect, dialect_args):
+        """Return the object which a newly initialized dialect will use in
+        place of itself within cache keys.
+
+        Dialects having the same fingerprint receive the same object, or
+        ``None`` is returned if the fingerprint can't be determined.
+
+        """
+        try:
+            fingerprint = (
+                dialect.__class__,
+                tuple(sorted(dialect_args.items())),
+                tuple(
+                    sorted(
+                        (key, value)
+                        for key, value in vars(dialect).items()
+                        if key not in self._unshared_dialect_attributes
+                        and self._is_setting(value)
+                    )
+                ),
+            )
+            identity = self._identities.get(fingerprint)
+        except TypeError:
+            # an unhashable or unorderable dialect argument
+            return None
+
+        if identity is None:
+            identity = self._identities.setdefault(fingerprint, object())
+        return identity
+
+    # per-connection state which doesn't affect compilation
+    _unshared_dialect_attributes = frozenset(["default_schema_name"])
+
+    @classmethod
+    def _is_setting(cls, value):
+        if isinstance(value, tuple):
+            return all(cls._is_setting(elem) for elem in value)
+        else:
+            return value is None or isinstance(
+                value, util.string_types + util.int_types + (float,)
+            )
+
+
 class Engine(Connectable, log.Identified):
     """
     Connects a :class:`~sqlalchemy.pool.Pool` and
@@ -2450,6 +2715,21 @@ class Engine(Connectable, log.Identified):
 
     _schema_translate_map = None
 
+    reflection_cache = None
+
+    compiled_cache_stats = None
+    """A :class:`.CompiledCacheStats` object which reports on the use of the
+    SQL compilation cache of this :class:`_engine.Engine`, or ``None`` if
+    caching is disabled.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :ref:`sql_caching_stats`
+
+    """
+
     def __init__(
         self,
         pool,
@@ -2460,6 +2740,8 @@ class Engine(Connectable, log.Identified):
         query_cache_size=500,
         execution_options=None,
         hide_parameters=False,
+        reflection_cache=None,
+        query_cache=None,
     ):
         self.pool = pool
         self.url = url
@@ -2468,10 +2750,17 @@ class Engine(Connectable, log.Identified):
             self.logging_name = logging_name
         self.echo = echo
         self.hide_parameters = hide_parameters
-        if query_cache_size != 0:
+        self.reflection_cache = reflection_cache
+        if query_cache is not None:
+            self._compiled_cache = query_cache
+            self.compiled_cache_stats = query_cache.stats
+        elif query_cache_size != 0:
             self._compiled_cache = util.LRUCache(
                 query_cache_size, size_alert=self._lru_size_alert
             )
+            self.compiled_cache_stats = CompiledCacheStats(
+                self._compiled_cache
+            )
         else:
             self._compiled_cache = None
         log.instance_logger(self, echoflag=echo)
@@ -2479,6 +2768,7 @@ class Engine(Connectable, log.Identified):
             self.update_execution_options(**execution_options)
 
     def _lru_size_alert(self, cache):
+        self.compiled_cache_stats._record_pruning(cache)
         if self._should_log_info:
             self.logger.info(
                 "Compiled cache size pruning from %d items to %d.  "
@@ -2498,6 +2788,9 @@ class Engine(Connectable, log.Identified):
         via the :paramref:`_engine.create_engine.query_cache_size` parameter.
         It will not impact any dictionary caches that were passed via the
         :paramref:`.Connection.execution_options.query_cache` parameter.
+        A :class:`.SharedCompiledCache` passed via the
+        :paramref:`_engine.create_engine.query_cache` parameter is cleared
+        for all of the engines which use it.
 
         .. versionadded:: 1.4
 
@@ -2994,7 +3287,9 @@ class OptionEngineMixin(object):
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
         self._compiled_cache = proxied._compiled_cache
+        self.compiled_cache_stats = proxied.compiled_cache_stats
         self.hide_parameters = proxied.hide_parameters
+        self.reflection_cache = proxied.reflection_cache
         log.instance_logger(self, echoflag=self.echo)
 
         # note: this will propagate events that are assigned to the parent
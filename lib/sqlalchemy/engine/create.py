@@ -251,6 +251,17 @@ def create_engine(url, **kwargs):
         Microsoft SQL Server.   Set this to ``False`` to disable
         the automatic usage of RETURNING.
 
+    :param insertmanyvalues_page_size: number of rows rendered into each
+        multiple-row INSERT..RETURNING statement, when an INSERT which
+        returns newly generated values is executed with many parameter sets,
+        such as when the ORM flushes many new objects.  Applies to dialects
+        that run such INSERTs as a series of multiple-row statements, which
+        currently includes the pg8000 and asyncpg dialects; the psycopg2
+        dialect makes use of its own ``executemany_values_page_size``
+        parameter.  Defaults to 1000.
+
+        .. versionadded:: 1.4
+
     :param isolation_level: this string parameter is interpreted by various
         dialects in order to affect the transaction isolation level of the
         database connection.   The parameter essentially accepts some subset of
@@ -398,6 +409,30 @@ def create_engine(url, **kwargs):
         of 0 indicates no limit; to disable pooling, set ``poolclass`` to
         :class:`~sqlalchemy.pool.NullPool` instead.
 
+    :param pool_maintenance_interval=None: if set, the number of seconds
+        between runs of a background task that recycles, reconnects and
+        pings connections that are idle in a
+        :class:`~sqlalchemy.pool.QueuePool`, so that this work takes place
+        ahead of their next checkout.
+        See :paramref:`.QueuePool.maintenance_interval`.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :ref:`pool_maintenance`
+
+    :param pool_min_idle=0: minimum number of idle connections that
+        :class:`~sqlalchemy.pool.QueuePool` keeps open, opening new
+        connections in the background as connections are checked out.
+        See :paramref:`.QueuePool.min_idle`.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :ref:`pool_prewarm`
+
     :param pool_recycle=-1: this setting causes the pool to recycle
         connections after the given number of seconds has passed. It
         defaults to -1, or no timeout. For example, setting to 3600
@@ -472,6 +507,28 @@ def create_engine(url, **kwargs):
 
      .. versionadded:: 1.4
 
+    :param query_cache: a :class:`.SharedCompiledCache` which is used to
+     cache the SQL string form of queries in place of the cache that's
+     normally created for each :class:`_engine.Engine`, allowing compiled
+     statements to be shared among all engines which use it and have the
+     same dialect, configuration and server version.  When passed,
+     :paramref:`_sa.create_engine.query_cache_size` is ignored.
+
+     .. seealso::
+
+        :ref:`sql_caching_shared`
+
+     .. versionadded:: 1.4
+
+    :param reflection_cache: a :class:`.ReflectionCache` instance, such as
+     :class:`.FileReflectionCache`, which will be used to store the results
+     of table reflection so that they can be shared among processes.
+     Entries are keyed on the database URL, the schema and a fingerprint of
+     the schema's current definition, which is supported by the SQLite and
+     PostgreSQL dialects.
+
+     .. versionadded:: 1.4
+
     """  # noqa
 
     if "strategy" in kwargs:
@@ -564,6 +621,8 @@ def create_engine(url, **kwargs):
             "reset_on_return": "pool_reset_on_return",
             "pre_ping": "pool_pre_ping",
             "use_lifo": "pool_use_lifo",
+            "min_idle": "pool_min_idle",
+            "maintenance_interval": "pool_maintenance_interval",
         }
         for k in util.get_cls_kwargs(poolclass):
             tk = translate.get(k, k)
@@ -637,6 +696,12 @@ def create_engine(url, **kwargs):
             dialect.initialize(c)
             dialect.do_rollback(c.connection)
 
+            query_cache = engine._compiled_cache
+            if isinstance(query_cache, base.SharedCompiledCache):
+                dialect._compiled_cache_identity = query_cache._identity_for(
+                    dialect, dialect_args
+                )
+
         if do_on_connect:
             event.listen(
                 pool, "connect", first_connect, _once_unless_exception=True
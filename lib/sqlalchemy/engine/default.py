@@ -14,6 +14,7 @@ as the base class for their own corresponding classes.
 """
 
 import codecs
+import operator
 import random
 import re
 import weakref
@@ -75,6 +76,62 @@ class DefaultDialect(interfaces.Dialect):
     full_returning = False
     insert_executemany_returning = False
 
+    use_insertmanyvalues = False
+    """if True, an INSERT..RETURNING statement executed with a list of
+    parameter sets is run as a series of INSERT statements each having a
+    multiple-row VALUES clause, collecting the rows returned by each.
+
+    As the rows of a multiple-row INSERT..RETURNING aren't guaranteed to
+    be returned in the order of the VALUES clause, the rows of each statement
+    are sorted on the table's server generated autoincrement column, which
+    must be present in RETURNING; otherwise, each parameter set is INSERTed
+    individually.  Requires the "qmark" or "format" paramstyle; when set, the
+    ``insert_executemany_returning`` flag is enabled, which allows the ORM
+    to INSERT many rows at once while receiving their newly generated
+    primary key values.
+
+    .. versionadded:: 1.4
+
+    """
+
+    insertmanyvalues_page_size = 1000
+    """default number of parameter sets rendered into each INSERT statement
+    when ``use_insertmanyvalues`` is in effect; may be set using the
+    ``insertmanyvalues_page_size`` dialect argument."""
+
+    insertmanyvalues_max_parameters = 32700
+    """the greatest number of bound parameters rendered into each INSERT
+    statement when ``use_insertmanyvalues`` is in effect, which will reduce
+    the number of parameter sets per statement for wide tables."""
+
+    in_list_chunksize = 500
+    """default number of values sent in the IN clause of each statement when
+    a large collection of values is split among several SELECT statements,
+    as is done by the ORM's "selectin" loader.
+
+    .. versionadded:: 1.4
+
+    """
+
+    in_list_max_parameters = None
+    """if not None, the greatest number of bound parameters sent in the IN
+    clause of each such statement; for a "tuple" IN against a composite key,
+    the number of values per statement is reduced accordingly.
+
+    .. versionadded:: 1.4
+
+    """
+
+    in_list_use_any = False
+    """if True, a collection of single-column values is sent as one array
+    parameter compared using ``= ANY()`` rather than in an IN clause, so that
+    the SQL string is the same regardless of the number of values.  The
+    parameter is CAST to an ARRAY of the values' type.
+
+    .. versionadded:: 1.4
+
+    """
+
     cte_follows_insert = False
 
     supports_native_enum = False
@@ -208,6 +265,10 @@ class DefaultDialect(interfaces.Dialect):
     CACHING_DISABLED = CACHING_DISABLED
     NO_CACHE_KEY = NO_CACHE_KEY
 
+    # set when the dialect is used with a SharedCompiledCache, and used
+    # in place of the dialect itself within compiled cache keys
+    _compiled_cache_identity = None
+
     @util.deprecated_params(
         convert_unicode=(
             "1.3",
@@ -247,6 +308,7 @@ class DefaultDialect(interfaces.Dialect):
         # int() is because the @deprecated_params decorator cannot accommodate
         # the direct reference to the "NO_LINTING" object
         compiler_linting=int(compiler.NO_LINTING),
+        insertmanyvalues_page_size=None,
         **kwargs
     ):
 
@@ -283,6 +345,17 @@ class DefaultDialect(interfaces.Dialect):
             )
         self.label_length = label_length
         self.compiler_linting = compiler_linting
+        if self.use_insertmanyvalues:
+            if (
+                self.implicit_returning
+                and self.paramstyle in ("qmark", "format")
+                and self.supports_unicode_statements
+            ):
+                self.insert_executemany_returning = True
+            else:
+                self.use_insertmanyvalues = False
+        if insertmanyvalues_page_size is not None:
+            self.insertmanyvalues_page_size = insertmanyvalues_page_size
         if self.description_encoding == "use_encoding":
             self._description_decoder = (
                 processors.to_unicode_processor_factory
@@ -395,6 +468,18 @@ class DefaultDialect(interfaces.Dialect):
         """
         return None
 
+    def _bulk_upsert_construct(self, table, index_elements, set_columns):
+        """Return an INSERT construct against the given table which,
+        for each row that conflicts with an existing row on the given
+        index elements, updates the given columns from the proposed row,
+        or does nothing if ``set_columns`` is empty.
+
+        Returns None if this dialect has no such construct; used by
+        :meth:`.Session.bulk_upsert_mappings`.
+
+        """
+        return None
+
     def _check_unicode_returns(self, connection, additional_tests=None):
         # this now runs in py2k only and will be removed in 2.0; disabled for
         # Python 3 in all cases under #5315
@@ -495,6 +580,81 @@ class DefaultDialect(interfaces.Dialect):
         else:
             return False
 
+    def _default_multi_reflect(
+        self,
+        single_tbl_method,
+        connection,
+        schema=None,
+        filter_names=None,
+        **kw
+    ):
+        """Implement a ``get_multi_*`` reflection method in terms of the
+        corresponding single-table method.
+
+        Dialects which can retrieve the catalog information for many
+        tables at once override the ``get_multi_*`` methods directly.
+
+        """
+        unreflectable = kw.pop("unreflectable", {})
+
+        if filter_names is None:
+            names = self.get_table_names(
+                connection, schema, info_cache=kw.get("info_cache")
+            )
+        else:
+            names = filter_names
+
+        result = {}
+        for table_name in names:
+            key = (schema, table_name)
+            try:
+                result[key] = single_tbl_method(
+                    connection, table_name, schema, **kw
+                )
+            except exc.UnreflectableTableError as err:
+                unreflectable.setdefault(key, err)
+            except exc.NoSuchTableError:
+                pass
+        return result
+
+    def get_multi_columns(self, connection, schema=None, **kw):
+        return self._default_multi_reflect(
+            self.get_columns, connection, schema=schema, **kw
+        )
+
+    def get_multi_pk_constraint(self, connection, schema=None, **kw):
+        return self._default_multi_reflect(
+            self.get_pk_constraint, connection, schema=schema, **kw
+        )
+
+    def get_multi_foreign_keys(self, connection, schema=None, **kw):
+        return self._default_multi_reflect(
+            self.get_foreign_keys, connection, schema=schema, **kw
+        )
+
+    def get_multi_indexes(self, connection, schema=None, **kw):
+        return self._default_multi_reflect(
+            self.get_indexes, connection, schema=schema, **kw
+        )
+
+    def get_multi_unique_constraints(self, connection, schema=None, **kw):
+        return self._default_multi_reflect(
+            self.get_unique_constraints, connection, schema=schema, **kw
+        )
+
+    def get_multi_check_constraints(self, connection, schema=None, **kw):
+        return self._default_multi_reflect(
+            self.get_check_constraints, connection, schema=schema, **kw
+        )
+
+    def get_multi_table_comment(self, connection, schema=None, **kw):
+        return self._default_multi_reflect(
+            self.get_table_comment, connection, schema=schema, **kw
+        )
+
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        return None
+
     def validate_identifier(self, ident):
         if len(ident) > self.max_identifier_length:
             raise exc.IdentifierError(
@@ -596,7 +756,90 @@ class DefaultDialect(interfaces.Dialect):
         connection.execute(expression.ReleaseSavepointClause(name))
 
     def do_executemany(self, cursor, statement, parameters, context=None):
-        cursor.executemany(statement, parameters)
+        if (
+            self.use_insertmanyvalues
+            and context is not None
+            and context.isinsert
+            and context.compiled.returning
+            and context.compiled.insert_single_values_expr
+        ):
+            self._do_insertmanyvalues(cursor, statement, parameters, context)
+        else:
+            cursor.executemany(statement, parameters)
+
+    def _do_insertmanyvalues(self, cursor, statement, parameters, context):
+        compiled = context.compiled
+        single_values = "(%s)" % compiled.insert_single_values_expr
+        sort_index = self._insertmanyvalues_sort_index(compiled)
+
+        # the rows of a multiple-row INSERT..RETURNING are not guaranteed
+        # to be returned in the order of the VALUES clause; they are
+        # correlated to the parameter sets by sorting on a server generated
+        # autoincrement primary key, whose values are generated in the order
+        # of the VALUES clause.  Without such a column, for an "upsert"
+        # such as ON CONFLICT, where a conflicting row returns its existing
+        # primary key value, or for a statement that was altered via event
+        # hook or similar, each parameter set is INSERTed individually.
+        if sort_index is None or single_values not in statement:
+            rows = []
+            for params in parameters:
+                cursor.execute(statement, params)
+                rows.extend(cursor.fetchall())
+            self._set_insertmanyvalues_rows(cursor, context, rows)
+            return
+
+        page_size = self.insertmanyvalues_page_size
+        num_params = len(parameters[0])
+        if num_params and self.insertmanyvalues_max_parameters:
+            page_size = max(
+                min(
+                    page_size,
+                    self.insertmanyvalues_max_parameters // num_params,
+                ),
+                1,
+            )
+
+        before, after = statement.split(single_values, 1)
+        rows = []
+        for start in range(0, len(parameters), page_size):
+            batch = parameters[start : start + page_size]
+            if context._positional_inputsizes:
+                cursor.setinputsizes(
+                    *(context._positional_inputsizes * len(batch))
+                )
+            cursor.execute(
+                before + ", ".join([single_values] * len(batch)) + after,
+                self.execute_sequence_format(
+                    value for params in batch for value in params
+                ),
+            )
+            rows.extend(
+                sorted(cursor.fetchall(), key=operator.itemgetter(sort_index))
+            )
+
+        self._set_insertmanyvalues_rows(cursor, context, rows)
+
+    def _insertmanyvalues_sort_index(self, compiled):
+        """Return the position within RETURNING of the table's server
+        generated autoincrement column, or None if there is none or its
+        values can't be used to order the rows."""
+
+        autoinc_col = compiled.statement.table._autoincrement_column
+        if (
+            autoinc_col is None
+            or compiled.statement._post_values_clause is not None
+            or autoinc_col.key in (compiled.column_keys or ())
+            or any(col is autoinc_col for col in compiled.insert_prefetch)
+        ):
+            return None
+        for idx, col in enumerate(compiled.returning):
+            if col is autoinc_col:
+                return idx
+        return None
+
+    def _set_insertmanyvalues_rows(self, cursor, context, rows):
+        strat_cls = _cursor.FullyBufferedCursorFetchStrategy
+        context.cursor_fetch_strategy = strat_cls(cursor, initial_buffer=rows)
 
     def do_execute(self, cursor, statement, parameters, context=None):
         cursor.execute(statement, parameters)
@@ -741,6 +984,10 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     _expanded_parameters = util.immutabledict()
 
+    # the positional DBAPI types passed to cursor.setinputsizes(), which
+    # are repeated for each parameter set of a multiple-row INSERT
+    _positional_inputsizes = None
+
     cache_hit = NO_CACHE_KEY
 
     @classmethod
@@ -775,7 +1022,7 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                 "schema_translate_map", {}
             )
 
-            rst = compiled.preparer._render_schema_translates
+            rst = compiled._render_schema_translates
             self.unicode_statement = rst(
                 self.unicode_statement, schema_translate_map
             )
@@ -887,7 +1134,10 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                 )
 
             expanded_state = compiled._process_parameters_for_postcompile(
-                self.compiled_parameters[0]
+                self.compiled_parameters[0],
+                _pad_expanding=self.execution_options.get(
+                    "expanding_parameter_padding", False
+                ),
             )
 
             # re-assign self.unicode_statement
@@ -906,7 +1156,7 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             schema_translate_map = self.execution_options.get(
                 "schema_translate_map", {}
             )
-            rst = compiled.preparer._render_schema_translates
+            rst = compiled._render_schema_translates
             self.unicode_statement = rst(
                 self.unicode_statement, schema_translate_map
             )
@@ -924,7 +1174,28 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         # into a dict or list to be sent to the DBAPI's
         # execute() or executemany() method.
         parameters = []
-        if compiled.positional:
+        if self.executemany:
+            # for executemany, each parameter set has the same keys;
+            # convert the values one key at a time across all sets
+            if compiled.positional:
+                keys = positiontup
+            else:
+                keys = list(self.compiled_parameters[0])
+            rows = self._executemany_rows(keys, processors)
+
+            if compiled.positional:
+                if dialect.execute_sequence_format is tuple:
+                    parameters = list(rows)
+                else:
+                    parameters = [
+                        dialect.execute_sequence_format(row) for row in rows
+                    ]
+            else:
+                if not dialect.supports_unicode_statements:
+                    encoder = dialect._encoder
+                    keys = [encoder(key)[0] for key in keys]
+                parameters = [dict(zip(keys, row)) for row in rows]
+        elif compiled.positional:
             for compiled_params in self.compiled_parameters:
                 param = [
                     processors[key](compiled_params[key])
@@ -1468,6 +1739,7 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                 else:
                     dbtype = inputsizes[bindparam]
                     positional_inputsizes.append(dbtype)
+            self._positional_inputsizes = positional_inputsizes
             try:
                 self.cursor.setinputsizes(*positional_inputsizes)
             except BaseException as e:
@@ -1670,6 +1942,26 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         else:
             return self._exec_default(column, column.onupdate, column.type)
 
+    def _executemany_rows(self, keys, processors):
+        """Return a sequence of tuples, one for each parameter set, of the
+        bind processed values for the given keys.
+
+        The values are gathered and processed a column at a time, so that
+        each key's processor is looked up only once for the whole batch.
+
+        """
+        compiled_parameters = self.compiled_parameters
+        if not keys:
+            return [()] * len(compiled_parameters)
+
+        columns = []
+        for key in keys:
+            column = map(operator.itemgetter(key), compiled_parameters)
+            if key in processors:
+                column = map(processors[key], column)
+            columns.append(column)
+        return zip(*columns)
+
     def _process_executemany_defaults(self):
         key_getter = self.compiled._key_getters_for_crud_column[2]
 
@@ -240,6 +240,39 @@ class ConnectionEvents(event.Events):
 
         """
 
+    def compiled_cache_miss(self, conn, clauseelement, compiled, compile_time):
+        """Intercept the compilation of a SQL expression construct that was
+        not found in the compiled cache.
+
+        This event is emitted after the statement has been compiled and
+        placed in the cache, before it is executed.  It can be used to
+        log or gather metrics on which statements are compiled frequently,
+        in order to size the :paramref:`_sa.create_engine.query_cache_size`
+        parameter::
+
+            @event.listens_for(engine, "compiled_cache_miss")
+            def compiled_cache_miss(conn, clauseelement, compiled,
+                                    compile_time):
+                log.info("compiled in %.5fs: %s", compile_time, compiled)
+
+        The event is not emitted for statements that can't be cached, or
+        when caching is disabled.
+
+        :param conn: :class:`_engine.Connection` object
+        :param clauseelement: SQL expression construct that was compiled.
+        :param compiled: the :class:`.Compiled` object which was generated.
+        :param compile_time: time taken to construct the :class:`.Compiled`
+         object, that is, to compile the statement into a SQL string, in
+         seconds.  Generating the statement's cache key isn't included.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :ref:`sql_caching_stats`
+
+        """
+
     def before_cursor_execute(
         self, conn, cursor, statement, parameters, context, executemany
     ):
@@ -428,6 +428,161 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def get_multi_columns(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about columns in all tables in the
+        given `schema`.
+
+        Given a :class:`_engine.Connection`, an optional string `schema`
+        and an optional list of table names `filter_names`, return a
+        dictionary where the keys are two-tuples ``(schema, table_name)``
+        and the values are lists of dictionaries in the same form as
+        returned by :meth:`.Dialect.get_columns`.
+
+        When `filter_names` is ``None``, all tables in the schema are
+        considered; otherwise only the named tables (or views) are, and
+        names that are not present in the database are omitted from the
+        result.
+
+        :class:`.DefaultDialect` provides an implementation of this and
+        the other ``get_multi_*`` methods which calls upon the
+        corresponding single-table method for each table; dialects
+        override them in order to retrieve the information for many
+        tables using a small number of queries.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_pk_constraint(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about the primary key constraints of all
+        tables in the given `schema`.
+
+        The return value is a dictionary keyed on ``(schema, table_name)``
+        with values in the form returned by
+        :meth:`.Dialect.get_pk_constraint`.  See
+        :meth:`.Dialect.get_multi_columns` for a description of the
+        arguments.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_foreign_keys(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about foreign keys of all tables in the
+        given `schema`.
+
+        The return value is a dictionary keyed on ``(schema, table_name)``
+        with values in the form returned by
+        :meth:`.Dialect.get_foreign_keys`.  See
+        :meth:`.Dialect.get_multi_columns` for a description of the
+        arguments.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_indexes(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about indexes of all tables in the given
+        `schema`.
+
+        The return value is a dictionary keyed on ``(schema, table_name)``
+        with values in the form returned by :meth:`.Dialect.get_indexes`.
+        See :meth:`.Dialect.get_multi_columns` for a description of the
+        arguments.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_unique_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about unique constraints of all tables in
+        the given `schema`.
+
+        The return value is a dictionary keyed on ``(schema, table_name)``
+        with values in the form returned by
+        :meth:`.Dialect.get_unique_constraints`.  See
+        :meth:`.Dialect.get_multi_columns` for a description of the
+        arguments.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_check_constraints(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return information about check constraints of all tables in
+        the given `schema`.
+
+        The return value is a dictionary keyed on ``(schema, table_name)``
+        with values in the form returned by
+        :meth:`.Dialect.get_check_constraints`.  See
+        :meth:`.Dialect.get_multi_columns` for a description of the
+        arguments.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_table_comment(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """Return the "comment" of all tables in the given `schema`.
+
+        The return value is a dictionary keyed on ``(schema, table_name)``
+        with values in the form returned by
+        :meth:`.Dialect.get_table_comment`.  See
+        :meth:`.Dialect.get_multi_columns` for a description of the
+        arguments.
+
+        Raises ``NotImplementedError`` for dialects that don't support
+        comments.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        """Return a string which changes whenever the table definitions
+        within the given `schema` change, or ``None`` if the dialect can't
+        produce one.
+
+        The fingerprint is part of the key under which a
+        :class:`_reflection.ReflectionCache` stores reflection data, so
+        that a change to the schema invalidates the entries that were
+        stored for it.  Persistent reflection caching is not used for
+        dialects which return ``None``.
+
+        .. versionadded:: 1.4
+
+        """
+
+        raise NotImplementedError()
+
     def normalize_name(self, name):
         """convert the given name to lowercase if it is detected as
         case insensitive.
@@ -9,6 +9,7 @@
 
 
 import functools
+import heapq
 import itertools
 import operator
 
@@ -47,13 +48,14 @@ else:
 
     def _row_as_tuple(*indexes):
         # circumvent LegacyRow.__getitem__ pointing to
-        # _get_by_key_impl_mapping for now.  otherwise we could
-        # use itemgetter
-        getters = [
-            operator.methodcaller("_get_by_int_impl", index)
-            for index in indexes
-        ]
-        return lambda rec: tuple([getter(rec) for getter in getters])
+        # _get_by_key_impl_mapping for now, by using itemgetter against
+        # the row's data tuple directly, as _get_by_int_impl does.
+        it = operator.itemgetter(*indexes)
+
+        if len(indexes) > 1:
+            return lambda rec: it(rec._data)
+        else:
+            return lambda rec: (it(rec._data),)
 
 
 class ResultMetaData(object):
@@ -1162,7 +1164,7 @@ class Result(ResultInternal):
 
         return FrozenResult(self)
 
-    def merge(self, *others):
+    def merge(self, *others, **kw):
         """Merge this :class:`.Result` with other compatible result
         objects.
 
@@ -1175,8 +1177,39 @@ class Result(ResultInternal):
         set of result / cursor metadata, otherwise the behavior is
         undefined.
 
+        :param ordering: optional sequence of ``(getter, descending,
+         nulls_first)`` tuples.  When present, each result is assumed to be
+         already ordered according to these criteria, and rows are
+         interleaved using a streaming k-way merge rather than by
+         concatenation, so that only as many rows are read from each result
+         as are consumed.  ``getter`` is a callable that receives a row as
+         delivered by the individual result, e.g. ``operator.itemgetter(0)``
+         for a cursor result, and returns the value to be compared;
+         ``descending`` and ``nulls_first`` are booleans.   Values are
+         compared using Python's comparison operators, so the ordering of
+         each result must agree with them; this isn't the case for strings
+         ordered by the database using a collation other than one which
+         compares code points, such as a case insensitive or locale
+         specific collation.
+
+         .. versionadded:: 1.4
+
+        :param limit: optional integer; the merged result will deliver
+         at most this many rows, after which the given results are closed.
+
+         .. versionadded:: 1.4
+
+        :param unique_limit: if True, ``limit`` counts only rows that are
+         distinct from each other according to the unique filtering of this
+         result, as applied by :meth:`_engine.Result.unique`, rather than
+         all rows; all rows for each of the first ``limit`` distinct rows
+         are delivered.   This is used for ORM results where joined eager
+         loading delivers several rows for each object.
+
+         .. versionadded:: 1.4
+
         """
-        return MergedResult(self._metadata, (self,) + others)
+        return MergedResult(self._metadata, (self,) + others, **kw)
 
 
 class FilterResult(ResultInternal):
@@ -1683,14 +1716,37 @@ class MergedResult(IteratorResult):
 
     closed = False
 
-    def __init__(self, cursor_metadata, results):
+    def __init__(
+        self,
+        cursor_metadata,
+        results,
+        ordering=None,
+        limit=None,
+        unique_limit=False,
+    ):
         self._results = results
-        super(MergedResult, self).__init__(
-            cursor_metadata,
-            itertools.chain.from_iterable(
+
+        if ordering:
+            iterator = _ordered_merge(
+                [r._raw_row_iterator() for r in results], ordering
+            )
+        else:
+            iterator = itertools.chain.from_iterable(
                 r._raw_row_iterator() for r in results
-            ),
-        )
+            )
+        if limit is not None:
+            if unique_limit:
+                iterator = _unique_limit(
+                    iterator,
+                    limit,
+                    _raw_unique_key(
+                        cursor_metadata, results[0]._source_supports_scalars
+                    ),
+                )
+            else:
+                iterator = itertools.islice(iterator, limit)
+
+        super(MergedResult, self).__init__(cursor_metadata, iterator)
 
         self._unique_filter_state = results[0]._unique_filter_state
         self._yield_per = results[0]._yield_per
@@ -1710,3 +1766,109 @@ class MergedResult(IteratorResult):
             r._soft_close(hard=hard)
         if hard:
             self.closed = True
+
+
+def _raw_unique_key(metadata, scalars):
+    """Return a function which produces the key that unique filtering
+    would use for a raw row, or None to use the row itself."""
+
+    filters = metadata._unique_filters
+    if not filters:
+        return None
+    elif scalars:
+        return filters[0]
+    else:
+
+        def key(row):
+            return tuple(
+                filter_(value) if filter_ else value
+                for filter_, value in zip(filters, row)
+            )
+
+        return key
+
+
+def _unique_limit(iterator, limit, key):
+    """Deliver the rows of ``iterator`` up to, but not including, the
+    first row that would be the ``limit + 1``'th distinct row."""
+
+    seen = set()
+    for row in iterator:
+        row_key = key(row) if key is not None else row
+        if row_key not in seen:
+            if len(seen) == limit:
+                return
+            seen.add(row_key)
+        yield row
+
+
+class _OrderedMergeKey(object):
+    """Sort key for a row participating in an ordered merge, comparing
+    per-column ascending / descending and NULLS FIRST / LAST criteria."""
+
+    __slots__ = ("values", "directions")
+
+    def __init__(self, values, directions):
+        self.values = values
+        self.directions = directions
+
+    def __lt__(self, other):
+        for value, other_value, (descending, nulls_first) in zip(
+            self.values, other.values, self.directions
+        ):
+            if value is None or other_value is None:
+                if value is other_value:
+                    continue
+                return (value is None) is nulls_first
+            elif value == other_value:
+                continue
+            elif descending:
+                return value > other_value
+            else:
+                return value < other_value
+        return False
+
+    def __eq__(self, other):
+        # consulted by tuple comparison within the heap, so that rows
+        # which compare as equal fall back to the iterator index
+        return not (self < other or other < self)
+
+    def __ne__(self, other):
+        return not self == other
+
+
+def _ordered_merge(iterators, ordering):
+    """Perform a heap-based k-way merge of already-ordered row iterators.
+
+    Rows which compare as equal are delivered in the order of the given
+    iterators.  Values are compared using Python's operators, which must
+    agree with the ordering of each iterator; see
+    :meth:`_engine.Result.merge`.
+
+    """
+    getters = [getter for getter, descending, nulls_first in ordering]
+    directions = [
+        (descending, nulls_first)
+        for getter, descending, nulls_first in ordering
+    ]
+
+    def key(row):
+        return _OrderedMergeKey(
+            [getter(row) for getter in getters], directions
+        )
+
+    heap = []
+    for idx, iterator in enumerate(iterators):
+        row = next(iterator, _NO_ROW)
+        if row is not _NO_ROW:
+            heap.append((key(row), idx, row, iterator))
+    heapq.heapify(heap)
+
+    while heap:
+        row_key, idx, row, iterator = heap[0]
+        yield row
+        row = next(iterator, _NO_ROW)
+        if row is _NO_ROW:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (key(row), idx, row, iterator))
@@ -18,6 +18,10 @@ from ...util.concurrency import greenlet_spawn
 class AsyncSession:
     """Asyncio version of :class:`_orm.Session`.
 
+    :param sync_session_class: the :class:`_orm.Session` class, or a
+     subclass such as :class:`.ShardedSession`, which is constructed
+     with the remaining keyword arguments to serve as the
+     :attr:`_asyncio.AsyncSession.sync_session`.
 
     .. versionadded:: 1.4
 
@@ -27,6 +31,7 @@ class AsyncSession:
         self,
         bind: AsyncEngine = None,
         binds: Mapping[object, AsyncEngine] = None,
+        sync_session_class: type = Session,
         **kw
     ):
         kw["future"] = True
@@ -38,7 +43,7 @@ class AsyncSession:
                 key: engine._get_sync_engine(b) for key, b in binds.items()
             }
 
-        self.sync_session = Session(bind=bind, binds=binds, **kw)
+        self.sync_session = sync_session_class(bind=bind, binds=binds, **kw)
 
     def add(self, instance: object) -> None:
         """Place an object in this :class:`_asyncio.AsyncSession`.
@@ -120,7 +125,9 @@ class AsyncSession:
         """Execute a statement and return a buffered
         :class:`_engine.Result` object."""
 
-        execution_options = execution_options.union({"prebuffer_rows": True})
+        execution_options = util.immutabledict(execution_options).union(
+            {"prebuffer_rows": True}
+        )
 
         return await greenlet_spawn(
             self.sync_session.execute,
@@ -142,7 +149,9 @@ class AsyncSession:
         """Execute a statement and return a streaming
         :class:`_asyncio.AsyncResult` object."""
 
-        execution_options = execution_options.union({"stream_results": True})
+        execution_options = util.immutabledict(execution_options).union(
+            {"stream_results": True}
+        )
 
         result = await greenlet_spawn(
             self.sync_session.execute,
@@ -15,12 +15,30 @@ the source distribution.
 
 """
 
+import functools
+import operator
+import time
+
 from .. import event
 from .. import exc
 from .. import inspect
 from .. import util
+from ..orm import undefer
+from ..orm.attributes import instance_dict
+from ..orm.context import _ColumnEntity
+from ..orm.context import _MapperEntity
+from ..orm.properties import ColumnProperty
 from ..orm.query import Query
 from ..orm.session import Session
+from ..sql import operators
+from ..sql import sqltypes
+from ..sql.elements import BinaryExpression
+from ..sql.elements import Label
+from ..sql.elements import UnaryExpression
+from ..sql.selectable import Select
+from ..util.concurrency import asyncio
+from ..util.concurrency import greenlet_gather
+from ..util.concurrency import in_greenlet
 
 __all__ = ["ShardedSession", "ShardedQuery"]
 
@@ -59,6 +77,10 @@ class ShardedSession(Session):
         execute_chooser=None,
         shards=None,
         query_cls=ShardedQuery,
+        concurrent_execution=False,
+        max_concurrency=None,
+        shard_timeout=None,
+        ordered_merge=False,
         **kwargs
     ):
         """Construct a ShardedSession.
@@ -85,6 +107,80 @@ class ShardedSession(Session):
         :param shards: A dictionary of string shard names
           to :class:`~sqlalchemy.engine.Engine` objects.
 
+        :param concurrent_execution: if True, a SELECT statement which
+          ``execute_chooser`` routes to more than one shard is issued to all
+          of those shards simultaneously, rather than one after the other,
+          so that the latency of a cross-shard read approximates that of the
+          slowest shard rather than the sum of all of them.  The connection
+          for each shard is procured up front in the calling thread; each
+          statement is then invoked in a worker thread, or when the session
+          is run within the :ref:`asyncio <asyncio_toplevel>` extension,
+          within its own greenlet via ``asyncio.gather()``.   For the
+          threaded form, the DBAPI in use must allow a connection to be used
+          from a thread other than the one that created it.   When the
+          statement for one shard raises, the statements for the other
+          shards are cancelled, or waited for if they're already running
+          in a thread, before the error is raised, so that no connection is
+          still in use once the caller receives it.  Persistence
+          operations and bulk UPDATE / DELETE are not affected.   Requires
+          Python 3; an :class:`.exc.ArgumentError` is raised under Python 2.
+
+          .. versionadded:: 1.4
+
+        :param max_concurrency: when ``concurrent_execution`` is set, the
+          maximum number of shards queried at once; defaults to the number
+          of shards being queried.
+
+          .. versionadded:: 1.4
+
+        :param shard_timeout: when ``concurrent_execution`` is set, the
+          number of seconds a single shard's statement may run, measured
+          from when it is started, before :class:`.exc.TimeoutError` is
+          raised.   The session should be rolled back or closed after a
+          timeout.   Within the asyncio extension, the statements which
+          are still running are cancelled and the error is raised once the
+          timeout has elapsed and they have been unwound.   When using
+          threads, the timeout is best effort only, and does not bound the
+          time taken by the call: statements that haven't started are
+          cancelled, however a statement that is already running can't be
+          interrupted, so the error is raised only once the running
+          statements have completed and their connections are no longer in
+          use.   A statement that never completes, such as one against an
+          unresponsive shard, blocks the caller indefinitely.   To place a
+          hard limit on the time taken by each shard, use a timeout
+          configured for the database or the DBAPI connection, such as
+          PostgreSQL's ``statement_timeout``.
+
+          .. versionadded:: 1.4
+
+        :param ordered_merge: if True, when a SELECT that includes ORDER BY
+          is routed to more than one shard, the already-ordered results of
+          each shard are combined using a streaming k-way merge on the
+          ORDER BY expressions, rather than being concatenated; if the
+          SELECT also includes a simple integer LIMIT without OFFSET, the
+          merged result stops after that many rows, reading only as many
+          rows from each shard as are needed; when a collection is joined
+          eager loaded, the LIMIT counts distinct rows, as it does for the
+          objects within each shard's SELECT.   ORDER BY expressions must
+          refer to columns or column-based attributes of the entities
+          being selected; if any cannot be located within the result rows,
+          results are concatenated as usual.   Attributes which are used
+          for ordering are undeferred within each shard's SELECT, so that
+          the merge doesn't load them for each object.   When an
+          expression doesn't specify ``nullsfirst()`` / ``nullslast()``,
+          NULL values are assumed to sort as greater than all other values
+          on PostgreSQL and Oracle and lower on other backends.   Values
+          are compared using Python's comparison operators, which don't
+          take into account a database collation; so that rows aren't
+          merged in a different order than each shard's ORDER BY, and a
+          LIMIT doesn't select the wrong rows, results are concatenated
+          when an ORDER BY expression is of a string type, unless each
+          shard uses SQLite and neither the type nor the expression
+          specifies a collation, in which case SQLite's default ``BINARY``
+          collation applies.
+
+          .. versionadded:: 1.4
+
         """
         query_chooser = kwargs.pop("query_chooser", None)
         super(ShardedSession, self).__init__(query_cls=query_cls, **kwargs)
@@ -94,6 +190,14 @@ class ShardedSession(Session):
         )
         self.shard_chooser = shard_chooser
         self.id_chooser = id_chooser
+        if concurrent_execution and util.py2k:
+            raise exc.ArgumentError(
+                "concurrent_execution requires Python 3 or greater"
+            )
+        self.concurrent_execution = concurrent_execution
+        self.max_concurrency = max_concurrency
+        self.shard_timeout = shard_timeout
+        self.ordered_merge = ordered_merge
 
         if query_chooser:
             util.warn_deprecated(
@@ -217,7 +321,7 @@ def execute_and_instances(orm_context):
 
     session = orm_context.session
 
-    def iter_for_shard(shard_id, load_options, update_options):
+    def iter_for_shard(shard_id, load_options, update_options, statement=None):
         execution_options = dict(orm_context.local_execution_options)
 
         bind_arguments = dict(orm_context.bind_arguments)
@@ -231,7 +335,9 @@ def execute_and_instances(orm_context):
             execution_options["_sa_orm_update_options"] = update_options
 
         return orm_context.invoke_statement(
-            bind_arguments=bind_arguments, execution_options=execution_options
+            statement=statement,
+            bind_arguments=bind_arguments,
+            execution_options=execution_options,
         )
 
     if active_options._refresh_identity_token is not None:
@@ -246,9 +352,308 @@ def execute_and_instances(orm_context):
     if shard_id is not None:
         return iter_for_shard(shard_id, load_options, update_options)
     else:
-        partial = []
-        for shard_id in session.execute_chooser(orm_context):
-            result_ = iter_for_shard(shard_id, load_options, update_options)
-            partial.append(result_)
+        shard_ids = list(session.execute_chooser(orm_context))
+
+        if session.ordered_merge and orm_context.is_select:
+            statement, merge_kw = _ordered_merge_arguments(
+                session, orm_context, shard_ids
+            )
+        else:
+            statement, merge_kw = None, {}
+
+        if (
+            session.concurrent_execution
+            and orm_context.is_select
+            and len(shard_ids) > 1
+        ):
+            partial = _execute_concurrently(
+                session,
+                orm_context,
+                shard_ids,
+                lambda shard_id: iter_for_shard(
+                    shard_id, load_options, update_options, statement
+                ),
+            )
+        else:
+            partial = []
+            for shard_id in shard_ids:
+                result_ = iter_for_shard(
+                    shard_id, load_options, update_options, statement
+                )
+                partial.append(result_)
+
+        if (
+            "limit" in merge_kw
+            and orm_context.is_orm_statement
+            and _loads_multiple_rows(partial[0])
+        ):
+            merge_kw["unique_limit"] = True
+
+        return partial[0].merge(*partial[1:], **merge_kw)
+
+
+# backends where NULL sorts as greater than all other values, in the
+# absence of an explicit NULLS FIRST / NULLS LAST
+_NULLS_SORT_HIGH = frozenset(["postgresql", "oracle"])
+
+
+def _ordered_merge_arguments(session, orm_context, shard_ids):
+    """Return the statement to be invoked for each shard, along with
+    keyword arguments for :meth:`_engine.Result.merge` which merge
+    per-shard results according to the statement's ORDER BY and LIMIT."""
+
+    statement = orm_context.statement
+    if (
+        not isinstance(statement, Select)
+        or statement._offset_clause is not None
+    ):
+        return None, {}
+
+    merge_kw = {}
+
+    if statement._order_by_clauses:
+        dialects = [
+            session.get_bind(
+                mapper=orm_context.bind_arguments.get("mapper"),
+                shard_id=shard_id,
+            ).dialect
+            for shard_id in shard_ids
+        ]
+        nulls_high = dialects[0].name in _NULLS_SORT_HIGH
+
+        loader_options = []
+        if orm_context.is_orm_statement:
+            getter_for = _orm_row_getter_factory(orm_context, loader_options)
+        else:
+            getter_for = _core_row_getter_factory(statement)
+
+        ordering = []
+        for element in statement._order_by_clauses:
+            element, descending, nulls_first = _unwrap_order_by(element)
+            if not _compares_as_python(element, dialects):
+                return None, {}
+            getter = getter_for(element)
+            if getter is None:
+                return None, {}
+            if nulls_first is None:
+                nulls_first = descending if nulls_high else not descending
+            ordering.append((getter, descending, nulls_first))
+        merge_kw["ordering"] = ordering
+
+        if loader_options:
+            statement = statement.options(*loader_options)
+
+    if statement._simple_int_limit:
+        merge_kw["limit"] = statement._limit
+
+    return statement, merge_kw
+
+
+def _loads_multiple_rows(result):
+    # joined eager loading of a collection delivers several rows for each
+    # object, and LIMIT is applied to the objects within a subquery; the
+    # merged LIMIT likewise counts the rows that remain after uniquing
+    compile_state = result.raw.context.compiled.compile_state
+    return getattr(compile_state, "multi_row_eager_loaders", False)
+
+
+def _compares_as_python(element, dialects):
+    # the merge compares values using Python's operators.  The ordering of
+    # strings depends on the collation in use; SQLite's default BINARY
+    # collation compares code points as Python does, while the default
+    # collations of other backends are typically locale specific or case
+    # insensitive, so that shards would deliver rows in an order the
+    # merge doesn't reproduce
+    affinity = element.type._type_affinity
+    if affinity is None or not issubclass(affinity, sqltypes.String):
+        return True
+    return (
+        all(dialect.name == "sqlite" for dialect in dialects)
+        and getattr(element.type, "collation", None) is None
+        and not (
+            isinstance(element, BinaryExpression)
+            and element.operator is operators.collate
+        )
+    )
+
+
+def _unwrap_order_by(element):
+    descending = False
+    nulls_first = None
+    while isinstance(element, UnaryExpression) and element.modifier in (
+        operators.asc_op,
+        operators.desc_op,
+        operators.nullsfirst_op,
+        operators.nullslast_op,
+    ):
+        if element.modifier is operators.desc_op:
+            descending = True
+        elif element.modifier is operators.nullsfirst_op:
+            nulls_first = True
+        elif element.modifier is operators.nullslast_op:
+            nulls_first = False
+        element = element.element
+
+    if isinstance(element, Label):
+        element = element.element
+    return element, descending, nulls_first
+
+
+def _core_row_getter_factory(statement):
+    columns = list(statement.selected_columns)
+
+    def getter_for(element):
+        for idx, column in enumerate(columns):
+            if isinstance(column, Label):
+                column = column.element
+            if column.compare(element):
+                return operator.itemgetter(idx)
+        return None
+
+    return getter_for
+
+
+def _orm_row_getter_factory(orm_context, loader_options):
+    entities = orm_context._compile_state_cls._create_entities_collection(
+        orm_context.statement
+    )._entities
+    scalars = (
+        not orm_context.load_options._only_return_tuples
+        and len(entities) == 1
+        and entities[0].supports_single_entity
+    )
+
+    def attribute_getter(idx, entity, key):
+        prop = entity.mapper._props.get(key)
+        if not isinstance(prop, ColumnProperty):
+            return None
+
+        # the attribute is undeferred, so that each row populates it; the
+        # value is then read from the instance dictionary, as attribute
+        # access would emit a load for an attribute that's deferred or
+        # expired and not yet populated
+        loader_options.append(undefer(getattr(entity.entity_zero.entity, key)))
+
+        def get(row):
+            obj = row if scalars else row[idx]
+            return instance_dict(obj).get(key) if obj is not None else None
+
+        return get
+
+    def getter_for(element):
+        annotations = element._annotations
+        for idx, entity in enumerate(entities):
+            if isinstance(entity, _MapperEntity):
+                mapper = entity.mapper
+                if (
+                    annotations.get("parententity") is entity.entity_zero
+                    and "orm_key" in annotations
+                ):
+                    return attribute_getter(
+                        idx, entity, annotations["orm_key"]
+                    )
+                elif (
+                    not entity.is_aliased_class
+                    and element in mapper._columntoproperty
+                ):
+                    return attribute_getter(
+                        idx, entity, mapper._columntoproperty[element].key
+                    )
+            elif isinstance(entity, _ColumnEntity):
+                if entity.column.compare(element):
+                    return operator.itemgetter(idx)
+        return None
+
+    return getter_for
+
+
+def _execute_concurrently(session, orm_context, shard_ids, fn):
+    """Invoke ``fn`` for each shard id simultaneously and return the list
+    of results in the order of ``shard_ids``."""
+
+    # procure each shard's connection up front, so that the transactional
+    # state of the Session is only ever modified from the calling thread.
+    if session.in_transaction() or not session.autocommit:
+        for shard_id in shard_ids:
+            bind_arguments = dict(orm_context.bind_arguments)
+            bind_arguments["shard_id"] = shard_id
+            session.connection(bind_arguments=bind_arguments)
+
+    limit = session.max_concurrency or len(shard_ids)
+    timeout = session.shard_timeout
+
+    if in_greenlet():
+        try:
+            return greenlet_gather(
+                [functools.partial(fn, shard_id) for shard_id in shard_ids],
+                limit=limit,
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError as err:
+            util.raise_(
+                exc.TimeoutError(
+                    "Shard statement did not complete within %s seconds"
+                    % timeout
+                ),
+                replace_context=err,
+            )
+
+    if util.py2k:
+        raise exc.InvalidRequestError(
+            "concurrent_execution requires Python 3 or greater"
+        )
 
-        return partial[0].merge(*partial[1:])
+    from concurrent import futures
+
+    started = {}
+
+    def run(shard_id):
+        started[shard_id] = time.time()
+        return fn(shard_id)
+
+    def cancel_and_wait():
+        # statements which are already running can't be cancelled; wait
+        # for them, so that the caller doesn't roll back or close
+        # connections that are still in use
+        for _, pending in submitted:
+            pending.cancel()
+        futures.wait([pending for _, pending in submitted])
+
+    executor = futures.ThreadPoolExecutor(max_workers=limit)
+    try:
+        submitted = [
+            (shard_id, executor.submit(run, shard_id))
+            for shard_id in shard_ids
+        ]
+        results = []
+        for shard_id, future in submitted:
+            while True:
+                start = started.get(shard_id)
+                if timeout is None:
+                    remaining = None
+                elif start is None:
+                    remaining = timeout
+                else:
+                    remaining = max(start + timeout - time.time(), 0)
+                try:
+                    results.append(future.result(timeout=remaining))
+                except futures.TimeoutError as err:
+                    if start is None:
+                        # not yet picked up by a worker; keep waiting
+                        continue
+                    cancel_and_wait()
+                    util.raise_(
+                        exc.TimeoutError(
+                            "Statement for shard %r did not complete within "
+                            "%s seconds" % (shard_id, timeout)
+                        ),
+                        replace_context=err,
+                    )
+                except BaseException:
+                    cancel_and_wait()
+                    raise
+                else:
+                    break
+        return results
+    finally:
+        executor.shutdown(wait=False)
@@ -258,6 +258,7 @@ lazyload = strategy_options.lazyload._unbound_fn
 subqueryload = strategy_options.subqueryload._unbound_fn
 selectinload = strategy_options.selectinload._unbound_fn
 immediateload = strategy_options.immediateload._unbound_fn
+batchload = strategy_options.batchload._unbound_fn
 noload = strategy_options.noload._unbound_fn
 raiseload = strategy_options.raiseload._unbound_fn
 defaultload = strategy_options.defaultload._unbound_fn
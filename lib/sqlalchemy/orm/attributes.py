@@ -784,17 +784,15 @@ class AttributeImpl(object):
         else:
             # if history present, don't load
             key = self.key
-            if (
-                key not in state.committed_state
-                or state.committed_state[key] is NO_VALUE
-            ):
+            committed_state = state._committed_state
+            if key not in committed_state or committed_state[key] is NO_VALUE:
                 if not passive & CALLABLES_OK:
                     return PASSIVE_NO_RESULT
 
                 if (
                     self.accepts_scalar_loader
                     and self.load_on_unexpire
-                    and key in state.expired_attributes
+                    and key in state._expired_attributes
                 ):
                     value = state._load_expired(state, passive)
                 elif key in state.callables:
@@ -862,8 +860,9 @@ class AttributeImpl(object):
     def get_committed_value(self, state, dict_, passive=PASSIVE_OFF):
         """return the unchanged value of this attribute"""
 
-        if self.key in state.committed_state:
-            value = state.committed_state[self.key]
+        committed_state = state._committed_state
+        if self.key in committed_state:
+            value = committed_state[self.key]
             if value is NO_VALUE:
                 return None
             else:
@@ -910,14 +909,14 @@ class ScalarAttributeImpl(AttributeImpl):
             existing is NO_VALUE
             and old is NO_VALUE
             and not state.expired
-            and self.key not in state.expired_attributes
+            and self.key not in state._expired_attributes
         ):
             raise AttributeError("%s object does not have a value" % self)
 
     def get_history(self, state, dict_, passive=PASSIVE_OFF):
         if self.key in dict_:
             return History.from_scalar_attribute(self, state, dict_[self.key])
-        elif self.key in state.committed_state:
+        elif self.key in state._committed_state:
             return History.from_scalar_attribute(self, state, NO_VALUE)
         else:
             if passive & INIT_OK:
@@ -1043,8 +1042,9 @@ class ScalarObjectAttributeImpl(ScalarAttributeImpl):
         else:
             ret = [(None, None)]
 
-        if self.key in state.committed_state:
-            original = state.committed_state[self.key]
+        committed_state = state._committed_state
+        if self.key in committed_state:
+            original = committed_state[self.key]
             if (
                 original is not None
                 and original is not PASSIVE_NO_RESULT
@@ -1222,8 +1222,9 @@ class CollectionAttributeImpl(AttributeImpl):
         current = dict_[self.key]
         current = getattr(current, "_sa_adapter")
 
-        if self.key in state.committed_state:
-            original = state.committed_state[self.key]
+        committed_state = state._committed_state
+        if self.key in committed_state:
+            original = committed_state[self.key]
             if original is not NO_VALUE:
                 current_states = [
                     ((c is not None) and instance_state(c) or None, c)
@@ -1765,7 +1766,7 @@ class History(util.namedtuple("History", ["added", "unchanged", "deleted"])):
 
     @classmethod
     def from_scalar_attribute(cls, attribute, state, current):
-        original = state.committed_state.get(attribute.key, _NO_HISTORY)
+        original = state._committed_state.get(attribute.key, _NO_HISTORY)
 
         if original is _NO_HISTORY:
             if current is NO_VALUE:
@@ -1799,7 +1800,7 @@ class History(util.namedtuple("History", ["added", "unchanged", "deleted"])):
 
     @classmethod
     def from_object_attribute(cls, attribute, state, current):
-        original = state.committed_state.get(attribute.key, _NO_HISTORY)
+        original = state._committed_state.get(attribute.key, _NO_HISTORY)
 
         if original is _NO_HISTORY:
             if current is NO_VALUE:
@@ -1829,7 +1830,7 @@ class History(util.namedtuple("History", ["added", "unchanged", "deleted"])):
 
     @classmethod
     def from_collection(cls, attribute, state, current):
-        original = state.committed_state.get(attribute.key, _NO_HISTORY)
+        original = state._committed_state.get(attribute.key, _NO_HISTORY)
         if current is NO_VALUE:
             return cls((), (), ())
 
@@ -5,6 +5,7 @@
 # This module is part of SQLAlchemy and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 from . import attributes
+from . import identity
 from . import interfaces
 from . import loading
 from .base import _is_aliased_class
@@ -56,6 +57,8 @@ class QueryContext(object):
         "invoke_all_eagers",
         "version_check",
         "refresh_state",
+        "readonly_identity_map",
+        "chunk_states",
         "create_eager_joins",
         "propagated_loader_options",
         "attributes",
@@ -78,6 +81,8 @@ class QueryContext(object):
         _yield_per = None
         _refresh_state = None
         _lazy_loaded_from = None
+        _readonly = False
+        _expunge_per_chunk = False
 
     def __init__(
         self,
@@ -113,6 +118,24 @@ class QueryContext(object):
         self.yield_per = load_options._yield_per
         self.identity_token = load_options._refresh_identity_token
 
+        if load_options._readonly:
+            # objects are loaded into an identity map local to this
+            # load, rather than that of the Session
+            self.readonly_identity_map = identity.WeakInstanceDict()
+            self.chunk_states = None
+        else:
+            self.readonly_identity_map = None
+
+            # states added to the Session by a load which expunges them
+            # per chunk; eager loaders which run their own queries for a
+            # chunk pass along the same collection
+            if load_options._expunge_per_chunk:
+                self.chunk_states = []
+            else:
+                self.chunk_states = self.execution_options.get(
+                    "_sa_orm_chunk_states", None
+                )
+
         if self.yield_per and compile_state._no_yield_pers:
             raise sa_exc.InvalidRequestError(
                 "The yield_per Query option is currently not "
@@ -211,7 +234,13 @@ class ORMCompileState(CompileState):
             execution_options,
         ) = QueryContext.default_load_options.from_execution_options(
             "_sa_orm_load_options",
-            {"populate_existing", "autoflush", "yield_per"},
+            {
+                "populate_existing",
+                "autoflush",
+                "yield_per",
+                "readonly",
+                "expunge_per_chunk",
+            },
             execution_options,
             statement._execution_options,
         )
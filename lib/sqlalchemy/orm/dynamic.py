@@ -230,8 +230,9 @@ class DynamicAttributeImpl(attributes.AttributeImpl):
         return [(attributes.instance_state(x), x) for x in c.all_items]
 
     def _get_collection_history(self, state, passive=attributes.PASSIVE_OFF):
-        if self.key in state.committed_state:
-            c = state.committed_state[self.key]
+        committed_state = state._committed_state
+        if self.key in committed_state:
+            c = committed_state[self.key]
         else:
             c = CollectionHistory(self, state)
 
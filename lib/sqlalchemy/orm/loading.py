@@ -95,6 +95,11 @@ def instances(cursor, context):
         ],
     )
 
+    expunge_per_chunk = (
+        context.load_options._expunge_per_chunk
+        and context.chunk_states is not None
+    )
+
     def chunks(size):
         while True:
             yield_per = size
@@ -102,6 +107,13 @@ def instances(cursor, context):
             context.partials = {}
 
             if yield_per:
+                # expunge the previous chunk's objects before fetching, rather
+                # than after it's yielded; with a server side cursor, the
+                # result calls chunks() again for each fetch, and the previous
+                # generator is discarded without resuming
+                if expunge_per_chunk:
+                    _expunge_chunk_states(context)
+
                 fetch = cursor.fetchmany(yield_per)
 
                 if not fetch:
@@ -152,6 +164,31 @@ def instances(cursor, context):
     return result
 
 
+def _expunge_chunk_states(context):
+    """Expunge objects that were added to the Session by a previous chunk
+    of an ``expunge_per_chunk`` load.
+
+    Objects with pending changes are retained until a subsequent chunk
+    in which they've been flushed.
+
+    """
+    session = context.session
+    identity_map = session.identity_map
+    chunk_states = context.chunk_states
+
+    to_expunge = []
+    retained = []
+    for state in chunk_states:
+        if state.modified or state in session._deleted:
+            retained.append(state)
+        elif identity_map.contains_state(state):
+            to_expunge.append(state)
+
+    chunk_states[:] = retained
+    if to_expunge:
+        session._expunge_states(to_expunge)
+
+
 @util.preload_module("sqlalchemy.orm.context")
 def merge_frozen_result(session, statement, frozen_result, load=True):
     """Merge a :class:`_engine.FrozenResult` back into a :class:`_orm.Session`,
@@ -663,6 +700,7 @@ def _instance_processor(
         )
 
         todo = []
+        quick_cols = []
         cached_populators = {
             "new": [],
             "quick": [],
@@ -711,6 +749,7 @@ def _instance_processor(
                         getter = result._getter(col, False)
                     if getter:
                         cached_populators["quick"].append((prop.key, getter))
+                        quick_cols.append(col)
                     else:
                         # fall back to the ColumnProperty itself, which
                         # will iterate through all of its columns
@@ -730,6 +769,16 @@ def _instance_processor(
                 # with the context each time to work correctly.
                 todo.append(prop)
 
+        if len(quick_cols) == len(cached_populators["quick"]):
+            # a single getter for all of the column-based attributes,
+            # used by the fast path for new objects
+            getters["quick_tuple_getter"] = (
+                tuple(key for key, getter in cached_populators["quick"]),
+                result._tuple_getter(quick_cols) if quick_cols else None,
+            )
+        else:
+            getters["quick_tuple_getter"] = None
+
         path.set(compile_state.attributes, getter_key, getters)
 
     cached_populators = getters["cached_populators"]
@@ -747,17 +796,26 @@ def _instance_processor(
         else path
     )
 
-    session_identity_map = context.session.identity_map
+    if context.readonly_identity_map is not None:
+        # the "readonly" option; objects are detached and are not
+        # associated with the Session
+        session_identity_map = context.readonly_identity_map
+        session_id = None
+        persistent_evt = False
+    else:
+        session_identity_map = context.session.identity_map
+        session_id = context.session.hash_key
+        persistent_evt = bool(context.session.dispatch.loaded_as_persistent)
+
+    chunk_states = context.chunk_states
 
     populate_existing = context.populate_existing or mapper.always_refresh
     load_evt = bool(mapper.class_manager.dispatch.load)
     refresh_evt = bool(mapper.class_manager.dispatch.refresh)
-    persistent_evt = bool(context.session.dispatch.loaded_as_persistent)
     if persistent_evt:
         loaded_as_persistent = context.session.dispatch.loaded_as_persistent
     instance_state = attributes.instance_state
     instance_dict = attributes.instance_dict
-    session_id = context.session.hash_key
     runid = context.runid
     identity_token = context.identity_token
 
@@ -882,6 +940,9 @@ def _instance_processor(
                 state.session_id = session_id
                 session_identity_map._add_unpresent(state, identitykey)
 
+                if chunk_states is not None:
+                    chunk_states.append(state)
+
         # populate.  this looks at whether this state is new
         # for this load or was existing, and whether or not this
         # row is the first row with this identity.
@@ -978,6 +1039,36 @@ def _instance_processor(
 
         return instance
 
+    quick_tuple_getter = getters["quick_tuple_getter"]
+    if (
+        quick_tuple_getter is not None
+        and len(quick_tuple_getter[0]) == len(populators["quick"])
+        and not refresh_state
+        and not populate_existing
+        and not load_evt
+        and not persistent_evt
+        and not post_load
+        and not any(populators[key] for key in populators if key != "quick")
+    ):
+        # fast path for the common case of loading column attributes into
+        # new objects with no load events or additional loaders to run.
+        # objects already in the identity map go through the full
+        # _instance() above.
+        _instance = _fast_instance_processor(
+            mapper,
+            _instance,
+            quick_tuple_getter,
+            session_identity_map,
+            primary_key_getter,
+            is_not_primary_key,
+            identity_token,
+            session_id,
+            runid,
+            propagated_loader_options,
+            load_path,
+            chunk_states,
+        )
+
     if mapper.polymorphic_map and not _polymorphic_from and not refresh_state:
         # if we are doing polymorphic, dispatch to a different _instance()
         # method specific to the subclass mapper
@@ -1007,6 +1098,73 @@ def _instance_processor(
     return _instance
 
 
+def _fast_instance_processor(
+    mapper,
+    _instance,
+    quick_tuple_getter,
+    session_identity_map,
+    primary_key_getter,
+    is_not_primary_key,
+    identity_token,
+    session_id,
+    runid,
+    propagated_loader_options,
+    load_path,
+    chunk_states,
+):
+    """Produce a row processor which creates new instances directly,
+    delegating to the given full row processor for rows that refer to an
+    existing identity."""
+
+    identity_class = mapper._identity_class
+    new_instance = mapper.class_manager.new_instance
+    instance_state = attributes.instance_state
+    instance_dict = attributes.instance_dict
+    identity_dict = session_identity_map._dict
+    add_state = session_identity_map._add_unpresent
+    quick_keys, quick_getter = quick_tuple_getter
+
+    if chunk_states is not None:
+        _add_unpresent = add_state
+
+        def add_state(state, identitykey):
+            _add_unpresent(state, identitykey)
+            chunk_states.append(state)
+
+    def _instance_fast(row):
+        identitykey = (identity_class, primary_key_getter(row), identity_token)
+
+        if identitykey in identity_dict:
+            return _instance(row)
+
+        # check for non-NULL values in the primary key columns,
+        # else no entity is returned for the row
+        if is_not_primary_key(identitykey[1]):
+            return None
+
+        instance = new_instance()
+
+        dict_ = instance_dict(instance)
+        state = instance_state(instance)
+        state.key = identitykey
+        state.identity_token = identity_token
+
+        # attach instance to session.
+        state.session_id = session_id
+        add_state(state, identitykey)
+
+        state.load_options = propagated_loader_options
+        state.load_path = load_path
+        state.runid = runid
+
+        if quick_keys:
+            dict_.update(zip(quick_keys, quick_getter(row)))
+
+        return instance
+
+    return _instance_fast
+
+
 def _load_subclass_via_in(context, path, entity):
     mapper = entity.mapper
 
@@ -1363,7 +1521,7 @@ def load_scalar_attributes(mapper, state, attribute_names, passive):
             pk_attrs = [
                 mapper._columntoproperty[col].key for col in mapper.primary_key
             ]
-            if state.expired_attributes.intersection(pk_attrs):
+            if state._expired_attributes.intersection(pk_attrs):
                 raise sa_exc.InvalidRequestError(
                     "Instance %s cannot be refreshed - it's not "
                     " persistent and does not "
@@ -137,7 +137,7 @@ def _bulk_update(
         return dict(
             (k, v)
             for k, v in state.dict.items()
-            if k in state.committed_state or k in search_keys
+            if k in state._committed_state or k in search_keys
         )
 
     if isstates:
@@ -191,6 +191,151 @@ def _bulk_update(
         )
 
 
+def _bulk_upsert(
+    mapper,
+    mappings,
+    session_transaction,
+    index_elements,
+    update_keys,
+    return_primary_keys,
+):
+    base_mapper = mapper.base_mapper
+
+    cached_connections = _cached_connection_dict(base_mapper)
+
+    if session_transaction.session.connection_callable:
+        raise NotImplementedError(
+            "connection_callable / per-instance sharding "
+            "not supported in bulk_upsert()"
+        )
+
+    if len(mapper.tables) > 1:
+        raise sa_exc.InvalidRequestError(
+            "bulk_upsert() is only supported for a mapper against a "
+            "single table; %s is mapped to %d tables"
+            % (mapper, len(mapper.tables))
+        )
+    if mapper.version_id_col is not None:
+        raise sa_exc.InvalidRequestError(
+            "bulk_upsert() is not supported for %s, which makes use of "
+            "a version_id_col" % mapper
+        )
+
+    table = mapper.tables[0]
+    propkey_to_col = mapper._propkey_to_col[table]
+
+    def cols_for_keys(keys):
+        try:
+            return [propkey_to_col[key] for key in keys]
+        except KeyError as err:
+            util.raise_(
+                sa_exc.InvalidRequestError(
+                    "%s has no column-based attribute %r"
+                    % (mapper, err.args[0])
+                ),
+                replace_context=err,
+            )
+
+    pk_cols = mapper.primary_key
+    pk_keys = [col.key for col in pk_cols]
+
+    if index_elements is None:
+        index_cols = list(pk_cols)
+    else:
+        index_cols = cols_for_keys(index_elements)
+
+    if update_keys is not None:
+        update_cols = cols_for_keys(update_keys)
+    else:
+        update_cols = None
+        not_updated = set(col.key for col in index_cols).union(pk_keys)
+
+    connection = session_transaction.connection(base_mapper)
+    dialect = connection.dialect
+
+    if return_primary_keys:
+        primary_keys = []
+    else:
+        primary_keys = None
+
+    statements = {}
+
+    # None is rendered as NULL, so that an UPDATE of a conflicting row
+    # will also apply None values
+    records = _collect_insert_commands(
+        table,
+        ((None, mapping, mapper, connection) for mapping in mappings),
+        bulk=True,
+        render_nulls=True,
+    )
+
+    for keys, group in groupby(records, lambda rec: tuple(sorted(rec[2]))):
+        multiparams = [rec[2] for rec in group]
+
+        use_returning = return_primary_keys and not set(pk_keys).issubset(keys)
+        if use_returning and not dialect.implicit_returning:
+            raise sa_exc.InvalidRequestError(
+                "bulk_upsert() can only return primary key values that "
+                "aren't present in each mapping on a backend that "
+                "supports RETURNING"
+            )
+
+        if update_cols is not None:
+            # an attribute that's not present in the mappings isn't
+            # updated, rather than being set to NULL
+            set_cols = [col for col in update_cols if col.key in keys]
+        else:
+            set_cols = [
+                col
+                for col in table.c
+                if col.key in keys and col.key not in not_updated
+            ]
+
+        if use_returning and not set_cols:
+            # a conflicting row is only returned if it's updated; assign
+            # an index column the value it already has
+            set_cols = index_cols[0:1]
+
+        stmt_key = (tuple(col.key for col in set_cols), use_returning)
+        if stmt_key in statements:
+            statement = statements[stmt_key]
+        else:
+            statement = dialect._bulk_upsert_construct(
+                table, index_cols, set_cols
+            )
+            if statement is None:
+                raise sa_exc.InvalidRequestError(
+                    "The '%s' dialect does not support bulk_upsert()"
+                    % dialect.name
+                )
+            if use_returning:
+                statement = statement.return_defaults(*pk_cols)
+            statements[stmt_key] = statement
+
+        if not use_returning:
+            cached_connections[connection].execute(statement, multiparams)
+            if return_primary_keys:
+                primary_keys.extend(
+                    tuple(params[key] for key in pk_keys)
+                    for params in multiparams
+                )
+        elif dialect.insert_executemany_returning or len(multiparams) == 1:
+            result = cached_connections[connection].execute(
+                statement, multiparams
+            )
+            primary_keys.extend(
+                tuple(row) for row in result.inserted_primary_key_rows
+            )
+        else:
+            for params in multiparams:
+                result = cached_connections[connection].execute(
+                    statement, params
+                )
+                primary_keys.append(tuple(result.inserted_primary_key))
+
+    return primary_keys
+
+
 def save_obj(base_mapper, states, uowtransaction, single=False):
     """Issue ``INSERT`` and/or ``UPDATE`` statements for a list
     of objects.
@@ -617,7 +762,7 @@ def _collect_update_commands(
         else:
             params = {}
             for propkey in set(propkey_to_col).intersection(
-                state.committed_state
+                state._committed_state
             ):
                 value = state_dict[propkey]
                 col = propkey_to_col[propkey]
@@ -805,6 +805,9 @@ class Query(
 
             :meth:`_query.Query.enable_eagerloads`
 
+            :ref:`session_expunge_per_chunk` - keep the :class:`.Session`
+            from growing along with the result
+
         """
         self.load_options += {"_yield_per": count}
         self._execution_options = self._execution_options.union(
@@ -1511,6 +1514,17 @@ class Query(
         ``yield_per=<value>`` - equivalent to using
         :meth:`_orm.Query.yield_per`
 
+        ``readonly=True`` - objects are loaded in the :term:`detached` state
+        and are not added to the :class:`.Session`; see
+        :ref:`session_readonly_loading`.
+
+        ``expunge_per_chunk=True`` - used with ``yield_per``, objects added
+        to the :class:`.Session` by each chunk of rows are expunged when the
+        next chunk is fetched; see :ref:`session_expunge_per_chunk`.
+
+        .. versionadded:: 1.4 - added the ``readonly`` and
+           ``expunge_per_chunk`` options
+
         Note that the ``stream_results`` execution option is enabled
         automatically if the :meth:`~sqlalchemy.orm.query.Query.yield_per()`
         method or execution option is used.
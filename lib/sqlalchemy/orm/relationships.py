@@ -155,6 +155,7 @@ class RelationshipProperty(StrategizedProperty):
         info=None,
         omit_join=None,
         sync_backref=None,
+        selectin_chunksize=None,
     ):
         """Provide a relationship between two mapped classes.
 
@@ -588,6 +589,13 @@ class RelationshipProperty(StrategizedProperty):
             first accessed, using a separate SELECT statement, or identity map
             fetch for simple many-to-one references.
 
+          * ``batch`` - items should be loaded lazily when the property is
+            first accessed, for all of the objects loaded along with the
+            parent by the same query, using SELECT statements which specify
+            the parents' primary key identifiers using an IN clause.
+
+            .. versionadded:: 1.4
+
           * ``immediate`` - items should be loaded as the parents are loaded,
             using a separate SELECT statement, or identity map fetch for
             simple many-to-one references.
@@ -862,6 +870,20 @@ class RelationshipProperty(StrategizedProperty):
 
               :ref:`relationship_primaryjoin`
 
+        :param selectin_chunksize:
+          the number of parent primary key values to send in the IN clause
+          of each SELECT statement emitted by "selectin" or "batch" loading
+          of this relationship.  Defaults to ``None``, which uses the
+          default of the dialect in use, typically 500.  May also be set
+          for an individual query using the
+          :paramref:`_orm.selectinload.chunksize` parameter.
+
+          .. versionadded:: 1.4
+
+          .. seealso::
+
+            :ref:`selectin_chunksize`
+
         :param single_parent:
           When True, installs a validator which will prevent objects
           from being associated with more than one parent at a time.
@@ -1025,6 +1047,7 @@ class RelationshipProperty(StrategizedProperty):
             )
 
         self.omit_join = omit_join
+        self.selectin_chunksize = selectin_chunksize
         self.local_remote_pairs = _local_remote_pairs
         self.bake_queries = bake_queries
         self.load_on_pending = load_on_pending
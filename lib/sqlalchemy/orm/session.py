@@ -858,6 +858,7 @@ class Session(_SessionClassMethods):
         "bulk_save_objects",
         "bulk_insert_mappings",
         "bulk_update_mappings",
+        "bulk_upsert_mappings",
         "merge",
         "query",
         "refresh",
@@ -888,6 +889,7 @@ class Session(_SessionClassMethods):
         enable_baked_queries=True,
         info=None,
         query_cls=None,
+        concurrent_flush=False,
     ):
         r"""Construct a new Session.
 
@@ -963,6 +965,25 @@ class Session(_SessionClassMethods):
            :class:`.sessionmaker` function, and is not sent directly to the
            constructor for ``Session``.
 
+        :param concurrent_flush: Defaults to ``False``.  When ``True``, and
+           the objects being flushed are mapped to more than one bind, such
+           as when using the :paramref:`.Session.binds` parameter, the
+           INSERT, UPDATE and DELETE statements for each bind are emitted
+           simultaneously, wherever the unit of work determines that the
+           operations don't depend on each other.   The connection for each
+           bind is procured up front in the calling thread; the statements
+           are then invoked in a worker thread per bind, or when the session
+           is run within the :ref:`asyncio <asyncio_toplevel>` extension,
+           within a greenlet per bind via ``asyncio.gather()``.   For the
+           threaded form, the DBAPI in use must allow a connection to be used
+           from a thread other than the one that created it.   Flushes which
+           involve a single bind, or which make use of a
+           ``connection_callable`` such as that of the horizontal sharding
+           extension, are not affected.   Requires Python 3; on Python 2,
+           :class:`.ArgumentError` is raised.
+
+           .. versionadded:: 1.4
+
         :param enable_baked_queries: defaults to ``True``.  A flag consumed
            by the :mod:`sqlalchemy.ext.baked` extension to determine if
            "baked queries" should be cached, as is the normal operation
@@ -1054,6 +1075,11 @@ class Session(_SessionClassMethods):
         self.autoflush = autoflush
         self.expire_on_commit = expire_on_commit
         self.enable_baked_queries = enable_baked_queries
+        if concurrent_flush and util.py2k:
+            raise sa_exc.ArgumentError(
+                "concurrent_flush requires Python 3 or greater"
+            )
+        self.concurrent_flush = concurrent_flush
 
         if autocommit:
             if future:
@@ -3564,6 +3590,120 @@ class Session(_SessionClassMethods):
             mapper, mappings, True, False, False, False, False
         )
 
+    def bulk_upsert_mappings(
+        self,
+        mapper,
+        mappings,
+        index_elements=None,
+        update_keys=None,
+        return_primary_keys=False,
+    ):
+        """Perform a bulk "upsert" of the given list of mapping dictionaries.
+
+        Each row is INSERTed; a row which conflicts with an existing row
+        on the given index elements instead UPDATEs that row.  The statement
+        is rendered using the upsert construct of the target database,
+        i.e. ``INSERT..ON CONFLICT`` for PostgreSQL and SQLite and
+        ``INSERT..ON DUPLICATE KEY UPDATE`` for MySQL, and rows which
+        include the same set of keys are batched together into a single
+        "executemany" call, which on dialects such as psycopg2 may be further
+        rendered as INSERT statements with multiple-row VALUES clauses.
+
+        E.g.::
+
+            session.bulk_upsert_mappings(
+                User,
+                [
+                    {"id": 1, "name": "u1", "fullname": "User One"},
+                    {"id": 2, "name": "u2", "fullname": "User Two"},
+                ]
+            )
+
+        .. versionadded:: 1.4
+
+        .. warning::
+
+            As is the case for :meth:`.Session.bulk_insert_mappings`, the
+            bulk upsert feature omits most unit-of-work features; objects
+            present in the :class:`.Session` are not refreshed, and
+            Python-side column defaults and "onupdate" values are not
+            applied.  **Please read the list of caveats at**
+            :ref:`bulk_operations`.
+
+        :param mapper: a mapped class, or the actual :class:`_orm.Mapper`
+         object, representing the single kind of object represented within
+         the mapping list.  The mapper must be against a single table and
+         may not make use of a version id column.
+
+        :param mappings: a sequence of dictionaries, each one containing the
+         state of the mapped row to be inserted or updated, in terms of the
+         attribute names on the mapped class.  A value of ``None`` is
+         rendered as NULL.
+
+        :param index_elements: a sequence of attribute names which make up a
+         unique constraint or index of the table, whose conflict causes an
+         UPDATE rather than an INSERT.  Defaults to the primary key
+         attributes of the mapper.  MySQL upserts on a conflict with any
+         unique key, so this parameter is not used there, except for
+         the "do nothing" case described below.
+
+        :param update_keys: a sequence of attribute names whose values are
+         applied to a conflicting row.  Defaults to all attributes
+         present in the mapping which aren't part of the primary key or
+         the ``index_elements``.  Attributes named here which aren't
+         present in a particular mapping aren't updated for that row.  If
+         this resolves to an empty list, conflicting rows are skipped.
+
+        :param return_primary_keys: when True, a list of primary key tuples
+         is returned, one for each mapping in the order given.  Mappings
+         which include the primary key attributes return those values as
+         given.  Otherwise, such as when upserting on a unique constraint
+         other than the primary key, the values are fetched using
+         RETURNING, which requires a backend such as PostgreSQL that
+         supports it; in this case a conflicting row that would otherwise
+         be skipped receives a no-op UPDATE so that its primary key is
+         returned.
+
+        :return: a list of primary key tuples, if
+         :paramref:`.Session.bulk_upsert_mappings.return_primary_keys`
+         is set, else None.
+
+        .. seealso::
+
+            :ref:`bulk_operations`
+
+            :meth:`.Session.bulk_insert_mappings`
+
+            :ref:`postgresql_insert_on_conflict`
+
+            :ref:`mysql_insert_on_duplicate_key_update`
+
+            :ref:`sqlite_on_conflict_insert`
+
+        """
+        mapper = _class_to_mapper(mapper)
+        self._flushing = True
+
+        transaction = self.begin(_subtrans=True)
+        try:
+            primary_keys = persistence._bulk_upsert(
+                mapper,
+                mappings,
+                transaction,
+                index_elements,
+                update_keys,
+                return_primary_keys,
+            )
+            transaction.commit()
+
+        except:
+            with util.safe_reraise():
+                transaction.rollback(_capture_exception=True)
+        finally:
+            self._flushing = False
+
+        return primary_keys
+
     def _bulk_save_mappings(
         self,
         mapper,
@@ -4056,7 +4196,7 @@ def make_transient(instance):
         s._expunge_states([state])
 
     # remove expired state
-    state.expired_attributes.clear()
+    del state.expired_attributes
 
     # remove deferred callables
     if state.callables:
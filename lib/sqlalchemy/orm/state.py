@@ -90,16 +90,57 @@ class InstanceState(interfaces.InspectionAttrInfo):
         self.class_ = obj.__class__
         self.manager = manager
         self.obj = weakref.ref(obj, self._cleanup)
-        self.committed_state = {}
-        self.expired_attributes = set()
 
-    expired_attributes = None
-    """The set of keys which are 'expired' to be loaded by
-       the manager's deferred scalar loader, assuming no pending
-       changes.
+    # per-instance collections for committed_state and expired_attributes
+    # are established by the public accessors below; internal code reads
+    # these directly, so that reads don't allocate a collection for an
+    # unmodified, unexpired object
+    _committed_state = util.EMPTY_DICT
+    _expired_attributes = util.EMPTY_SET
 
-       see also the ``unmodified`` collection which is intersected
-       against this set when a refresh operation occurs."""
+    @property
+    def committed_state(self):
+        """A dictionary of attribute keys mapped to their value as of the
+        last commit, for those attributes which have pending changes.
+
+        The dictionary is established when first accessed, and is
+        discarded again when the state is committed or expired.
+
+        """
+        if "_committed_state" not in self.__dict__:
+            self._committed_state = {}
+        return self._committed_state
+
+    @committed_state.setter
+    def committed_state(self, value):
+        self._committed_state = value
+
+    @committed_state.deleter
+    def committed_state(self):
+        self.__dict__.pop("_committed_state", None)
+
+    @property
+    def expired_attributes(self):
+        """The set of keys which are 'expired' to be loaded by
+        the manager's deferred scalar loader, assuming no pending
+        changes.
+
+        As is the case for :attr:`.InstanceState.committed_state`, the set
+        is established when first accessed.
+
+        see also the ``unmodified`` collection which is intersected
+        against this set when a refresh operation occurs."""
+        if "_expired_attributes" not in self.__dict__:
+            self._expired_attributes = set()
+        return self._expired_attributes
+
+    @expired_attributes.setter
+    def expired_attributes(self, value):
+        self._expired_attributes = value
+
+    @expired_attributes.deleter
+    def expired_attributes(self):
+        self.__dict__.pop("_expired_attributes", None)
 
     @util.memoized_property
     def attrs(self):
@@ -452,7 +493,6 @@ class InstanceState(interfaces.InspectionAttrInfo):
         state_dict.update(
             (k, self.__dict__[k])
             for k in (
-                "committed_state",
                 "_pending_mutations",
                 "modified",
                 "expired",
@@ -461,11 +501,14 @@ class InstanceState(interfaces.InspectionAttrInfo):
                 "parents",
                 "load_options",
                 "class_",
-                "expired_attributes",
                 "info",
             )
             if k in self.__dict__
         )
+        if "_committed_state" in self.__dict__:
+            state_dict["committed_state"] = self._committed_state
+        if "_expired_attributes" in self.__dict__:
+            state_dict["expired_attributes"] = self._expired_attributes
         if self.load_path:
             state_dict["load_path"] = self.load_path.serialize()
 
@@ -485,9 +528,15 @@ class InstanceState(interfaces.InspectionAttrInfo):
             self.obj = None
             self.class_ = state_dict["class_"]
 
-        self.committed_state = state_dict.get("committed_state", {})
-        self._pending_mutations = state_dict.get("_pending_mutations", {})
-        self.parents = state_dict.get("parents", {})
+        if state_dict.get("committed_state"):
+            self.committed_state = state_dict["committed_state"]
+        self.__dict__.update(
+            [
+                (k, state_dict[k])
+                for k in ("_pending_mutations", "parents")
+                if state_dict.get(k)
+            ]
+        )
         self.modified = state_dict.get("modified", False)
         self.expired = state_dict.get("expired", False)
         if "info" in state_dict:
@@ -498,17 +547,17 @@ class InstanceState(interfaces.InspectionAttrInfo):
             try:
                 self.expired_attributes = state_dict["expired_attributes"]
             except KeyError:
-                self.expired_attributes = set()
                 # 0.9 and earlier compat
+                expired_attributes = set()
                 for k in list(self.callables):
                     if self.callables[k] is self:
-                        self.expired_attributes.add(k)
+                        expired_attributes.add(k)
                         del self.callables[k]
+                if expired_attributes:
+                    self.expired_attributes = expired_attributes
         else:
             if "expired_attributes" in state_dict:
                 self.expired_attributes = state_dict["expired_attributes"]
-            else:
-                self.expired_attributes = set()
 
         self.__dict__.update(
             [
@@ -538,7 +587,8 @@ class InstanceState(interfaces.InspectionAttrInfo):
         old = dict_.pop(key, None)
         if old is not None and self.manager[key].impl.collection:
             self.manager[key].impl._invalidate_collection(old)
-        self.expired_attributes.discard(key)
+        if key in self._expired_attributes:
+            self._expired_attributes.discard(key)
         if self.callables:
             self.callables.pop(key, None)
 
@@ -572,7 +622,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         self.expired = True
         if self.modified:
             modified_set.discard(self)
-            self.committed_state.clear()
+            self.__dict__.pop("_committed_state", None)
             self.modified = False
 
         self._strong_obj = None
@@ -583,9 +633,11 @@ class InstanceState(interfaces.InspectionAttrInfo):
         if "parents" in self.__dict__:
             del self.__dict__["parents"]
 
-        self.expired_attributes.update(
-            [impl.key for impl in self.manager._loader_impls]
-        )
+        loader_keys = [impl.key for impl in self.manager._loader_impls]
+        if "_expired_attributes" in self.__dict__:
+            self._expired_attributes.update(loader_keys)
+        else:
+            self._expired_attributes = set(loader_keys)
 
         if self.callables:
             # the per state loader callables we can remove here are
@@ -599,7 +651,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
             # again.   For the moment, as of 1.4 we also apply the same
             # treatment relationships now, that is, an instance level lazy
             # loader is reset in the same way as a column loader.
-            for k in self.expired_attributes.intersection(self.callables):
+            for k in self._expired_attributes.intersection(self.callables):
                 del self.callables[k]
 
         for k in self.manager._collection_impl_keys.intersection(dict_):
@@ -641,7 +693,8 @@ class InstanceState(interfaces.InspectionAttrInfo):
             ):
                 self._last_known_values[key] = old
 
-            self.committed_state.pop(key, None)
+            if key in self._committed_state:
+                del self._committed_state[key]
             if pending:
                 pending.pop(key, None)
 
@@ -657,7 +710,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         if not passive & SQL_OK:
             return PASSIVE_NO_RESULT
 
-        toload = self.expired_attributes.intersection(self.unmodified)
+        toload = self._expired_attributes.intersection(self.unmodified)
         toload = toload.difference(
             attr
             for attr in toload
@@ -670,7 +723,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         # instance state didn't have an identity,
         # the attributes still might be in the callables
         # dict.  ensure they are removed.
-        self.expired_attributes.clear()
+        self.__dict__.pop("_expired_attributes", None)
 
         return ATTR_WAS_SET
 
@@ -678,7 +731,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
     def unmodified(self):
         """Return the set of keys which have no uncommitted changes"""
 
-        return set(self.manager).difference(self.committed_state)
+        return set(self.manager).difference(self._committed_state)
 
     def unmodified_intersection(self, keys):
         """Return self.unmodified.intersection(keys)."""
@@ -686,7 +739,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         return (
             set(keys)
             .intersection(self.manager)
-            .difference(self.committed_state)
+            .difference(self._committed_state)
         )
 
     @property
@@ -699,7 +752,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
         """
         return (
             set(self.manager)
-            .difference(self.committed_state)
+            .difference(self._committed_state)
             .difference(self.dict)
         )
 
@@ -735,7 +788,7 @@ class InstanceState(interfaces.InspectionAttrInfo):
                     "Can't flag attribute '%s' modified; it's not present in "
                     "the object state" % attr.key
                 )
-            if attr.key not in self.committed_state or is_userland:
+            if attr.key not in self._committed_state or is_userland:
                 if collection:
                     if previous is NEVER_SET:
                         if attr.key in dict_:
@@ -781,14 +834,16 @@ class InstanceState(interfaces.InspectionAttrInfo):
         this step if a value was not populated in state.dict.
 
         """
-        for key in keys:
-            self.committed_state.pop(key, None)
+        if self._committed_state:
+            for key in keys:
+                self._committed_state.pop(key, None)
 
         self.expired = False
 
-        self.expired_attributes.difference_update(
-            set(keys).intersection(dict_)
-        )
+        if self._expired_attributes:
+            self._expired_attributes.difference_update(
+                set(keys).intersection(dict_)
+            )
 
         # the per-keys commit removes object-level callables,
         # while that of commit_all does not.  it's not clear
@@ -825,12 +880,14 @@ class InstanceState(interfaces.InspectionAttrInfo):
         for state, dict_ in iter_:
             state_dict = state.__dict__
 
-            state.committed_state.clear()
+            if "_committed_state" in state_dict:
+                del state_dict["_committed_state"]
 
             if "_pending_mutations" in state_dict:
                 del state_dict["_pending_mutations"]
 
-            state.expired_attributes.difference_update(dict_)
+            if "_expired_attributes" in state_dict:
+                state._expired_attributes.difference_update(dict_)
 
             if instance_dict and state.modified:
                 instance_dict._modified.discard(state)
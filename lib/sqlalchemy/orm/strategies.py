@@ -39,6 +39,7 @@ from .. import inspect
 from .. import log
 from .. import sql
 from .. import util
+from ..sql import sqltypes
 from ..sql import util as sql_util
 from ..sql import visitors
 
@@ -1069,6 +1070,182 @@ class LoadLazyAttribute(object):
         return strategy._load_for_state(state, passive)
 
 
+@log.class_logger
+@relationships.RelationshipProperty.strategy_for(lazy="batch")
+class BatchLazyLoader(LazyLoader):
+    """Provide loading behavior for a :class:`.RelationshipProperty`
+    with "lazy='batch'", that is loads when first accessed, for all of the
+    objects loaded by the same query at once.
+
+    """
+
+    __slots__ = ()
+
+    def create_row_processor(
+        self,
+        context,
+        query_entity,
+        path,
+        loadopt,
+        mapper,
+        result,
+        adapter,
+        populators,
+    ):
+        if (
+            context.refresh_state
+            or not self.parent.class_manager[self.key].impl.supports_population
+        ):
+            return super(BatchLazyLoader, self).create_row_processor(
+                context,
+                query_entity,
+                path,
+                loadopt,
+                mapper,
+                result,
+                adapter,
+                populators,
+            )
+
+        # one loader is shared among all the objects that this query loads
+        # along this path; the first one to have its attribute accessed
+        # loads the attribute for all of them, in the same way as
+        # selectinload().
+        batch = context.attributes.get(("batch_lazyload", path, self.key))
+        if batch is None:
+            batch_path = (
+                context.compile_state.current_path
+                or orm_util.PathRegistry.root
+            ) + path
+
+            with_poly_entity = path[self.parent_property].get(
+                context.attributes, "path_with_polymorphic", None
+            )
+            if with_poly_entity is not None:
+                effective_entity = inspect(with_poly_entity)
+            else:
+                effective_entity = self.entity
+
+            batch = context.attributes[
+                ("batch_lazyload", path, self.key)
+            ] = LoadBatchLazyAttribute(
+                self.key,
+                self,
+                batch_path,
+                effective_entity,
+                context.compile_state.select_statement,
+                getattr(result, "dialect", None),
+            )
+
+        set_lazy_callable = InstanceState._instance_level_callable_processor(
+            mapper.class_manager, batch, self.key
+        )
+        key = self.key
+
+        def add_to_batch(state, dict_, row):
+            set_lazy_callable(state, dict_, row)
+            # the value may be present already for populate_existing
+            dict_.pop(key, None)
+            batch.states.append(state)
+
+        populators["new"].append((self.key, add_to_batch))
+
+    def _load_for_batch(self, batch, state, passive):
+        if self.use_get:
+            # a many-to-one may be present in the identity map already,
+            # in which case no SQL is needed
+            value = self._load_for_state(state, passive ^ attributes.SQL_OK)
+            if value is not attributes.PASSIVE_NO_RESULT:
+                return value
+
+        session = _state_session(state)
+        if state.key is None or session is None:
+            return self._load_for_state(state, passive)
+
+        key = self.key
+        states, batch.states = batch.states, []
+        to_load = [
+            (batch_state, False)
+            for batch_state in states
+            if batch_state.key is not None
+            and batch_state.session_id == state.session_id
+            and batch_state.obj() is not None
+            and batch_state.callables
+            and batch_state.callables.get(key) is batch
+            and key not in batch_state.dict
+            and key not in batch_state._committed_state
+        ]
+
+        if to_load:
+            self.parent_property._get_strategy(
+                (("lazy", "selectin"),)
+            )._load_for_states(
+                session,
+                batch.orig_query,
+                False,
+                batch.path,
+                to_load,
+                batch.effective_entity,
+                batch.dialect,
+            )
+
+        if key in state.dict:
+            return attributes.ATTR_WAS_SET
+        else:
+            return self._load_for_state(state, passive)
+
+
+class LoadBatchLazyAttribute(LoadLazyAttribute):
+    """loader object used by BatchLazyLoader, shared among the objects
+    loaded by a particular query.
+
+    When serialized, the other objects are not retained and the attribute
+    is loaded for its own object only.
+
+    """
+
+    def __init__(
+        self,
+        key,
+        initiating_strategy,
+        path,
+        effective_entity,
+        orig_query,
+        dialect,
+    ):
+        super(LoadBatchLazyAttribute, self).__init__(key, initiating_strategy)
+        self.path = path
+        self.effective_entity = effective_entity
+        self.orig_query = orig_query
+        self.dialect = dialect
+        self.states = []
+
+    def __getstate__(self):
+        return {
+            "key": self.key,
+            "strategy_key": self.strategy_key,
+            "path": None,
+            "effective_entity": None,
+            "orig_query": None,
+            "dialect": None,
+            "states": [],
+        }
+
+    def __call__(self, state, passive=attributes.PASSIVE_OFF):
+        if (
+            not self.states
+            or not passive & attributes.SQL_OK
+            or not passive & attributes.RELATED_OBJECT_OK
+            or passive & attributes.NO_AUTOFLUSH
+            or passive & attributes.LOAD_AGAINST_COMMITTED
+        ):
+            return super(LoadBatchLazyAttribute, self).__call__(state, passive)
+
+        prop = state.manager.mapper._props[self.key]
+        strategy = prop._strategies[self.strategy_key]
+        return strategy._load_for_batch(self, state, passive)
+
+
 class PostLoader(AbstractRelationshipLoader):
     """A relationship loader that emits a second SELECT statement."""
 
@@ -1427,6 +1604,8 @@ class SubqueryLoader(PostLoader):
 
             if self.load_options._populate_existing:
                 q = q.populate_existing()
+            if self.load_options._readonly:
+                q = q.execution_options(readonly=True)
             # to work with baked query, the parameters may have been
             # updated since this query was created, so take these into account
 
@@ -2588,6 +2767,12 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                     return
             elif selectin_path_w_prop.contains_mapper(self.mapper):
                 return
+
+        if loadopt:
+            chunksize = loadopt.local_opts.get("chunksize", None)
+        else:
+            chunksize = None
+
         loading.PostLoad.callable_for_path(
             context,
             selectin_path,
@@ -2595,14 +2780,49 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             self.parent_property,
             self._load_for_path,
             effective_entity,
+            getattr(result, "dialect", None),
+            chunksize,
         )
 
     def _load_for_path(
-        self, context, path, states, load_only, effective_entity
+        self,
+        context,
+        path,
+        states,
+        load_only,
+        effective_entity,
+        dialect,
+        chunksize,
     ):
         if load_only and self.key not in load_only:
             return
 
+        self._load_for_states(
+            context.session,
+            context.compile_state.select_statement,
+            context.populate_existing,
+            path,
+            states,
+            effective_entity,
+            dialect,
+            chunksize,
+            context.readonly_identity_map is not None,
+            context.chunk_states,
+        )
+
+    def _load_for_states(
+        self,
+        session,
+        orig_query,
+        populate_existing,
+        path,
+        states,
+        effective_entity,
+        dialect=None,
+        chunksize=None,
+        readonly=False,
+        chunk_states=None,
+    ):
         query_info = self._query_info
 
         if query_info.load_only_child:
@@ -2650,6 +2870,34 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         pk_cols = query_info.pk_cols
         in_expr = query_info.in_expr
 
+        # the number of keys per SELECT is given by the loader option, the
+        # relationship, or the dialect of the parent query's result, in that
+        # order.
+        if chunksize is None:
+            chunksize = self.parent_property.selectin_chunksize
+        if chunksize is None:
+            if dialect is not None:
+                chunksize = dialect.in_list_chunksize
+            else:
+                chunksize = self._chunksize
+
+        use_any = (
+            query_info.zero_idx
+            and dialect is not None
+            and dialect.in_list_use_any
+        )
+        # = ANY() sends the keys as a single array parameter; otherwise
+        # each key is one bound parameter per primary key column
+        if (
+            not use_any
+            and dialect is not None
+            and dialect.in_list_max_parameters
+        ):
+            chunksize = min(
+                chunksize, dialect.in_list_max_parameters // len(pk_cols)
+            )
+        chunksize = max(chunksize, 1)
+
         if not query_info.load_with_join:
             # in "omit join" mode, the primary key column and the
             # "in" expression are in terms of the related entity.  So
@@ -2695,16 +2943,36 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                 )
             )
 
-        q = q.add_criteria(
-            lambda q: q.filter(in_expr.in_(sql.bindparam("primary_keys")))
-        )
+        if use_any:
+            # send the keys as a single array parameter, so that the
+            # statement is the same for any number of keys; the parameter
+            # is CAST to an array of the key type, as DBAPIs such as
+            # psycopg2 otherwise send a list of strings as text[]
+            q = q.add_criteria(
+                lambda q: q.filter(
+                    in_expr
+                    == sql.any_(
+                        sql.cast(
+                            sql.bindparam(
+                                "primary_keys",
+                                type_=sqltypes.ARRAY(in_expr.type),
+                            ),
+                            sqltypes.ARRAY(in_expr.type),
+                        )
+                    )
+                )
+            )
+        else:
+            q = q.add_criteria(
+                lambda q: q.filter(in_expr.in_(sql.bindparam("primary_keys")))
+            )
 
         # a test which exercises what these comments talk about is
         # test_selectin_relations.py -> test_twolevel_selectin_w_polymorphic
         #
         # effective_entity above is given to us in terms of the cached
-        # statement, namely this one:
-        orig_query = context.compile_state.select_statement
+        # statement, namely orig_query, which is
+        # context.compile_state.select_statement.
 
         # the actual statement that was requested is this one:
         #  context_query = context.query
@@ -2742,11 +3010,14 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             )
         )
 
-        if context.populate_existing:
+        if populate_existing:
             q = q.add_criteria(
                 lambda q: q.execution_options(populate_existing=True)
             )
 
+        if readonly:
+            q = q.add_criteria(lambda q: q.execution_options(readonly=True))
+
         if self.parent_property.order_by:
             if not query_info.load_with_join:
                 eager_order_by = self.parent_property.order_by
@@ -2769,24 +3040,53 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                     )
                 )
 
+        if chunk_states is not None:
+            # related objects are expunged along with those of the
+            # "expunge_per_chunk" load which they were loaded for
+            execution_options = {"_sa_orm_chunk_states": chunk_states}
+        else:
+            execution_options = util.EMPTY_DICT
+
         if query_info.load_only_child:
             self._load_via_child(
-                our_states, none_states, query_info, q, context
+                our_states,
+                none_states,
+                query_info,
+                q,
+                session,
+                chunksize,
+                execution_options,
             )
         else:
-            self._load_via_parent(our_states, query_info, q, context)
+            self._load_via_parent(
+                our_states,
+                query_info,
+                q,
+                session,
+                chunksize,
+                execution_options,
+            )
 
-    def _load_via_child(self, our_states, none_states, query_info, q, context):
+    def _load_via_child(
+        self,
+        our_states,
+        none_states,
+        query_info,
+        q,
+        session,
+        chunksize,
+        execution_options,
+    ):
         uselist = self.uselist
 
         # this sort is really for the benefit of the unit tests
         our_keys = sorted(our_states)
         while our_keys:
-            chunk = our_keys[0 : self._chunksize]
-            our_keys = our_keys[self._chunksize :]
+            chunk = our_keys[0:chunksize]
+            our_keys = our_keys[chunksize:]
             data = {
                 k: v
-                for k, v in context.session.execute(
+                for k, v in session.execute(
                     q,
                     params={
                         "primary_keys": [
@@ -2794,6 +3094,7 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                             for key in chunk
                         ]
                     },
+                    execution_options=execution_options,
                     future=True,
                 ).unique()
             }
@@ -2823,13 +3124,15 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             # collection will be populated
             state.get_impl(self.key).set_committed_value(state, dict_, None)
 
-    def _load_via_parent(self, our_states, query_info, q, context):
+    def _load_via_parent(
+        self, our_states, query_info, q, session, chunksize, execution_options,
+    ):
         uselist = self.uselist
         _empty_result = () if uselist else None
 
         while our_states:
-            chunk = our_states[0 : self._chunksize]
-            our_states = our_states[self._chunksize :]
+            chunk = our_states[0:chunksize]
+            our_states = our_states[chunksize:]
 
             primary_keys = [
                 key[0] if query_info.zero_idx else key
@@ -2838,8 +3141,11 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
 
             data = collections.defaultdict(list)
             for k, v in itertools.groupby(
-                context.session.execute(
-                    q, params={"primary_keys": primary_keys}, future=True
+                session.execute(
+                    q,
+                    params={"primary_keys": primary_keys},
+                    execution_options=execution_options,
+                    future=True,
                 ).unique(),
                 lambda x: x[0],
             ):
@@ -1264,7 +1264,7 @@ def subqueryload(*keys):
 
 
 @loader_option()
-def selectinload(loadopt, attr):
+def selectinload(loadopt, attr, chunksize=None):
     """Indicate that the given attribute should be loaded using
     SELECT IN eager loading.
 
@@ -1285,6 +1285,15 @@ def selectinload(loadopt, attr):
         query(Order).options(
             lazyload(Order.items).selectinload(Item.keywords))
 
+    :param chunksize: the number of parent primary key values to send in
+     the IN clause of each SELECT statement, overriding that of
+     :paramref:`_orm.relationship.selectin_chunksize` and the default of
+     the dialect in use::
+
+        query(User).options(selectinload(User.orders, chunksize=2000))
+
+     .. versionadded:: 1.4
+
     .. versionadded:: 1.2
 
     .. seealso::
@@ -1293,13 +1302,18 @@ def selectinload(loadopt, attr):
 
         :ref:`selectin_eager_loading`
 
+        :ref:`selectin_chunksize`
+
     """
-    return loadopt.set_relationship_strategy(attr, {"lazy": "selectin"})
+    loader = loadopt.set_relationship_strategy(attr, {"lazy": "selectin"})
+    if chunksize is not None:
+        loader.local_opts["chunksize"] = chunksize
+    return loader
 
 
 @selectinload._add_unbound_fn
-def selectinload(*keys):
-    return _UnboundLoad._from_keys(_UnboundLoad.selectinload, keys, False, {})
+def selectinload(*keys, **kw):
+    return _UnboundLoad._from_keys(_UnboundLoad.selectinload, keys, False, kw)
 
 
 @loader_option()
@@ -1353,6 +1367,36 @@ def immediateload(*keys):
     return _UnboundLoad._from_keys(_UnboundLoad.immediateload, keys, False, {})
 
 
+@loader_option()
+def batchload(loadopt, attr):
+    """Indicate that the given attribute should be loaded using "batch"
+    lazy loading.
+
+    The attribute is loaded when first accessed, as with :func:`.lazyload`;
+    however, it is loaded at that time for all of the objects which were
+    loaded by the same query and have not yet loaded it, using the same
+    SELECT..IN approach as :func:`.selectinload`.
+
+    This function is part of the :class:`_orm.Load` interface and supports
+    both method-chained and standalone operation.
+
+    .. versionadded:: 1.4
+
+    .. seealso::
+
+        :ref:`loading_toplevel`
+
+        :ref:`batch_lazy_loading`
+
+    """
+    return loadopt.set_relationship_strategy(attr, {"lazy": "batch"})
+
+
+@batchload._add_unbound_fn
+def batchload(*keys):
+    return _UnboundLoad._from_keys(_UnboundLoad.batchload, keys, False, {})
+
+
 @loader_option()
 def noload(loadopt, attr):
     """Indicate that the given relationship attribute should remain unloaded.
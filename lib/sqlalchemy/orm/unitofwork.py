@@ -13,12 +13,17 @@ organizes them in order of dependency, and executes.
 
 """
 
+import collections
+import functools
+
 from . import attributes
 from . import exc as orm_exc
 from . import util as orm_util
 from .. import event
 from .. import util
 from ..util import topological
+from ..util.concurrency import greenlet_gather
+from ..util.concurrency import in_greenlet
 
 
 def _warn_for_cascade_backrefs(state, prop):
@@ -430,7 +435,15 @@ class UOWTransaction(object):
         # print "\nCOUNT OF POSTSORT ACTIONS", len(postsort_actions)
 
         # execute
-        if self.cycles:
+        if (
+            self.session.concurrent_flush
+            and not self.session.connection_callable
+        ):
+            for set_ in topological.sort_as_subsets(
+                self.dependencies, postsort_actions
+            ):
+                self._execute_concurrently(set_)
+        elif self.cycles:
             for set_ in topological.sort_as_subsets(
                 self.dependencies, postsort_actions
             ):
@@ -441,6 +454,61 @@ class UOWTransaction(object):
             for rec in topological.sort(self.dependencies, postsort_actions):
                 rec.execute(self)
 
+    def _execute_concurrently(self, set_):
+        """Execute a set of post sort actions which don't depend on each
+        other, running the persistence operations for each bind
+        simultaneously."""
+
+        local = set()
+        by_bind = collections.defaultdict(set)
+        for rec in set_:
+            mapper = getattr(rec, "mapper", None)
+            if mapper is None:
+                local.add(rec)
+            else:
+                by_bind[self.session.get_bind(mapper.base_mapper)].add(rec)
+
+        # dependency processors may emit SQL for any mapper, such as for
+        # a many-to-many table or a lazy load; run them in this thread.
+        _execute_aggregates(self, local)
+
+        if len(by_bind) < 2:
+            for recs in by_bind.values():
+                _execute_aggregates(self, recs)
+            return
+
+        # procure each bind's connection up front, so that the
+        # transactional state of the Session is only ever modified from
+        # the calling thread.
+        for recs in by_bind.values():
+            self.transaction.connection(next(iter(recs)).mapper.base_mapper)
+
+        fns = [
+            functools.partial(_execute_aggregates, self, recs)
+            for recs in by_bind.values()
+        ]
+
+        if in_greenlet():
+            # run all binds to completion before raising, as below
+            for result in greenlet_gather(fns, return_exceptions=True):
+                if isinstance(result, BaseException):
+                    raise result
+            return
+
+        from concurrent import futures
+
+        executor = futures.ThreadPoolExecutor(max_workers=len(fns))
+        try:
+            submitted = [executor.submit(fn) for fn in fns]
+
+            # wait for all binds to complete, so that no connection is still
+            # in use if the flush is to be rolled back
+            futures.wait(submitted)
+            for future in submitted:
+                future.result()
+        finally:
+            executor.shutdown(wait=False)
+
     def finalize_flush_changes(self):
         """Mark processed objects as clean / deleted after a successful
         flush().
@@ -463,6 +531,12 @@ class UOWTransaction(object):
             self.session._register_persistent(other)
 
 
+def _execute_aggregates(uow, recs):
+    while recs:
+        n = recs.pop()
+        n.execute_aggregate(uow, recs)
+
+
 class IterateMappersMixin(object):
     def _mappers(self, uow):
         if self.fromparent:
@@ -561,6 +561,58 @@ class _ConnectionRecord(object):
             self.__connect()
         return self.connection
 
+    def _maintain(self, recycle_margin, ping):
+        """Recycle, reconnect or ping the DBAPI connection of a record
+        that's idle in the pool, on behalf of a pool's maintenance task.
+
+        Connections are recycled ahead of time if they will exceed the
+        pool's recycle time within ``recycle_margin`` seconds.  A connection
+        that passes a ping is marked as fresh, so that pre-ping doesn't
+        need to take place on its next checkout.
+
+        """
+        pool = self.__pool
+        reconnect = False
+
+        if self.connection is None:
+            reconnect = True
+        elif (
+            pool._recycle > -1
+            and time.time() - self.starttime > pool._recycle - recycle_margin
+        ):
+            pool.logger.info(
+                "Connection %r is near its timeout; recycling",
+                self.connection,
+            )
+            reconnect = True
+        elif (
+            pool._invalidate_time > self.starttime
+            or self._soft_invalidate_time > self.starttime
+        ):
+            pool.logger.info(
+                "Connection %r invalidated; recycling", self.connection
+            )
+            reconnect = True
+        elif ping and not self.fresh:
+            if not pool._dialect.do_ping(self.connection):
+                pool.logger.info(
+                    "Pool maintenance ping on connection %r failed, "
+                    "will invalidate pool",
+                    self.connection,
+                )
+                if pool._invalidate_time < self.starttime:
+                    pool._invalidate_time = time.time()
+                self.invalidate()
+                reconnect = True
+            else:
+                self.fresh = True
+
+        if reconnect:
+            if self.connection is not None:
+                self.__close()
+            self.info.clear()
+            self.__connect()
+
     def __close(self):
         self.finalize_callback.clear()
         if self.__pool.dispatch.close:
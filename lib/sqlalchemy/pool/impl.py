@@ -21,6 +21,9 @@ from .. import util
 from ..util import chop_traceback
 from ..util import queue as sqla_queue
 from ..util import threading
+from ..util.concurrency import asyncio
+from ..util.concurrency import await_only
+from ..util.concurrency import greenlet_spawn
 
 
 class QueuePool(Pool):
@@ -42,6 +45,8 @@ class QueuePool(Pool):
         max_overflow=10,
         timeout=30,
         use_lifo=False,
+        min_idle=0,
+        maintenance_interval=None,
         **kw
     ):
         r"""
@@ -90,6 +95,42 @@ class QueuePool(Pool):
 
             :ref:`pool_disconnects`
 
+        :param min_idle: minimum number of idle connections to maintain in
+          the pool.  Once the pool is in use, whenever a checkout leaves
+          fewer than this number of connections idle in the pool, new
+          connections are opened in the background to make up the
+          difference, so that they are ready for subsequent checkouts.
+          Connections that were invalidated while checked out are discarded
+          on return, rather than being reconnected within their next
+          checkout.  The value is limited to ``pool_size``.  Defaults to
+          zero, meaning connections are only opened on demand.
+
+          .. versionadded:: 1.4
+
+          .. seealso::
+
+            :meth:`.QueuePool.prewarm`
+
+            :ref:`pool_prewarm`
+
+        :param maintenance_interval: if set, the number of seconds between
+          runs of a background maintenance task, which takes care of idle
+          connections in the pool ahead of their next checkout.  Each run
+          reconnects connections that were invalidated, as well as those
+          that would exceed the :paramref:`_pool.Pool.recycle` time before
+          the next run.  If :paramref:`_pool.Pool.pre_ping` is enabled,
+          the remaining idle connections are pinged, and those that pass
+          are not pinged again on their next checkout.  The task runs in a
+          daemon thread, or for :class:`.AsyncAdaptedQueuePool` in a task
+          on the event loop.  It is started by the first checkout and is
+          stopped by :meth:`.dispose`.
+
+          .. versionadded:: 1.4
+
+          .. seealso::
+
+            :ref:`pool_maintenance`
+
         :param \**kw: Other keyword arguments including
           :paramref:`_pool.Pool.recycle`, :paramref:`_pool.Pool.echo`,
           :paramref:`_pool.Pool.reset_on_return` and others are passed to the
@@ -102,8 +143,218 @@ class QueuePool(Pool):
         self._max_overflow = max_overflow
         self._timeout = timeout
         self._overflow_lock = threading.Lock()
+        if pool_size:
+            min_idle = min(min_idle, pool_size)
+        self._min_idle = min_idle
+        self._prewarm_lock = threading.Lock()
+        self._prewarm_worker = None
+        self._maintenance_interval = maintenance_interval
+        self._maintenance_worker = None
+
+    def prewarm(self, n=None, background=False):
+        """Open new connections so that at least the given number of
+        connections are idle in the pool.
+
+        The pool otherwise opens connections only as they are checked out,
+        so that after the application starts, or after :meth:`.dispose`
+        is called, the first burst of checkouts each has to wait for a new
+        database connection.  Calling this method ahead of time moves that
+        cost out of the path of those checkouts.
+
+        :param n: the number of idle connections to have in the pool.
+          Defaults to ``pool_size``, and is limited to ``pool_size`` as
+          well as by the number of connections the pool allows overall.
+
+        :param background: if True, connections are opened in a background
+          thread, or for :class:`.AsyncAdaptedQueuePool` in a task on the
+          event loop, and this method returns immediately.  Errors raised
+          while connecting are logged rather than raised.
+
+        :return: the number of connections opened, or None if
+          ``background`` is True.
+
+        .. versionadded:: 1.4
+
+        .. seealso::
+
+            :paramref:`.QueuePool.min_idle`
+
+            :ref:`pool_prewarm`
+
+        """
+        size = self.size()
+        if n is None:
+            n = size
+        elif size:
+            n = min(n, size)
+
+        if background:
+            self._spawn_prewarm(n)
+            return None
+        else:
+            return self._prewarm(n)
+
+    def _prewarm(self, n, stopped=None):
+        created = 0
+        while (
+            (stopped is None or not stopped())
+            and self._pool.qsize() < n
+            and self._inc_overflow()
+        ):
+            try:
+                rec = self._create_connection()
+            except:
+                with util.safe_reraise():
+                    self._dec_overflow()
+
+            # dispose() resets the overflow count, which accounts for a
+            # connection that was being opened when the pool was disposed
+            if stopped is not None and stopped():
+                rec.close()
+                break
+            try:
+                self._pool.put(rec, False)
+            except sqla_queue.Full:
+                try:
+                    rec.close()
+                finally:
+                    self._dec_overflow()
+                break
+            created += 1
+
+            if stopped is not None and stopped():
+                # the pool was disposed after the check above; if the
+                # record is still in the queue, it was put back too late
+                # for dispose() to close it
+                if self._pool.remove(rec):
+                    rec.close()
+                break
+        return created
+
+    def _prewarm_in_background(self, n):
+        # _spawn_prewarm() assigns the worker while holding the lock
+        with self._prewarm_lock:
+            worker = self._prewarm_worker
+
+        def stopped():
+            return worker is None or self._prewarm_worker is not worker
+
+        while True:
+            try:
+                created = self._prewarm(n, stopped)
+            except Exception:
+                created = 0
+                self.logger.error(
+                    "Exception opening connections in the background",
+                    exc_info=True,
+                )
+
+            # checkouts that took place while connections were being
+            # opened won't have started another worker, so check again
+            # before this one exits
+            with self._prewarm_lock:
+                if stopped():
+                    return
+                if not created or self._pool.qsize() >= n:
+                    self._prewarm_worker = None
+                    return
+
+    def _spawn_prewarm(self, n):
+        with self._prewarm_lock:
+            if self._prewarm_worker is None:
+                self._prewarm_worker = self._start_prewarm_worker(n)
+
+    def _start_prewarm_worker(self, n):
+        worker = threading.Thread(
+            target=self._prewarm_in_background, args=(n,)
+        )
+        worker.daemon = True
+        worker.start()
+        return worker
+
+    def _run_maintenance(self):
+        """Recycle, reconnect or ping the connections that are idle in
+        the pool."""
+
+        worker = self._maintenance_worker
+
+        # take out one record at a time, so that the others remain
+        # available to checkouts while a ping or reconnect is in progress.
+        # a record is put back at the end of the queue, so that once all
+        # of them are done, they're in their original order
+        for rec in self._pool.items():
+            if not self._pool.remove(rec):
+                # checked out in the meantime
+                continue
+
+            try:
+                rec._maintain(self._maintenance_interval, self._pre_ping)
+            except Exception:
+                self.logger.error(
+                    "Exception during pool maintenance", exc_info=True
+                )
+
+            self._do_return_conn(rec)
+
+            if worker is not None and self._maintenance_worker is not worker:
+                # the pool was disposed while the record was out of the
+                # queue.  dispose() stops maintenance before it empties the
+                # queue, so if the record is still there, it was put back
+                # too late for dispose() to close it
+                if self._pool.remove(rec):
+                    rec.close()
+                return
+
+        if self._min_idle and self._pool.qsize() < self._min_idle:
+            self._spawn_prewarm(self._min_idle)
+
+    def _run_maintenance_in_background(self):
+        try:
+            self._run_maintenance()
+        except Exception:
+            self.logger.error(
+                "Exception during pool maintenance", exc_info=True
+            )
+
+    def _start_maintenance(self):
+        with self._prewarm_lock:
+            if self._maintenance_worker is None:
+                self._maintenance_worker = self._start_maintenance_worker()
+
+    def _start_maintenance_worker(self):
+        stop = threading.Event()
+
+        def wait(interval):
+            return not stop.wait(interval)
+
+        worker = threading.Thread(
+            target=_maintenance_loop,
+            args=(weakref.ref(self), wait, self._maintenance_interval),
+        )
+        worker.daemon = True
+        worker.start()
+        return worker, stop.set
+
+    def _stop_maintenance(self):
+        with self._prewarm_lock:
+            worker, self._maintenance_worker = self._maintenance_worker, None
+        if worker is not None:
+            worker[1]()
+
+    def _stop_prewarm(self):
+        # a running worker notices that it's no longer the pool's worker,
+        # and stops once the connection it's opening, if any, is closed
+        with self._prewarm_lock:
+            self._prewarm_worker = None
 
     def _do_return_conn(self, conn):
+        if self._min_idle and conn.connection is None:
+            # an invalidated record; discard it so that a new connection
+            # is opened in the background to take its place, rather than
+            # reconnecting within the next checkout
+            self._dec_overflow()
+            self._spawn_prewarm(self._min_idle)
+            return
         try:
             self._pool.put(conn, False)
         except sqla_queue.Full:
@@ -113,6 +364,14 @@ class QueuePool(Pool):
                 self._dec_overflow()
 
     def _do_get(self):
+        rec = self._do_get_from_queue()
+        if self._min_idle and self._pool.qsize() < self._min_idle:
+            self._spawn_prewarm(self._min_idle)
+        if self._maintenance_interval and self._maintenance_worker is None:
+            self._start_maintenance()
+        return rec
+
+    def _do_get_from_queue(self):
         use_overflow = self._max_overflow > -1
 
         try:
@@ -125,7 +384,7 @@ class QueuePool(Pool):
             pass
         if use_overflow and self._overflow >= self._max_overflow:
             if not wait:
-                return self._do_get()
+                return self._do_get_from_queue()
             else:
                 raise exc.TimeoutError(
                     "QueuePool limit of size %d overflow %d reached, "
@@ -141,7 +400,7 @@ class QueuePool(Pool):
                 with util.safe_reraise():
                     self._dec_overflow()
         else:
-            return self._do_get()
+            return self._do_get_from_queue()
 
     def _inc_overflow(self):
         if self._max_overflow == -1:
@@ -169,6 +428,8 @@ class QueuePool(Pool):
             pool_size=self._pool.maxsize,
             max_overflow=self._max_overflow,
             timeout=self._timeout,
+            min_idle=self._min_idle,
+            maintenance_interval=self._maintenance_interval,
             recycle=self._recycle,
             echo=self.echo,
             logging_name=self._orig_logging_name,
@@ -178,6 +439,9 @@ class QueuePool(Pool):
         )
 
     def dispose(self):
+        self._stop_maintenance()
+        self._stop_prewarm()
+
         while True:
             try:
                 conn = self._pool.get(False)
@@ -220,6 +484,49 @@ class QueuePool(Pool):
 class AsyncAdaptedQueuePool(QueuePool):
     _queue_class = sqla_queue.AsyncAdaptedQueue
 
+    def _start_prewarm_worker(self, n):
+        # connections for asyncio drivers are opened within the event
+        # loop, so a task is used in place of a thread
+        return asyncio.get_event_loop().create_task(
+            greenlet_spawn(self._prewarm_in_background, n)
+        )
+
+    def _start_maintenance_worker(self):
+        # stopped using an event, as is the thread, rather than by
+        # cancelling the task, so that a pass which is in progress when
+        # the pool is disposed completes and closes the record it has out
+        # of the queue
+        stop = asyncio.Event()
+
+        def wait(interval):
+            try:
+                await_only(asyncio.wait_for(stop.wait(), interval))
+            except asyncio.TimeoutError:
+                return True
+            else:
+                return False
+
+        task = asyncio.get_event_loop().create_task(
+            greenlet_spawn(
+                _maintenance_loop,
+                weakref.ref(self),
+                wait,
+                self._maintenance_interval,
+            )
+        )
+        return task, stop.set
+
+
+def _maintenance_loop(pool_ref, wait, interval):
+    # refers to the pool weakly between runs, so that a pool which is
+    # no longer used can be garbage collected
+    while wait(interval):
+        pool = pool_ref()
+        if pool is None:
+            return
+        pool._run_maintenance_in_background()
+        del pool
+
 
 class NullPool(Pool):
 
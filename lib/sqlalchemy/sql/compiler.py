@@ -430,6 +430,14 @@ class Compiled(object):
 
     cache_key = None
     _gen_time = None
+    _compile_time = None
+
+    _schema_translate_cache_size = 100
+    """
+    maximum number of statement strings with a schema translate map
+    applied that are cached per compiled object.
+
+    """
 
     def __init__(
         self,
@@ -462,6 +470,7 @@ class Compiled(object):
 
 
         """
+        gen_start = util.perf_counter()
 
         self.dialect = dialect
         self.preparer = self.dialect.identifier_preparer
@@ -483,6 +492,7 @@ class Compiled(object):
                     self.string, schema_translate_map
                 )
         self._gen_time = util.perf_counter()
+        self._compile_time = self._gen_time - gen_start
 
     def _execute_on_connection(
         self, connection, multiparams, params, execution_options
@@ -507,6 +517,27 @@ class Compiled(object):
     def process(self, obj, **kwargs):
         return obj._compiler_dispatch(self, **kwargs)
 
+    @util.memoized_property
+    def _schema_translate_cache(self):
+        return util.LRUCache(self._schema_translate_cache_size)
+
+    def _render_schema_translates(self, statement, schema_translate_map):
+        """Apply the given schema translate map to a statement string
+        rendered by this compiled object.
+
+        The result is cached for each distinct statement string and
+        map, so that repeated executions against the same map don't need
+        to re-render the statement.
+
+        """
+        key = (statement, frozenset(schema_translate_map.items()))
+        cache = self._schema_translate_cache
+        translated = cache.get(key)
+        if translated is None:
+            rst = self.preparer._render_schema_translates
+            translated = cache[key] = rst(statement, schema_translate_map)
+        return translated
+
     def __str__(self):
         """Return the string text of the generated SQL or DDL."""
 
@@ -636,6 +667,13 @@ class SQLCompiler(Compiled):
 
     """
 
+    _expanded_state_cache_size = 100
+    """
+    maximum number of expanded statements cached per compiled object, keyed
+    on the lengths of the lists given for "expanding" parameters.
+
+    """
+
     _render_postcompile = False
     """
     whether to render out POSTCOMPILE params during the compile phase.
@@ -1037,8 +1075,47 @@ class SQLCompiler(Compiled):
         compiled object, for those values that are present."""
         return self.construct_params(_check=False)
 
+    @util.memoized_property
+    def _post_compile_bind_names(self):
+        """Ordered, unique names of "expanding" parameters, or None if
+        the expanded statement can't be cached because values are rendered
+        into it inline."""
+
+        if self.literal_execute_params or any(
+            parameter.literal_execute for parameter in self.post_compile_params
+        ):
+            return None
+
+        return util.unique_list(
+            name
+            for name in (
+                self.positiontup
+                if self.positional
+                else self.bind_names.values()
+            )
+            if self.binds[name] in self.post_compile_params
+        )
+
+    @util.memoized_property
+    def _expanded_state_cache(self):
+        return util.LRUCache(self._expanded_state_cache_size)
+
+    def _pad_expanding_parameters(self, parameters):
+        """Pad the lists given for "expanding" parameters up to the next
+        power of two, repeating the last value."""
+
+        for parameter in self.post_compile_params:
+            name = self.bind_names[parameter]
+            values = parameters.get(name)
+            if values:
+                size = 1 << (len(values) - 1).bit_length()
+                if size > len(values):
+                    parameters[name] = list(values) + [values[-1]] * (
+                        size - len(values)
+                    )
+
     def _process_parameters_for_postcompile(
-        self, parameters=None, _populate_self=False
+        self, parameters=None, _populate_self=False, _pad_expanding=False
     ):
         """handle special post compile parameters.
 
@@ -1051,11 +1128,45 @@ class SQLCompiler(Compiled):
           things like SQL Server "TOP N" where the driver does not accommodate
           N as a bound parameter.
 
+        When only "expanding" parameters are present, the expanded statement
+        is cached on this compiled object, keyed on the length of each list
+        of values, so that repeated executions with the same "shape" of
+        parameters only need to distribute the new values.
+
         """
 
         if parameters is None:
             parameters = self.construct_params()
 
+        if _pad_expanding:
+            self._pad_expanding_parameters(parameters)
+
+        post_compile_names = self._post_compile_bind_names
+        if post_compile_names is not None and not _populate_self:
+            cache_key = tuple(
+                (len(values), len(values[0]))
+                if values and isinstance(values[0], (tuple, list))
+                else (len(values), None)
+                for values in (parameters[name] for name in post_compile_names)
+            )
+            expanded_state = self._expanded_state_cache.get(cache_key)
+            if expanded_state is not None:
+                expansion = expanded_state.parameter_expansion
+                for name, expand_keys in expansion.items():
+                    values = parameters.pop(name)
+                    if values and isinstance(values[0], (tuple, list)):
+                        values = [
+                            value
+                            for tuple_element in values
+                            for value in tuple_element
+                        ]
+                    parameters.update(zip(expand_keys, values))
+                return expanded_state._replace(
+                    additional_parameters=parameters
+                )
+        else:
+            cache_key = None
+
         expanded_parameters = {}
         if self.positional:
             positiontup = []
@@ -1151,6 +1262,11 @@ class SQLCompiler(Compiled):
             expanded_parameters,
         )
 
+        if cache_key is not None:
+            self._expanded_state_cache[cache_key] = expanded_state._replace(
+                additional_parameters=None
+            )
+
         if _populate_self:
             # this is for the "render_postcompile" flag, which is not
             # otherwise used internally and is for end-user debugging and
@@ -4425,12 +4541,13 @@ class IdentifierPreparer(object):
 
     def _render_schema_translates(self, statement, schema_translate_map):
         d = schema_translate_map
-        if None in d:
-            d["_none"] = d[None]
 
         def replace(m):
             name = m.group(2)
-            effective_schema = d[name]
+            if name == "_none" and None in d:
+                effective_schema = d[None]
+            else:
+                effective_schema = d[name]
             if not effective_schema:
                 effective_schema = self.dialect.default_schema_name
                 if not effective_schema:
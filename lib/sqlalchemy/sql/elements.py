@@ -510,7 +510,7 @@ class ClauseElement(
         if elem_cache_key:
             cache_key, extracted_params = elem_cache_key
             key = (
-                dialect,
+                dialect._compiled_cache_identity or dialect,
                 cache_key,
                 tuple(column_keys),
                 bool(schema_translate_map),
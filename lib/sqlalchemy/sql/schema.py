@@ -579,6 +579,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         # this argument is only used with _init_existing()
         kwargs.pop("autoload_replace", True)
         _extend_on = kwargs.pop("_extend_on", None)
+        _reflect_info = kwargs.pop("_reflect_info", None)
 
         resolve_fks = kwargs.pop("resolve_fks", True)
         include_columns = kwargs.pop("include_columns", None)
@@ -607,6 +608,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
                 autoload_with,
                 include_columns,
                 _extend_on=_extend_on,
+                _reflect_info=_reflect_info,
                 resolve_fks=resolve_fks,
             )
 
@@ -622,6 +624,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         exclude_columns=(),
         resolve_fks=True,
         _extend_on=None,
+        _reflect_info=None,
     ):
         if autoload_with is None:
             autoload_with = _bind_or_error(
@@ -638,6 +641,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
             exclude_columns,
             resolve_fks,
             _extend_on=_extend_on,
+            _reflect_info=_reflect_info,
         )
 
     @property
@@ -668,6 +672,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         autoload_replace = kwargs.pop("autoload_replace", True)
         schema = kwargs.pop("schema", None)
         _extend_on = kwargs.pop("_extend_on", None)
+        _reflect_info = kwargs.pop("_reflect_info", None)
 
         if schema and schema != self.schema:
             raise exc.ArgumentError(
@@ -711,6 +716,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
                 exclude_columns,
                 resolve_fks,
                 _extend_on=_extend_on,
+                _reflect_info=_reflect_info,
             )
 
         self._extra_kwargs(**kwargs)
@@ -4410,6 +4416,12 @@ class MetaData(SchemaItem):
                     if extend_existing or name not in current
                 ]
 
+            # retrieve the catalog information for all of the tables
+            # to be loaded up front, rather than one table at a time
+            reflect_opts["_reflect_info"] = insp._get_reflection_info(
+                schema=schema, filter_names=load, **dialect_kwargs
+            )
+
             for name in load:
                 try:
                     Table(name, self, **reflect_opts)
@@ -229,6 +229,8 @@ class ServerSideCursorsTest(
 
     __backend__ = True
 
+    engine = None
+
     def _is_server_side(self, cursor):
         if self.engine.dialect.driver == "psycopg2":
             return bool(cursor.name)
@@ -238,7 +240,11 @@ class ServerSideCursorsTest(
         elif self.engine.dialect.driver == "mysqldb":
             sscursor = __import__("MySQLdb.cursors").cursors.SSCursor
             return isinstance(cursor, sscursor)
-        elif self.engine.dialect.driver == "asyncpg":
+        elif self.engine.dialect.driver in (
+            "asyncpg",
+            "aiosqlite",
+            "aiomysql",
+        ):
             return cursor.server_side
         else:
             return False
@@ -251,7 +257,8 @@ class ServerSideCursorsTest(
 
     def tearDown(self):
         engines.testing_reaper.close_all()
-        self.engine.dispose()
+        if self.engine is not None:
+            self.engine.dispose()
 
     @testing.combinations(
         ("global_string", True, "select 1", True),
@@ -270,8 +277,20 @@ class ServerSideCursorsTest(
             select([1]).execution_options(stream_results=False),
             False,
         ),
-        ("for_update_expr", True, select([1]).with_for_update(), True),
-        ("for_update_string", True, "SELECT 1 FOR UPDATE", True),
+        (
+            "for_update_expr",
+            True,
+            select([1]).with_for_update(),
+            True,
+            testing.skip_if("sqlite"),
+        ),
+        (
+            "for_update_string",
+            True,
+            "SELECT 1 FOR UPDATE",
+            True,
+            testing.skip_if("sqlite"),
+        ),
         ("text_no_ss", False, text("select 42"), False),
         (
             "text_ss_option",
@@ -93,7 +93,9 @@ from .compat import zip_longest  # noqa
 from .concurrency import asyncio  # noqa
 from .concurrency import await_fallback  # noqa
 from .concurrency import await_only  # noqa
+from .concurrency import greenlet_gather  # noqa
 from .concurrency import greenlet_spawn  # noqa
+from .concurrency import in_greenlet  # noqa
 from .deprecations import deprecated  # noqa
 from .deprecations import deprecated_20  # noqa
 from .deprecations import deprecated_20_cls  # noqa
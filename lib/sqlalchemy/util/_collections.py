@@ -9,6 +9,7 @@
 
 from __future__ import absolute_import
 
+import collections
 import operator
 import types
 import weakref
@@ -860,32 +861,36 @@ class LRUCache(dict):
     generally its not safe to do an "in" check first as the dictionary
     can change subsequent to that call.
 
+    Recency is approximated using the "CLOCK" algorithm; a get() only marks
+    the item as referenced, and items are queued in order of insertion.
+    When the size of the dictionary exceeds the threshold, items are
+    taken from the front of the queue and removed unless they've been
+    referenced since they were last seen, in which case they're queued
+    again.  Neither operation requires sorting or locking, so that pruning
+    takes amortized constant time per item.
+
     """
 
-    __slots__ = "capacity", "threshold", "size_alert", "_counter", "_mutex"
+    __slots__ = "capacity", "threshold", "size_alert", "_queue", "_mutex"
 
     def __init__(self, capacity=100, threshold=0.5, size_alert=None):
         self.capacity = capacity
         self.threshold = threshold
         self.size_alert = size_alert
-        self._counter = 0
+        self._queue = collections.deque()
         self._mutex = threading.Lock()
 
-    def _inc_counter(self):
-        self._counter += 1
-        return self._counter
-
     def get(self, key, default=None):
         item = dict.get(self, key, default)
         if item is not default:
-            item[2] = self._inc_counter()
+            item[2] = True
             return item[1]
         else:
             return default
 
     def __getitem__(self, key):
         item = dict.__getitem__(self, key)
-        item[2] = self._inc_counter()
+        item[2] = True
         return item[1]
 
     def values(self):
@@ -901,34 +906,70 @@ class LRUCache(dict):
     def __setitem__(self, key, value):
         item = dict.get(self, key)
         if item is None:
-            item = [key, value, self._inc_counter()]
+            item = [key, value, False]
             dict.__setitem__(self, key, item)
+            self._queue.append(item)
         else:
             item[1] = value
         self._manage_size()
 
+    def clear(self):
+        dict.clear(self)
+        self._queue.clear()
+
     @property
     def size_threshold(self):
         return self.capacity + self.capacity * self.threshold
 
+    _dict_get = dict.get
+    _dict_delitem = dict.__delitem__
+
     def _manage_size(self):
+        # the queue is never shorter than the dictionary, and is longer
+        # only by items that were deleted from the dictionary directly
+        if len(self._queue) <= self.size_threshold:
+            return
         if not self._mutex.acquire(False):
             return
         try:
-            size_alert = bool(self.size_alert)
-            while len(self) > self.capacity + self.capacity * self.threshold:
-                if size_alert:
-                    size_alert = False
+            queue = self._queue
+            popleft = queue.popleft
+            append = queue.append
+            get = self._dict_get
+
+            if len(self) > self.size_threshold:
+                if self.size_alert:
                     self.size_alert(self)
-                by_counter = sorted(
-                    dict.values(self), key=operator.itemgetter(2), reverse=True
-                )
-                for item in by_counter[self.capacity :]:
+                delitem = self._dict_delitem
+                capacity = self.capacity
+                while len(self) > capacity:
                     try:
-                        del self[item[0]]
-                    except KeyError:
+                        item = popleft()
+                    except IndexError:
+                        break
+                    if get(item[0]) is not item:
                         # deleted elsewhere; skip
                         continue
+                    elif item[2]:
+                        # referenced; give it another pass
+                        item[2] = False
+                        append(item)
+                    else:
+                        try:
+                            delitem(item[0])
+                        except KeyError:
+                            # deleted elsewhere; skip
+                            continue
+
+            if len(queue) > self.size_threshold:
+                # discard the items that were deleted from the dictionary
+                # directly.  the queue is rotated in place rather than
+                # replaced, so that items appended by other threads
+                # meanwhile aren't lost
+                for i in range(len(queue)):
+                    item = popleft()
+                    if get(item[0]) is item:
+                        append(item)
         finally:
             self._mutex.release()
 
@@ -3,6 +3,7 @@ import sys
 from typing import Any
 from typing import Callable
 from typing import Coroutine
+from typing import List
 
 from .. import exc
 
@@ -84,10 +85,12 @@ try:
                     # wait for a coroutine from await_ and then return its
                     # result back to it.
                     value = await result
-                except Exception:
+                except BaseException:
                     # this allows an exception to be raised within
                     # the moderated greenlet so that it can continue
-                    # its expected flow.
+                    # its expected flow; this includes cancellation of
+                    # the task, so that the greenlet is unwound rather
+                    # than abandoned.
                     result = context.throw(*sys.exc_info())
                 else:
                     result = context.switch(value)
@@ -96,6 +99,62 @@ try:
             del context.driver
         return result
 
+    def in_greenlet() -> bool:
+        """Return True if called within a :func:`greenlet_spawn` context,
+        where :func:`await_only` may be used."""
+
+        return isinstance(greenlet.getcurrent(), _AsyncIoGreenlet)
+
+    def greenlet_gather(
+        fns: List[Callable],
+        limit: int = None,
+        timeout: float = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Run sync callables concurrently, each within its own greenlet.
+
+        Must be called within a :func:`greenlet_spawn` context.  Each
+        callable may itself make use of :func:`await_only`; results are
+        returned in the order of the given callables.
+
+        :param fns: sequence of sync callables, called with no arguments.
+        :param limit: maximum number of callables running at once.
+        :param timeout: seconds each callable may run before
+         ``asyncio.TimeoutError`` is raised.
+        :param return_exceptions: if True, all callables are run to
+         completion, and exceptions raised are returned in place of their
+         results rather than being raised.   Otherwise, when a callable
+         raises, those which are still running are cancelled, and the
+         exception is raised once they have been unwound.
+
+        """
+
+        semaphore = asyncio.Semaphore(limit) if limit else None
+
+        async def run(fn):
+            if semaphore is not None:
+                async with semaphore:
+                    return await asyncio.wait_for(greenlet_spawn(fn), timeout)
+            else:
+                return await asyncio.wait_for(greenlet_spawn(fn), timeout)
+
+        async def gather():
+            tasks = [asyncio.ensure_future(run(fn)) for fn in fns]
+            try:
+                return await asyncio.gather(
+                    *tasks, return_exceptions=return_exceptions
+                )
+            except BaseException:
+                # don't leave any callable running once the error is
+                # raised, as the caller may then release the resources
+                # that it's using
+                for task in tasks:
+                    task.cancel()
+                await asyncio.wait(tasks)
+                raise
+
+        return await_only(gather())
+
 
 except ImportError:  # pragma: no cover
     greenlet = None
@@ -108,3 +167,11 @@ except ImportError:  # pragma: no cover
 
     async def greenlet_spawn(fn, *args, **kw):
         raise ValueError("Greenlet is required to use this function")
+
+    def in_greenlet():
+        return False
+
+    def greenlet_gather(
+        fns, limit=None, timeout=None, return_exceptions=False
+    ):
+        raise ValueError("Greenlet is required to use this function")
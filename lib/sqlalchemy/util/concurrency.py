@@ -7,6 +7,8 @@ if compat.py3k:
     from ._concurrency_py3k import await_fallback
     from ._concurrency_py3k import greenlet
     from ._concurrency_py3k import greenlet_spawn
+    from ._concurrency_py3k import greenlet_gather
+    from ._concurrency_py3k import in_greenlet
 else:
     asyncio = None
     greenlet = None
@@ -19,3 +21,11 @@ else:
 
     def greenlet_spawn(fn, *args, **kw):
         raise ValueError("Cannot use this function in py2.")
+
+    def greenlet_gather(
+        fns, limit=None, timeout=None, return_exceptions=False
+    ):
+        raise ValueError("Cannot use this function in py2.")
+
+    def in_greenlet():
+        return False
@@ -118,6 +118,28 @@ class Queue:
             self._put(item)
             self.not_empty.notify()
 
+    def items(self):
+        """Return a list of the items currently in the queue (not
+        reliable!)."""
+
+        with self.mutex:
+            return list(self.queue)
+
+    def remove(self, item):
+        """Remove the given item from the queue without blocking.
+
+        Return True if the item was removed, or False if it's no longer
+        in the queue.
+        """
+
+        with self.not_full:
+            try:
+                self.queue.remove(item)
+            except ValueError:
+                return False
+            self.not_full.notify()
+            return True
+
     def put_nowait(self, item):
         """Put an item into the queue without blocking.
 
@@ -210,10 +232,41 @@ class AsyncAdaptedQueue:
         else:
             self._queue = asyncio.Queue(maxsize=maxsize)
         self.maxsize = maxsize
+        self.use_lifo = use_lifo
         self.empty = self._queue.empty
         self.full = self._queue.full
         self.qsize = self._queue.qsize
 
+    def _drain(self):
+        # asyncio.Queue offers no access to its items other than get();
+        # as there's no await in between, no other task can observe the
+        # queue while it's drained and refilled
+        items = []
+        while not self._queue.empty():
+            items.append(self._queue.get_nowait())
+        if self.use_lifo:
+            items.reverse()
+        return items
+
+    def _refill(self, items):
+        for item in items:
+            self._queue.put_nowait(item)
+
+    def items(self):
+        items = self._drain()
+        self._refill(items)
+        return items
+
+    def remove(self, item):
+        items = self._drain()
+        try:
+            items.remove(item)
+        except ValueError:
+            return False
+        finally:
+            self._refill(items)
+        return True
+
     def put_nowait(self, item):
         try:
             return self._queue.put_nowait(item)
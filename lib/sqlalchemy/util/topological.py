@@ -24,12 +24,26 @@ def sort_as_subsets(tuples, allitems, deterministic_order=False):
 
     todo = Set(allitems)
 
-    while todo:
-        output = Set()
-        for node in todo:
-            if todo.isdisjoint(edges[node]):
-                output.add(node)
-
+    # Kahn's algorithm, one tier of nodes at a time; each node tracks the
+    # number of its parents which have yet to be output.  parents that
+    # aren't among allitems aren't waited on.
+    children = util.defaultdict(list)
+    waiting = {}
+    for node in todo:
+        count = 0
+        for parent in edges.get(node, ()):
+            if parent in todo:
+                children[parent].append(node)
+                count += 1
+        waiting[node] = count
+
+    if deterministic_order:
+        position = dict((node, idx) for idx, node in enumerate(todo))
+
+    output = Set(node for node in todo if not waiting[node])
+    remaining = len(todo)
+
+    while remaining:
         if not output:
             raise CircularDependencyError(
                 "Circular dependency detected.",
@@ -37,8 +51,21 @@ def sort_as_subsets(tuples, allitems, deterministic_order=False):
                 _gen_edges(edges),
             )
 
-        todo.difference_update(output)
+        remaining -= len(output)
+
+        # determine the next tier before yielding, as the caller may
+        # consume the set that's yielded
+        ready = []
+        for node in output:
+            for child in children.get(node, ()):
+                waiting[child] -= 1
+                if not waiting[child]:
+                    ready.append(child)
+        if deterministic_order:
+            ready.sort(key=position.__getitem__)
+
         yield output
+        output = Set(ready)
 
 
 def sort(tuples, allitems, deterministic_order=False):
@@ -54,42 +81,65 @@ def sort(tuples, allitems, deterministic_order=False):
 
 
 def find_cycles(tuples, allitems):
-    # adapted from:
-    # http://neopythonic.blogspot.com/2009/01/detecting-cycles-in-directed-graph.html
+    """Return the set of nodes which are part of a cycle.
+
+    These are the members of each strongly connected component of more
+    than one node, as well as nodes which refer to themselves; the
+    components are located using an iterative form of Tarjan's algorithm.
+
+    """
 
     edges = util.defaultdict(set)
     for parent, child in tuples:
         edges[parent].add(child)
-    nodes_to_test = set(edges)
 
     output = set()
 
-    # we'd like to find all nodes that are
-    # involved in cycles, so we do the full
-    # pass through the whole thing for each
-    # node in the original list.
+    index = {}
+    lowlink = {}
+    stack = []
+    on_stack = set()
 
     # we can go just through parent edge nodes.
     # if a node is only a child and never a parent,
     # by definition it can't be part of a cycle.  same
     # if it's not in the edges at all.
-    for node in nodes_to_test:
-        stack = [node]
-        todo = nodes_to_test.difference(stack)
-        while stack:
-            top = stack[-1]
-            for node in edges[top]:
-                if node in stack:
-                    cyc = stack[stack.index(node) :]
-                    todo.difference_update(cyc)
-                    output.update(cyc)
-
-                if node in todo:
-                    stack.append(node)
-                    todo.remove(node)
+    for root in list(edges):
+        if root in index:
+            continue
+
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(edges[root]))]
+
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(edges.get(child, ()))))
                     break
+                elif child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
             else:
-                node = stack.pop()
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member is node:
+                            break
+                    if len(component) > 1 or node in edges.get(node, ()):
+                        output.update(component)
     return output
 
 
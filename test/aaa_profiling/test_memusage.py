@@ -1,3 +1,4 @@
+import collections
 import decimal
 import gc
 import itertools
@@ -78,6 +79,40 @@ def assert_cycles(expected=0):
     return decorate
 
 
+def assert_memory_per_object(max_bytes):
+    """Assert that the decorated function, which returns a list of the
+    objects it creates, allocates no more than the given number of bytes
+    for each object that remains referenced.
+
+    Memory is measured with tracemalloc, following a warmup run."""
+
+    def decorate(fn):
+        def go():
+            import tracemalloc
+
+            fn()  # warmup, configure mappers, caches, etc.
+            gc_collect()
+
+            tracemalloc.start()
+            try:
+                before = tracemalloc.get_traced_memory()[0]
+                objects = fn()
+                gc_collect()
+                size = tracemalloc.get_traced_memory()[0] - before
+            finally:
+                tracemalloc.stop()
+
+            per_object = size / len(objects)
+            assert per_object <= max_bytes, (
+                "%d bytes allocated per object exceeds %d"
+                % (per_object, max_bytes)
+            )
+
+        return go
+
+    return decorate
+
+
 def profile_memory(
     maxtimes=250, assert_no_sessions=True, get_num_objects=None
 ):
@@ -1686,3 +1721,139 @@ class CycleTest(_fixtures.FixtureTest):
             s.close()
 
         go()
+
+
+class InstanceStateSizeTest(_fixtures.FixtureTest):
+    __tags__ = ("memory_intensive",)
+    __requires__ = ("cpython", "no_windows")
+
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def _owned_containers(self, states):
+        """Return the dicts and sets referenced by exactly one of the given
+        states, which are therefore allocated per instance."""
+
+        counts = collections.Counter(
+            id(value)
+            for state in states
+            for value in state.__dict__.values()
+            if isinstance(value, (dict, set))
+        )
+        return [
+            (key, value)
+            for state in states
+            for key, value in state.__dict__.items()
+            if isinstance(value, (dict, set)) and counts[id(value)] == 1
+        ]
+
+    def test_loaded_objects(self):
+        User = self.classes.User
+
+        s = Session(testing.db)
+        users = s.query(User).all()
+        states = [inspect(u) for u in users]
+
+        # no per-instance committed_state / expired_attributes etc.
+        eq_(self._owned_containers(states), [])
+        s.close()
+
+    def test_released_after_flush(self):
+        User = self.classes.User
+
+        s = Session(testing.db)
+        users = s.query(User).order_by(User.id).all()
+
+        users[0].name = "new name"
+        eq_(
+            [
+                key
+                for key, value in self._owned_containers(
+                    [inspect(u) for u in users]
+                )
+            ],
+            ["_committed_state"],
+        )
+
+        s.flush()
+        eq_(self._owned_containers([inspect(u) for u in users]), [])
+        s.rollback()
+
+    def test_released_after_refresh(self):
+        User = self.classes.User
+
+        s = Session(testing.db)
+        users = s.query(User).order_by(User.id).all()
+
+        s.expire_all()
+        eq_(
+            set(
+                key
+                for key, value in self._owned_containers(
+                    [inspect(u) for u in users]
+                )
+            ),
+            {"_expired_attributes"},
+        )
+
+        for u in users:
+            u.name
+        eq_(self._owned_containers([inspect(u) for u in users]), [])
+        s.close()
+
+
+class InstanceStateMemoryTest(fixtures.MappedTest):
+    """measure the memory held by each object loaded into a Session,
+    which includes the object, its __dict__, its InstanceState and its
+    entry in the identity map."""
+
+    __tags__ = ("memory_intensive",)
+    __requires__ = ("cpython", "python3", "no_windows")
+
+    num_objects = 5000
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", Integer),
+            Column("y", Integer),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Data(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.Data, cls.tables.data)
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.data.insert(),
+            [{"id": i, "x": i, "y": i} for i in range(1, cls.num_objects + 1)],
+        )
+
+    def test_loaded_objects(self):
+        Data = self.classes.Data
+        s = Session(testing.db)
+
+        # about 930 bytes on cpython 3.8 and 710 on 3.11; allocating an
+        # empty committed_state dict and expired_attributes set for each
+        # state brought this to about 1490 and 1010 respectively
+        @assert_memory_per_object(1100)
+        def go():
+            s.expunge_all()
+            return s.query(Data).all()
+
+        go()
+        s.close()
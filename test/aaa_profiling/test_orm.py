@@ -5,6 +5,7 @@ from sqlalchemy import join
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy.orm import aliased
+from sqlalchemy.orm import backref
 from sqlalchemy.orm import Bundle
 from sqlalchemy.orm import configure_mappers
 from sqlalchemy.orm import defaultload
@@ -18,6 +19,7 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.testing import config
+from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import profiling
 from sqlalchemy.testing.schema import Column
@@ -557,6 +559,62 @@ class SessionTest(NoCache, fixtures.MappedTest):
         go()
 
 
+class SelfReferentialFlushTest(NoCache, fixtures.MappedTest):
+    """Flush a long chain of self-referential rows, where the unit of work
+    has to sort each individual row against its parent."""
+
+    __requires__ = ("python_profiling_backend",)
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "node",
+            metadata,
+            Column(
+                "id", Integer, primary_key=True, test_needs_autoincrement=True
+            ),
+            Column("parent_id", Integer, ForeignKey("node.id")),
+            Column("data", String(20)),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Node(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Node, node = cls.classes.Node, cls.tables.node
+
+        mapper(
+            Node,
+            node,
+            properties={
+                "children": relationship(
+                    Node, backref=backref("parent", remote_side=node.c.id)
+                )
+            },
+        )
+
+    def test_flush_chain(self):
+        Node = self.classes.Node
+
+        root = node = Node(data="n0")
+        for i in range(1, 5000):
+            node = Node(data="n%d" % i, parent=node)
+
+        sess = Session()
+        sess.add(root)
+
+        @profiling.function_call_count(variance=0.10)
+        def go():
+            sess.flush()
+
+        go()
+
+        eq_(sess.query(Node).filter(Node.parent_id.isnot(None)).count(), 4999)
+
+
 class QueryTest(NoCache, fixtures.MappedTest):
     __requires__ = ("python_profiling_backend",)
 
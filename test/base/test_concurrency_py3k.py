@@ -1,11 +1,18 @@
+import asyncio
+
 from sqlalchemy import exc
 from sqlalchemy.testing import async_test
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises
 from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_true
 from sqlalchemy.util import await_fallback
 from sqlalchemy.util import await_only
+from sqlalchemy.util import greenlet_gather
 from sqlalchemy.util import greenlet_spawn
+from sqlalchemy.util import in_greenlet
 
 
 async def run1():
@@ -101,3 +108,102 @@ class TestAsyncioCompat(fixtures.TestBase):
             await greenlet_spawn(go)
 
         await to_await
+
+    def test_in_greenlet(self):
+        is_false(in_greenlet())
+
+    @async_test
+    async def test_in_greenlet_spawn(self):
+        is_true(await greenlet_spawn(in_greenlet))
+
+    @async_test
+    async def test_greenlet_gather(self):
+        running = []
+        max_running = []
+
+        def make_fn(value):
+            def go():
+                running.append(value)
+                max_running.append(len(running))
+                await_only(asyncio.sleep(0.01))
+                running.remove(value)
+                return await_only(run1()) + value
+
+            return go
+
+        def gather():
+            return greenlet_gather(
+                [make_fn(value) for value in range(5)], limit=2
+            )
+
+        eq_(await greenlet_spawn(gather), [1, 2, 3, 4, 5])
+        eq_(max(max_running), 2)
+
+    @async_test
+    async def test_greenlet_gather_timeout(self):
+        def slow():
+            await_only(asyncio.sleep(5))
+
+        def gather():
+            return greenlet_gather([lambda: go(run1), slow], timeout=0.05)
+
+        with expect_raises(asyncio.TimeoutError):
+            await greenlet_spawn(gather)
+
+    @async_test
+    async def test_greenlet_gather_timeout_unwinds(self):
+        unwound = []
+
+        def slow():
+            try:
+                await_only(asyncio.sleep(5))
+            finally:
+                unwound.append(True)
+
+        def gather():
+            return greenlet_gather([slow], timeout=0.05)
+
+        with expect_raises(asyncio.TimeoutError):
+            await greenlet_spawn(gather)
+        eq_(unwound, [True])
+
+    @async_test
+    async def test_greenlet_gather_error_cancels_siblings(self):
+        events = []
+
+        def slow():
+            events.append("slow start")
+            try:
+                await_only(asyncio.sleep(5))
+            finally:
+                events.append("slow unwound")
+
+        def err():
+            await_only(asyncio.sleep(0.01))
+            raise ValueError("an error")
+
+        def gather():
+            return greenlet_gather([slow, err])
+
+        with expect_raises_message(ValueError, "an error"):
+            await greenlet_spawn(gather)
+        events.append("caller")
+
+        eq_(events, ["slow start", "slow unwound", "caller"])
+
+    @async_test
+    async def test_greenlet_spawn_cancel_unwinds(self):
+        unwound = []
+
+        def slow():
+            try:
+                await_only(asyncio.sleep(5))
+            finally:
+                unwound.append(True)
+
+        task = asyncio.ensure_future(greenlet_spawn(slow))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with expect_raises(asyncio.CancelledError):
+            await task
+        eq_(unwound, [True])
@@ -206,6 +206,37 @@ class DependencySortTest(fixtures.TestBase):
         tuples = [(i, i + 1) for i in range(0, 1500, 2)]
         self.assert_sort(tuples)
 
+    def test_large_chain_sort(self):
+        tuples = [(i, i + 1) for i in range(50000)]
+        eq_(
+            list(topological.sort(tuples, range(50001))), list(range(50001)),
+        )
+
+    def test_large_chain_subsets(self):
+        tuples = [(i, i + 1) for i in range(0, 50000, 2)]
+        result = [
+            list(subset)
+            for subset in topological.sort_as_subsets(
+                tuples, range(50000), deterministic_order=True
+            )
+        ]
+        eq_(
+            result, [list(range(0, 50000, 2)), list(range(1, 50000, 2))],
+        )
+
+    def test_find_large_cycle(self):
+        tuples = [(i, i + 1) for i in range(50000)] + [(50000, 0)]
+        eq_(
+            topological.find_cycles(tuples, range(50005)), set(range(50001)),
+        )
+
+    def test_find_self_cycle(self):
+        tuples = [("node1", "node1"), ("node1", "node2")]
+        eq_(
+            topological.find_cycles(tuples, ["node1", "node2"]),
+            set(["node1"]),
+        )
+
     def test_ticket_1380(self):
 
         # ticket:1380 regression: would raise a KeyError
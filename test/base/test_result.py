@@ -1,3 +1,5 @@
+import operator
+
 from sqlalchemy import exc
 from sqlalchemy import testing
 from sqlalchemy.engine import result
@@ -949,6 +951,144 @@ class MergeResultTest(fixtures.TestBase):
         # unique takes place
         eq_(result.scalars("y").all(), [2, 1, 3])
 
+    @testing.fixture
+    def ordered_fixture(self):
+        def go(*rows):
+            return [
+                result.IteratorResult(
+                    result.SimpleResultMetaData(["x", "y"]), iter(r)
+                )
+                for r in rows
+            ]
+
+        return go
+
+    def test_merge_ordered(self, ordered_fixture):
+        r1, r2, r3 = ordered_fixture(
+            [(1, "a"), (4, "b"), (7, "c")],
+            [(2, "d"), (3, "e"), (9, "f")],
+            [(5, "g"), (6, "h"), (8, "i")],
+        )
+
+        result = r1.merge(
+            r2, r3, ordering=[(operator.itemgetter(0), False, False)]
+        )
+        eq_(result.scalars(0).all(), [1, 2, 3, 4, 5, 6, 7, 8, 9])
+
+    def test_merge_ordered_multiple_directions(self, ordered_fixture):
+        r1, r2 = ordered_fixture(
+            [(1, "c"), (1, "a"), (2, "b")], [(1, "b"), (2, "c"), (2, "a")],
+        )
+
+        result = r1.merge(
+            r2,
+            ordering=[
+                (operator.itemgetter(0), False, False),
+                (operator.itemgetter(1), True, False),
+            ],
+        )
+        eq_(
+            result.all(),
+            [(1, "c"), (1, "b"), (1, "a"), (2, "c"), (2, "b"), (2, "a")],
+        )
+
+    def test_merge_ordered_stable(self, ordered_fixture):
+        r1, r2 = ordered_fixture([(1, "a"), (2, "b")], [(1, "c"), (2, "d")])
+
+        result = r1.merge(
+            r2, ordering=[(operator.itemgetter(0), False, False)]
+        )
+        eq_(result.scalars(1).all(), ["a", "c", "b", "d"])
+
+    @testing.combinations(
+        (False, False, [1, 2, 3, None, None]),
+        (False, True, [None, None, 1, 2, 3]),
+        (True, False, [3, 2, 1, None, None]),
+        (True, True, [None, None, 3, 2, 1]),
+        argnames="descending, nulls_first, expected",
+    )
+    def test_merge_ordered_nulls(
+        self, ordered_fixture, descending, nulls_first, expected
+    ):
+        def rows(*values):
+            values = sorted(
+                values,
+                key=lambda v: (
+                    (v is None) is not nulls_first,
+                    -v if descending and v is not None else v,
+                ),
+            )
+            return [(v, None) for v in values]
+
+        r1, r2 = ordered_fixture(rows(1, None, 3), rows(2, None))
+
+        result = r1.merge(
+            r2, ordering=[(operator.itemgetter(0), descending, nulls_first)]
+        )
+        eq_(result.scalars(0).all(), expected)
+
+    def test_merge_ordered_limit(self, ordered_fixture):
+        consumed = []
+
+        def track(rows):
+            for row in rows:
+                consumed.append(row)
+                yield row
+
+        r1 = result.IteratorResult(
+            result.SimpleResultMetaData(["x"]),
+            track([(1,), (3,), (5,), (7,)]),
+        )
+        r2 = result.IteratorResult(
+            result.SimpleResultMetaData(["x"]),
+            track([(2,), (4,), (6,), (8,)]),
+        )
+
+        result_ = r1.merge(
+            r2, ordering=[(operator.itemgetter(0), False, False)], limit=3
+        )
+        eq_(result_.scalars().all(), [1, 2, 3])
+
+        # only as many rows are read as needed to produce the limit
+        eq_(sorted(consumed), [(1,), (2,), (3,), (4,)])
+
+    def test_merge_limit(self, merge_fixture):
+        r1, r2, r3, r4 = merge_fixture
+
+        result = r1.merge(r2, r3, r4, limit=3)
+        eq_(result.scalars(0).all(), [7, 8, 9])
+
+    def test_merge_ordered_unique_limit(self, ordered_fixture):
+        r1, r2 = ordered_fixture(
+            [(1, "a"), (1, "a"), (3, "c")], [(2, "d"), (2, "d"), (4, "f")],
+        )
+
+        result = r1.merge(
+            r2,
+            ordering=[(operator.itemgetter(0), False, False)],
+            limit=2,
+            unique_limit=True,
+        )
+
+        # all rows for the first two distinct rows
+        eq_(result.all(), [(1, "a"), (1, "a"), (2, "d"), (2, "d")])
+
+    def test_merge_unique_limit_filters(self):
+        r1, r2 = [
+            result.IteratorResult(
+                result.SimpleResultMetaData(
+                    ["x", "y"], _unique_filters=[None, len]
+                ),
+                iter(rows),
+            )
+            for rows in ([(1, "a"), (1, "b"), (2, "cc")], [(3, "d")])
+        ]
+
+        result_ = r1.merge(r2, limit=2, unique_limit=True)
+
+        # "a" and "b" are the same according to the filter
+        eq_(result_.all(), [(1, "a"), (1, "b"), (2, "cc")])
+
 
 class OnlyScalarsTest(fixtures.TestBase):
     """the chunkediterator supports "non tuple mode", where we bypass
@@ -4,6 +4,7 @@ import copy
 import datetime
 import inspect
 import sys
+import threading
 
 from sqlalchemy import exc
 from sqlalchemy import sql
@@ -1115,6 +1116,86 @@ class LRUTest(fixtures.TestBase):
         assert 25 in lru
         assert lru[25] is i2
 
+    def test_size_alert(self):
+        canary = mock.Mock()
+        lru = util.LRUCache(10, threshold=0.5, size_alert=canary)
+
+        for id_ in range(15):
+            lru[id_] = id_
+        eq_(canary.mock_calls, [])
+
+        lru[15] = 15
+        eq_(canary.mock_calls, [mock.call(lru)])
+        eq_(len(lru), 10)
+        eq_(sorted(lru), list(range(6, 16)))
+
+    def test_deleted_items_not_retained(self):
+        lru = util.LRUCache(10, threshold=0.5)
+
+        for id_ in range(100):
+            lru[id_] = id_
+            del lru[id_]
+
+        eq_(len(lru), 0)
+        assert len(lru._queue) <= lru.size_threshold
+
+        for id_ in range(100):
+            lru[id_] = id_
+            lru[id_] = id_ + 1
+        eq_(len(lru), 10)
+        eq_(len(lru._queue), 10)
+        eq_(lru[99], 100)
+
+    def test_reinserted_key(self):
+        lru = util.LRUCache(2, threshold=0.5)
+        lru[1] = 1
+        lru[2] = 2
+        del lru[1]
+        lru[1] = "one"
+        lru[3] = 3
+        lru[4] = 4
+
+        # the stale entry for key 1 was skipped; the second one is pruned
+        # in order of insertion
+        eq_(sorted(lru), [3, 4])
+
+    def test_clear(self):
+        lru = util.LRUCache(10)
+        for id_ in range(10):
+            lru[id_] = id_
+        lru.clear()
+        eq_(len(lru), 0)
+        eq_(len(lru._queue), 0)
+
+    def test_threaded(self):
+        lru = util.LRUCache(50, threshold=0.5)
+        errors = []
+
+        def worker(seed):
+            try:
+                for i in range(2000):
+                    key = (i * seed) % 200
+                    if lru.get(key) is None:
+                        lru[key] = key
+                    if i % 50 == 0:
+                        lru.pop(key, None)
+            except Exception as err:
+                errors.append(err)
+
+        threads = [
+            threading.Thread(target=worker, args=(seed,))
+            for seed in range(1, 9)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        eq_(errors, [])
+        assert len(lru) <= lru.size_threshold
+        for key in lru:
+            eq_(lru[key], key)
+
 
 class ImmutableSubclass(str):
     pass
@@ -29,6 +29,8 @@ from sqlalchemy import text
 from sqlalchemy import TypeDecorator
 from sqlalchemy import util
 from sqlalchemy.dialects.postgresql import base as postgresql
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import pg8000 as pg8000_dialect
 from sqlalchemy.dialects.postgresql import psycopg2 as psycopg2_dialect
 from sqlalchemy.dialects.postgresql.psycopg2 import EXECUTEMANY_BATCH
 from sqlalchemy.dialects.postgresql.psycopg2 import EXECUTEMANY_PLAIN
@@ -36,6 +38,9 @@ from sqlalchemy.dialects.postgresql.psycopg2 import EXECUTEMANY_VALUES
 from sqlalchemy.engine import cursor as _cursor
 from sqlalchemy.engine import engine_from_config
 from sqlalchemy.engine import url
+from sqlalchemy.orm import clear_mappers
+from sqlalchemy.orm import mapper
+from sqlalchemy.orm import Session
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
@@ -706,6 +711,193 @@ class ExecutemanyFlagOptionsTest(fixtures.TablesTest):
             )
 
 
+class InsertManyValuesTest(fixtures.TestBase):
+    """test the INSERT..RETURNING executemany() of dialects such as pg8000,
+    which render pages of parameter sets into a multiple-row VALUES
+    clause."""
+
+    def teardown(self):
+        clear_mappers()
+
+    def _fixture(self, rows, **kw):
+        cursor = mock.Mock(
+            description=[("id", None, None, None, None, None, None)],
+            fetchall=mock.Mock(side_effect=rows),
+        )
+        dbapi = mock.Mock(
+            paramstyle="format",
+            __version__="1.16.6",
+            connect=mock.Mock(
+                return_value=mock.Mock(cursor=mock.Mock(return_value=cursor))
+            ),
+        )
+        eng = engines.testing_engine(
+            "postgresql+pg8000://",
+            options=dict(module=dbapi, _initialize=False, **kw),
+        )
+        return eng, cursor
+
+    def _table(self, *cols):
+        return Table(
+            "t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            *[Column(col, Integer) for col in cols]
+        )
+
+    def test_dialect_flags(self):
+        dialect = pg8000_dialect.PGDialect_pg8000()
+        is_(dialect.use_insertmanyvalues, True)
+        is_(dialect.insert_executemany_returning, True)
+
+        dialect = pg8000_dialect.PGDialect_pg8000(implicit_returning=False)
+        is_(dialect.use_insertmanyvalues, False)
+        is_(dialect.insert_executemany_returning, False)
+
+    def test_return_defaults_pages(self):
+        eng, cursor = self._fixture(
+            [[(1,), (2,)], [(3,), (4,)], [(5,)]], insertmanyvalues_page_size=2,
+        )
+        t = self._table("x")
+
+        with eng.connect() as conn:
+            result = conn.execute(
+                t.insert().return_defaults(), [{"x": i} for i in range(5)]
+            )
+            eq_(
+                result.inserted_primary_key_rows,
+                [(1,), (2,), (3,), (4,), (5,)],
+            )
+
+        eq_(
+            cursor.execute.mock_calls,
+            [
+                mock.call(
+                    "INSERT INTO t (x) VALUES (%s), (%s) RETURNING t.id",
+                    (0, 1),
+                ),
+                mock.call(
+                    "INSERT INTO t (x) VALUES (%s), (%s) RETURNING t.id",
+                    (2, 3),
+                ),
+                mock.call(
+                    "INSERT INTO t (x) VALUES (%s) RETURNING t.id", (4,)
+                ),
+            ],
+        )
+        eq_(cursor.executemany.mock_calls, [])
+
+        # the DBAPI types established by setinputsizes() are repeated
+        # for each row of the VALUES clause
+        eq_(
+            [len(c[1]) for c in cursor.setinputsizes.mock_calls], [1, 2, 2, 1],
+        )
+
+    def test_rows_sorted_by_autoincrement(self):
+        eng, cursor = self._fixture(
+            [[(2,), (1,)], [(4,), (3,)]], insertmanyvalues_page_size=2,
+        )
+        t = self._table("x")
+
+        with eng.connect() as conn:
+            result = conn.execute(
+                t.insert().return_defaults(), [{"x": i} for i in range(4)]
+            )
+            eq_(
+                result.inserted_primary_key_rows, [(1,), (2,), (3,), (4,)],
+            )
+
+    def test_no_autoincrement_per_row(self):
+        eng, cursor = self._fixture([[(5,)], [(6,)]])
+        t = self._table("x")
+
+        with eng.connect() as conn:
+            result = conn.execute(
+                t.insert().returning(t.c.id),
+                [{"id": 5, "x": 1}, {"id": 6, "x": 2}],
+            )
+            eq_(result.all(), [(5,), (6,)])
+
+        eq_(
+            cursor.execute.mock_calls,
+            [
+                mock.call(
+                    "INSERT INTO t (id, x) VALUES (%s, %s) RETURNING t.id",
+                    (5, 1),
+                ),
+                mock.call(
+                    "INSERT INTO t (id, x) VALUES (%s, %s) RETURNING t.id",
+                    (6, 2),
+                ),
+            ],
+        )
+        eq_(cursor.executemany.mock_calls, [])
+
+    def test_on_conflict_per_row(self):
+        # a conflicting row returns its existing primary key, so the rows
+        # can't be correlated by sorting on it
+        eng, cursor = self._fixture([[(101,)], [(5,)]])
+        t = self._table("x")
+
+        stmt = insert(t)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[t.c.x], set_={"x": stmt.excluded.x}
+        ).return_defaults()
+
+        with eng.connect() as conn:
+            result = conn.execute(stmt, [{"x": 1}, {"x": 2}])
+            eq_(result.inserted_primary_key_rows, [(101,), (5,)])
+
+        eq_(
+            [c[1][1] for c in cursor.execute.mock_calls], [(1,), (2,)],
+        )
+        eq_(cursor.executemany.mock_calls, [])
+
+    def test_page_size_limited_by_parameters(self):
+        eng, cursor = self._fixture([[(1,), (2,)], [(3,)]])
+        eng.dialect.insertmanyvalues_max_parameters = 5
+        t = self._table("x", "y")
+
+        with eng.connect() as conn:
+            result = conn.execute(
+                t.insert().return_defaults(),
+                [{"x": i, "y": i} for i in range(3)],
+            )
+            eq_(result.inserted_primary_key_rows, [(1,), (2,), (3,)])
+
+        eq_(
+            [len(c[1][1]) for c in cursor.execute.mock_calls], [4, 2],
+        )
+
+    def test_orm_flush(self):
+        eng, cursor = self._fixture([[(1,), (2,), (3,)]])
+        t = self._table("x")
+
+        class A(object):
+            pass
+
+        mapper(A, t)
+
+        sess = Session(eng)
+        objs = [A() for i in range(3)]
+        for i, obj in enumerate(objs):
+            obj.x = i
+        sess.add_all(objs)
+        sess.flush()
+
+        eq_([obj.id for obj in objs], [1, 2, 3])
+        eq_(
+            cursor.execute.mock_calls,
+            [
+                mock.call(
+                    "INSERT INTO t (x) VALUES (%s), (%s), (%s) "
+                    "RETURNING t.id",
+                    (0, 1, 2),
+                )
+            ],
+        )
+
+
 class MiscBackendTest(
     fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL
 ):
@@ -31,6 +31,7 @@ from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import AssertsExecutionResults
 from sqlalchemy.testing.assertions import eq_
+from sqlalchemy.testing.assertions import ne_
 
 
 class ForeignTableReflectionTest(fixtures.TablesTest, AssertsExecutionResults):
@@ -1777,3 +1778,53 @@ class IntervalReflectionTest(fixtures.TestBase):
         assert isinstance(columns["data1"]["type"], INTERVAL)
         eq_(columns["data1"]["type"].fields, None)
         eq_(columns["data1"]["type"].precision, 6)
+
+
+class SchemaFingerprintTest(fixtures.TestBase):
+    __only_on__ = "postgresql >= 9.3"
+    __backend__ = True
+
+    def setup(self):
+        with testing.db.begin() as conn:
+            conn.exec_driver_sql("CREATE TYPE fp_enum AS ENUM ('a', 'b')")
+            conn.exec_driver_sql(
+                "CREATE TABLE fp_table (id integer, data fp_enum)"
+            )
+            conn.exec_driver_sql(
+                "CREATE VIEW fp_view AS SELECT id FROM fp_table"
+            )
+
+    def teardown(self):
+        with testing.db.begin() as conn:
+            conn.exec_driver_sql("DROP VIEW fp_view")
+            conn.exec_driver_sql("DROP TABLE fp_table")
+            conn.exec_driver_sql("DROP TYPE fp_enum")
+
+    def _fingerprint(self):
+        with testing.db.connect() as conn:
+            return testing.db.dialect.get_schema_fingerprint(conn)
+
+    def test_alter_type_add_value(self):
+        before = self._fingerprint()
+
+        # ADD VALUE can't run in a transaction block before PG 12
+        with testing.db.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            conn.exec_driver_sql("ALTER TYPE fp_enum ADD VALUE 'c'")
+
+        ne_(self._fingerprint(), before)
+
+    def test_replace_view(self):
+        before = self._fingerprint()
+
+        with testing.db.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE OR REPLACE VIEW fp_view AS "
+                "SELECT id FROM fp_table WHERE id > 5"
+            )
+
+        ne_(self._fingerprint(), before)
+
+    def test_unchanged(self):
+        eq_(self._fingerprint(), self._fingerprint())
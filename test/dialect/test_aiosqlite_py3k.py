@@ -0,0 +1,248 @@
+import sqlite3
+
+from sqlalchemy import event
+from sqlalchemy import pool
+from sqlalchemy import testing
+from sqlalchemy import text
+from sqlalchemy.dialects.sqlite import aiosqlite as aiosqlite_dialect
+from sqlalchemy.engine import url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.testing import assert_raises_message
+from sqlalchemy.testing import async_test
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_true
+from sqlalchemy.util import greenlet_spawn
+
+
+class _FakeCursor(object):
+    def __init__(self, rows):
+        self._rows = list(rows)
+        self.description = None
+        self.rowcount = -1
+        self.lastrowid = None
+        self.fetches = 0
+        self.closed = False
+
+    async def execute(self, operation, parameters=None):
+        self.description = (("x", None, None, None, None, None, None),)
+
+    async def fetchone(self):
+        self.fetches += 1
+        return self._rows.pop(0) if self._rows else None
+
+    async def fetchmany(self, size=None):
+        self.fetches += 1
+        rows, self._rows = self._rows[0:size], self._rows[size:]
+        return rows
+
+    async def fetchall(self):
+        self.fetches += 1
+        rows, self._rows = self._rows, []
+        return rows
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeAiosqliteConnection(object):
+    def __init__(self, rows=()):
+        self.rows = rows
+        self.cursors = []
+        self.closed = False
+
+    async def cursor(self):
+        cursor = _FakeCursor(self.rows)
+        self.cursors.append(cursor)
+        return cursor
+
+    async def commit(self):
+        if self.closed:
+            raise ValueError("no active connection")
+
+    async def close(self):
+        self.closed = True
+
+
+def _dbapi():
+    # aiosqlite raises the exception classes of the sqlite3 module
+    return aiosqlite_dialect.AsyncAdapt_aiosqlite_dbapi(sqlite3, sqlite3)
+
+
+def _adapt_connection(rows=()):
+    return aiosqlite_dialect.AsyncAdapt_aiosqlite_connection(
+        _dbapi(), _FakeAiosqliteConnection(rows)
+    )
+
+
+class AdaptedCursorTest(fixtures.TestBase):
+    """python-side tests for the aiosqlite cursor adaption."""
+
+    def _execute(self, conn, server_side):
+        cursor = conn.cursor(server_side=server_side)
+        cursor.execute("select x from t")
+        return cursor
+
+    @async_test
+    async def test_buffered(self):
+        conn = _adapt_connection([(1,), (2,), (3,)])
+        cursor = await greenlet_spawn(self._execute, conn, False)
+
+        is_(cursor.server_side, False)
+        fake_cursor = conn._connection.cursors[0]
+
+        # all rows are fetched up front, and the aiosqlite cursor is
+        # closed right away
+        eq_(fake_cursor.fetches, 1)
+        is_true(fake_cursor.closed)
+        eq_(cursor.fetchone(), (1,))
+        eq_(cursor.fetchmany(5), [(2,), (3,)])
+        eq_(cursor.fetchall(), [])
+
+    @async_test
+    async def test_server_side(self):
+        conn = _adapt_connection([(1,), (2,), (3,)])
+        cursor = await greenlet_spawn(self._execute, conn, True)
+
+        is_(cursor.server_side, True)
+        fake_cursor = conn._connection.cursors[0]
+
+        # rows are fetched only as they're requested
+        eq_(fake_cursor.fetches, 0)
+        is_false(fake_cursor.closed)
+        eq_(await greenlet_spawn(cursor.fetchone), (1,))
+        eq_(fake_cursor.fetches, 1)
+        eq_(await greenlet_spawn(cursor.fetchmany, 1), [(2,)])
+        eq_(fake_cursor.fetches, 2)
+        eq_(await greenlet_spawn(cursor.fetchall), [(3,)])
+
+        await greenlet_spawn(cursor.close)
+        is_true(fake_cursor.closed)
+
+
+class ExceptionTest(fixtures.TestBase):
+    @async_test
+    async def test_closed_connection(self):
+        conn = _adapt_connection()
+        await greenlet_spawn(conn.close)
+
+        # aiosqlite's ValueError is raised as a DBAPI error
+        with testing.expect_raises_message(
+            sqlite3.OperationalError, "no active connection"
+        ):
+            await greenlet_spawn(conn.commit)
+
+    def test_other_errors_pass_through(self):
+        conn = _adapt_connection()
+
+        for error in (
+            ValueError("some other error"),
+            sqlite3.IntegrityError("constraint failed"),
+        ):
+            assert_raises_message(
+                type(error), str(error), conn._handle_exception, error
+            )
+
+    def test_is_disconnect(self):
+        dbapi = _dbapi()
+        dialect = aiosqlite_dialect.dialect(dbapi=dbapi)
+
+        is_true(
+            dialect.is_disconnect(
+                dbapi.OperationalError("no active connection"), None, None
+            )
+        )
+        is_true(
+            dialect.is_disconnect(
+                dbapi.ProgrammingError("Cannot operate on a closed database."),
+                None,
+                None,
+            )
+        )
+        is_false(
+            dialect.is_disconnect(
+                dbapi.OperationalError("database is locked"), None, None
+            )
+        )
+
+
+class DialectTest(fixtures.TestBase):
+    def test_pool_class(self):
+        for u, poolclass in [
+            ("sqlite+aiosqlite://", pool.StaticPool),
+            ("sqlite+aiosqlite:///:memory:", pool.StaticPool),
+            ("sqlite+aiosqlite:///foo.db", pool.NullPool),
+            ("sqlite+aiosqlite:////tmp/foo.db", pool.NullPool),
+        ]:
+            is_(
+                aiosqlite_dialect.dialect.get_pool_class(url.make_url(u)),
+                poolclass,
+            )
+
+    def test_connect_args(self):
+        dialect = aiosqlite_dialect.dialect()
+        eq_(
+            dialect.create_connect_args(
+                url.make_url(
+                    "sqlite+aiosqlite:////tmp/foo.db"
+                    "?timeout=10&check_same_thread=false"
+                )
+            ),
+            (["/tmp/foo.db"], {"timeout": 10.0, "check_same_thread": False}),
+        )
+
+    def test_connect_args_memory(self):
+        dialect = aiosqlite_dialect.dialect()
+        eq_(
+            dialect.create_connect_args(url.make_url("sqlite+aiosqlite://")),
+            ([":memory:"], {}),
+        )
+
+    def test_connect_args_async_fallback(self):
+        dialect = aiosqlite_dialect.dialect()
+        eq_(
+            dialect.create_connect_args(
+                url.make_url(
+                    "sqlite+aiosqlite:///:memory:?async_fallback=true"
+                )
+            ),
+            ([":memory:"], {"async_fallback": "true"}),
+        )
+
+
+class StreamTest(fixtures.TestBase):
+    __only_on__ = "sqlite+aiosqlite"
+
+    @async_test
+    async def test_stream(self):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        is_(type(engine.sync_engine.pool), pool.StaticPool)
+
+        cursors = []
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def before_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            cursors.append(cursor)
+
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("create table t (x integer)"))
+                await conn.execute(
+                    text("insert into t (x) values (:x)"),
+                    [{"x": i} for i in range(5)],
+                )
+
+                result = await conn.stream(text("select x from t order by x"))
+                is_true(cursors[-1].server_side)
+                eq_(await result.fetchmany(2), [(0,), (1,)])
+                eq_(await result.all(), [(2,), (3,), (4,)])
+
+                result = await conn.execute(text("select x from t"))
+                is_false(cursors[-1].server_side)
+                eq_(len(result.all()), 5)
+        finally:
+            await greenlet_spawn(engine.sync_engine.dispose)
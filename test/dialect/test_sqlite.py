@@ -34,6 +34,7 @@ from sqlalchemy import types as sqltypes
 from sqlalchemy import UniqueConstraint
 from sqlalchemy import util
 from sqlalchemy.dialects.sqlite import base as sqlite
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.dialects.sqlite import pysqlite as pysqlite_dialect
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.schema import CreateTable
@@ -1343,6 +1344,126 @@ class OnConflictDDLTest(fixtures.TestBase, AssertsCompiledSQL):
         )
 
 
+class OnConflictCompileTest(fixtures.TestBase, AssertsCompiledSQL):
+
+    __dialect__ = sqlite.dialect()
+
+    def setup(self):
+        self.table = Table(
+            "mytable",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("name", String(128)),
+            Column("description", String(128)),
+        )
+
+    def test_do_nothing(self):
+        i = insert(self.table, values=dict(name="foo"))
+        self.assert_compile(
+            i.on_conflict_do_nothing(),
+            "INSERT INTO mytable (name) VALUES (?) ON CONFLICT DO NOTHING",
+        )
+        self.assert_compile(
+            i.on_conflict_do_nothing(index_elements=["id"]),
+            "INSERT INTO mytable (name) VALUES (?) "
+            "ON CONFLICT (id) DO NOTHING",
+        )
+
+    def test_do_update_set_clause_literal_and_excluded(self):
+        i = insert(self.table, values=dict(name="foo"))
+        i = i.on_conflict_do_update(
+            index_elements=[self.table.c.id],
+            set_=dict(name=i.excluded.name, description="bar"),
+        )
+        self.assert_compile(
+            i,
+            "INSERT INTO mytable (name) VALUES (?) ON CONFLICT (id) "
+            "DO UPDATE SET name = excluded.name, description = ?",
+        )
+
+    def test_do_update_index_where_and_where(self):
+        i = insert(self.table, values=dict(name="foo"))
+        i = i.on_conflict_do_update(
+            index_elements=[self.table.c.name],
+            index_where=self.table.c.description != "x",
+            set_=dict(description=i.excluded.description),
+            where=self.table.c.description.isnot(None),
+        )
+        self.assert_compile(
+            i,
+            "INSERT INTO mytable (name) VALUES (?) ON CONFLICT (name) "
+            "WHERE description != ? DO UPDATE SET "
+            "description = excluded.description "
+            "WHERE mytable.description IS NOT NULL",
+        )
+
+    def test_do_update_requires_index_elements(self):
+        assert_raises_message(
+            ValueError,
+            "index_elements must be specified unless DO NOTHING",
+            insert(self.table).on_conflict_do_update,
+            set_=dict(name="foo"),
+        )
+
+
+class OnConflictTest(fixtures.TablesTest):
+    __only_on__ = ("sqlite >= 3.24.0",)
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(50), unique=True),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(cls.tables.users.insert(), dict(id=1, name="name1"))
+
+    def test_on_conflict_do_nothing(self, connection):
+        users = self.tables.users
+
+        result = connection.execute(
+            insert(users).on_conflict_do_nothing(), dict(id=1, name="name2"),
+        )
+        eq_(result.rowcount, 0)
+        eq_(
+            connection.execute(select(users)).fetchall(), [(1, "name1")],
+        )
+
+    def test_on_conflict_do_update(self, connection):
+        users = self.tables.users
+
+        i = insert(users)
+        i = i.on_conflict_do_update(
+            index_elements=[users.c.id], set_=dict(name=i.excluded.name),
+        )
+        connection.execute(
+            i, [dict(id=1, name="name1 new"), dict(id=2, name="name2")],
+        )
+        eq_(
+            connection.execute(select(users).order_by(users.c.id)).fetchall(),
+            [(1, "name1 new"), (2, "name2")],
+        )
+
+    def test_on_conflict_do_update_unique_where(self, connection):
+        users = self.tables.users
+
+        i = insert(users)
+        i = i.on_conflict_do_update(
+            index_elements=[users.c.name],
+            set_=dict(id=i.excluded.id),
+            where=users.c.id > 5,
+        )
+        connection.execute(i, dict(id=10, name="name1"))
+        eq_(
+            connection.execute(select(users)).fetchall(), [(1, "name1")],
+        )
+
+
 class InsertTest(fixtures.TestBase, AssertsExecutionResults):
 
     """Tests inserts and autoincrement."""
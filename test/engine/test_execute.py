@@ -14,6 +14,7 @@ from sqlalchemy import inspect
 from sqlalchemy import INT
 from sqlalchemy import Integer
 from sqlalchemy import LargeBinary
+from sqlalchemy import literal_column
 from sqlalchemy import MetaData
 from sqlalchemy import select
 from sqlalchemy import Sequence
@@ -26,6 +27,7 @@ from sqlalchemy import VARCHAR
 from sqlalchemy.engine import default
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine.base import SharedCompiledCache
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql import column
 from sqlalchemy.sql import literal
@@ -525,6 +527,53 @@ class ExecuteTest(fixtures.TablesTest):
         )
         eq_(connection.execute(users_autoinc.select()).fetchall(), [(1, None)])
 
+    @testing.combinations(
+        (None,), ("qmark",), ("named",), argnames="paramstyle"
+    )
+    def test_executemany_bind_processors(self, paramstyle):
+        if paramstyle is not None and not testing.against("sqlite"):
+            config.skip_test("paramstyle is specific to sqlite")
+
+        calls = []
+
+        class Prefixed(TypeDecorator):
+            impl = VARCHAR(20)
+
+            def process_bind_param(self, value, dialect):
+                calls.append(value)
+                return "p_%s" % value if value is not None else None
+
+        users = Table(
+            "processed_users",
+            MetaData(),
+            Column("user_id", INT, primary_key=True, autoincrement=False),
+            Column("user_name", Prefixed),
+        )
+
+        eng = testing_engine(
+            options={"paramstyle": paramstyle} if paramstyle else {}
+        )
+        with eng.begin() as conn:
+            users.create(conn)
+            conn.execute(
+                users.insert(),
+                [
+                    {"user_id": 1, "user_name": "jack"},
+                    {"user_id": 2, "user_name": None},
+                    {"user_id": 3, "user_name": "ed"},
+                ],
+            )
+            eq_(
+                conn.execute(
+                    select(users.c.user_id, users.c.user_name).order_by(
+                        users.c.user_id
+                    )
+                ).fetchall(),
+                [(1, "p_jack"), (2, None), (3, "p_ed")],
+            )
+            users.drop(conn)
+        eq_(calls[0:3], ["jack", None, "ed"])
+
     @testing.only_on("sqlite")
     def test_execute_compiled_favors_compiled_paramstyle(self):
         with patch.object(testing.db.dialect, "do_execute") as do_exec:
@@ -983,6 +1032,156 @@ class CompiledCacheTest(fixtures.TestBase):
         ) as conn:
             eq_(conn.scalar(stmt), 1)
 
+    def _stmts(self, count):
+        return [
+            select(literal_column(str(i)).label("x")) for i in range(count)
+        ]
+
+    def test_cache_stats(self):
+        eng = testing_engine(options={"query_cache_size": 4})
+        stats = eng.compiled_cache_stats
+        is_(stats.hit_ratio, None)
+
+        stmt1, stmt2 = self._stmts(2)
+        with eng.connect() as conn:
+            conn.execute(stmt1)
+            conn.execute(stmt1)
+            conn.execute(stmt1)
+            conn.execute(stmt2)
+
+            # not counted, as a different cache is used
+            conn.execution_options(compiled_cache={}).execute(stmt2)
+
+        eq_(stats.hits, 2)
+        eq_(stats.misses, 2)
+        eq_(stats.evictions, 0)
+        eq_(stats.size, 2)
+        eq_(stats.capacity, 4)
+        eq_(stats.hit_ratio, 0.5)
+        is_true(stats.compile_time > 0)
+
+        stats.reset()
+        eq_((stats.hits, stats.misses, stats.compile_time), (0, 0, 0))
+        eq_(stats.size, 2)
+
+    def test_cache_stats_evictions(self):
+        eng = testing_engine(options={"query_cache_size": 4})
+        stats = eng.compiled_cache_stats
+
+        stmts = self._stmts(7)
+        with eng.connect() as conn:
+            for stmt in stmts:
+                conn.execute(stmt)
+
+            # cache of four is pruned at 7 elements
+            eq_(stats.evictions, 3)
+            eq_(stats.size, 4)
+
+            # the earliest statement was pruned and must be compiled again
+            conn.execute(stmts[0])
+
+        eq_(stats.misses, 8)
+        most_compiled = stats.most_compiled(2)
+        eq_(len(most_compiled), 2)
+        eq_(most_compiled[0].compile_count, 2)
+        eq_(most_compiled[0].statement, str(stmts[0].compile(eng)))
+        eq_(most_compiled[1].compile_count, 1)
+
+    def test_cache_stats_option_engine(self):
+        eng = testing_engine(options={"query_cache_size": 4})
+        opt_eng = eng.execution_options(foo="bar")
+
+        with opt_eng.connect() as conn:
+            conn.execute(self._stmts(1)[0])
+
+        is_(opt_eng.compiled_cache_stats, eng.compiled_cache_stats)
+        eq_(eng.compiled_cache_stats.misses, 1)
+
+    def test_cache_stats_disabled(self):
+        eng = testing_engine(options={"query_cache_size": 0})
+        is_(eng.compiled_cache_stats, None)
+
+        with eng.connect() as conn:
+            conn.execute(self._stmts(1)[0])
+
+    def test_cache_miss_event(self):
+        eng = testing_engine(options={"query_cache_size": 4})
+        canary = Mock()
+        event.listen(eng, "compiled_cache_miss", canary)
+
+        stmt1, stmt2 = self._stmts(2)
+        with eng.connect() as conn:
+            conn.execute(stmt1)
+            conn.execute(stmt1)
+            conn.execute(stmt2)
+            conn.execution_options(compiled_cache=None).execute(stmt2)
+
+        eq_(
+            [c[0][1] for c in canary.call_args_list], [stmt1, stmt2],
+        )
+        conn_, elem, compiled, compile_time = canary.call_args_list[0][0]
+        eq_(compiled.string, str(stmt1.compile(eng)))
+        is_true(compile_time > 0)
+
+    def _shared_cache_engines(self, cache, *options):
+        engines = [
+            testing_engine(options=dict(opts, query_cache=cache))
+            for opts in options
+        ]
+        for eng in engines:
+            # establish the dialect's identity on first connect; statements
+            # run by the dialect when it initializes aren't shared
+            eng.connect().close()
+        cache.stats.reset()
+        return engines
+
+    def test_shared_cache(self):
+        cache = SharedCompiledCache(10)
+        e1, e2 = self._shared_cache_engines(cache, {}, {})
+        is_(e1.compiled_cache_stats, cache.stats)
+        is_(e2.compiled_cache_stats, cache.stats)
+        is_(
+            e1.dialect._compiled_cache_identity,
+            e2.dialect._compiled_cache_identity,
+        )
+
+        stmt = self._stmts(1)[0]
+        with e1.connect() as conn:
+            eq_(conn.scalar(stmt), 0)
+        with e2.connect() as conn:
+            eq_(conn.scalar(stmt), 0)
+
+        eq_(cache.stats.misses, 1)
+        eq_(cache.stats.hits, 1)
+
+    def test_shared_cache_distinct_dialects(self):
+        cache = SharedCompiledCache(10)
+        e1, e2 = self._shared_cache_engines(cache, {}, {"label_length": 30})
+        is_not_(
+            e1.dialect._compiled_cache_identity,
+            e2.dialect._compiled_cache_identity,
+        )
+
+        stmt = self._stmts(1)[0]
+        with e1.connect() as conn:
+            conn.execute(stmt)
+        with e2.connect() as conn:
+            conn.execute(stmt)
+
+        eq_(cache.stats.misses, 2)
+        eq_(cache.stats.hits, 0)
+
+    def test_shared_cache_clear(self):
+        cache = SharedCompiledCache(10)
+        e1, e2 = self._shared_cache_engines(cache, {}, {})
+
+        with e1.connect() as conn:
+            conn.execute(self._stmts(1)[0])
+        is_true(len(cache) > 0)
+
+        e2.clear_compiled_cache()
+        eq_(len(cache), 0)
+
 
 class MockStrategyTest(fixtures.TestBase):
     def _engine_fixture(self):
@@ -1267,6 +1466,48 @@ class SchemaTranslateTest(fixtures.TestBase, testing.AssertsExecutionResults):
             CompiledSQL("SELECT [SCHEMA_foo].t2.x FROM [SCHEMA_foo].t2")
         )
 
+    @testing.provide_metadata
+    def test_translated_statement_cached_per_map(self):
+        metadata = self.metadata
+        t1 = Table("t1", metadata, Column("x", Integer))
+        t1_schema = Table(
+            "t1", metadata, Column("x", Integer), schema=config.test_schema
+        )
+        metadata.create_all()
+
+        with config.db.connect() as conn:
+            conn.execute(t1.insert(), {"x": 1})
+            conn.execute(t1_schema.insert(), {"x": 2})
+
+            t1_translated = Table("t1", MetaData(), Column("x", Integer))
+            stmt = select(t1_translated.c.x)
+
+            map_one = {None: None}
+            map_two = {None: config.test_schema}
+
+            result = conn.execution_options(
+                schema_translate_map=map_one
+            ).execute(stmt)
+            compiled = result.context.compiled
+            eq_(result.scalar(), 1)
+
+            for map_, expected in [
+                (map_two, 2),
+                (map_one, 1),
+                (dict(map_two), 2),
+            ]:
+                result = conn.execution_options(
+                    schema_translate_map=map_
+                ).execute(stmt)
+                is_(result.context.compiled, compiled)
+                eq_(result.scalar(), expected)
+
+            eq_(len(compiled._schema_translate_cache), 2)
+
+            # the map passed in is not modified
+            eq_(map_one, {None: None})
+            eq_(map_two, {None: config.test_schema})
+
 
 class ExecutionOptionsTest(fixtures.TestBase):
     def test_dialect_conn_options(self):
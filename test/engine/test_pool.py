@@ -1664,6 +1664,397 @@ class QueuePoolTest(PoolTestBase):
         pc3.close()
         pc1.close()
 
+    def _status(self, p):
+        return (p.size(), p.checkedin(), p.overflow(), p.checkedout())
+
+    def _join_prewarm(self, p):
+        worker = p._prewarm_worker
+        if worker is not None:
+            worker.join(join_timeout)
+
+    def test_prewarm(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, max_overflow=2)
+
+        eq_(p.prewarm(), 3)
+        eq_(self._status(p), (3, 3, 0, 0))
+        eq_(dbapi.connect.call_count, 3)
+
+        c1 = p.connect()
+        c2 = p.connect()
+        eq_(dbapi.connect.call_count, 3)
+        eq_(self._status(p), (3, 1, 0, 2))
+
+        # pool already has idle connections up to the number given
+        eq_(p.prewarm(1), 0)
+        eq_(p.prewarm(), 2)
+        eq_(self._status(p), (3, 3, 2, 2))
+
+        c1.close()
+        c2.close()
+        eq_(self._status(p), (3, 3, 0, 0))
+        eq_(dbapi.connect.call_count, 5)
+
+    def test_prewarm_limited_to_pool_size(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, max_overflow=2)
+
+        eq_(p.prewarm(10), 3)
+        eq_(self._status(p), (3, 3, 0, 0))
+
+    def test_prewarm_limited_by_overflow(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, max_overflow=0)
+
+        c1 = p.connect()
+        c2 = p.connect()
+        eq_(p.prewarm(), 1)
+        eq_(self._status(p), (3, 1, 0, 2))
+
+        c3 = p.connect()
+        eq_(p.prewarm(), 0)
+        eq_(dbapi.connect.call_count, 3)
+
+        for c in (c1, c2, c3):
+            c.close()
+
+    def test_prewarm_connect_error(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, max_overflow=0)
+
+        dbapi.shutdown(True)
+        assert_raises_message(Exception, "connect failed", p.prewarm)
+        eq_(self._status(p), (3, 0, -3, 0))
+
+        dbapi.shutdown(False)
+        eq_(p.prewarm(), 3)
+
+    def test_prewarm_background(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, max_overflow=2)
+
+        is_(p.prewarm(2, background=True), None)
+        self._join_prewarm(p)
+        eq_(self._status(p), (3, 2, -1, 0))
+
+    def test_prewarm_background_error_logged(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, max_overflow=0)
+
+        dbapi.shutdown(True)
+        with patch.object(p, "logger") as logger:
+            p.prewarm(background=True)
+            self._join_prewarm(p)
+
+        eq_(
+            logger.error.mock_calls,
+            [
+                call(
+                    "Exception opening connections in the background",
+                    exc_info=True,
+                )
+            ],
+        )
+        eq_(self._status(p), (3, 0, -3, 0))
+
+    def test_prewarm_background_dispose(self):
+        connecting = threading.Event()
+        proceed = threading.Event()
+        connections = []
+
+        def creator():
+            conn = Mock()
+            connections.append(conn)
+            if len(connections) == 2:
+                connecting.set()
+                proceed.wait(join_timeout)
+            return conn
+
+        p = pool.QueuePool(creator, pool_size=3)
+        p.prewarm(background=True)
+        worker = p._prewarm_worker
+
+        connecting.wait(join_timeout)
+        p.dispose()
+        is_(p._prewarm_worker, None)
+        proceed.set()
+        worker.join(join_timeout)
+
+        # the worker stops once the connection it was opening when the
+        # pool was disposed is established, and closes it
+        eq_(len(connections), 2)
+        for conn in connections:
+            eq_(conn.close.mock_calls, [call()])
+        eq_(self._status(p), (3, 0, -3, 0))
+
+    def test_min_idle(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, max_overflow=0, min_idle=2
+        )
+
+        # the pool isn't filled until it's used
+        eq_(dbapi.connect.call_count, 0)
+
+        c1 = p.connect()
+        self._join_prewarm(p)
+        eq_(self._status(p), (5, 2, -2, 1))
+
+        c2 = p.connect()
+        c3 = p.connect()
+        self._join_prewarm(p)
+        eq_(self._status(p), (5, 2, 0, 3))
+
+        c4 = p.connect()
+        c5 = p.connect()
+        self._join_prewarm(p)
+        eq_(self._status(p), (5, 0, 0, 5))
+
+        for c in (c1, c2, c3, c4, c5):
+            c.close()
+        eq_(self._status(p), (5, 5, 0, 0))
+        eq_(dbapi.connect.call_count, 5)
+
+    def test_min_idle_limited_to_pool_size(self):
+        p = self._queuepool_fixture(pool_size=3, min_idle=10)
+        eq_(p._min_idle, 3)
+
+        p2 = p.recreate()
+        eq_(p2._min_idle, 3)
+
+    def test_min_idle_replaces_invalidated(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, min_idle=1
+        )
+
+        c1 = p.connect()
+        self._join_prewarm(p)
+        eq_(self._status(p), (3, 1, -1, 1))
+        rec = c1._connection_record
+
+        c1.invalidate()
+        c1.close()
+        self._join_prewarm(p)
+
+        # the invalidated record is discarded, not returned to the pool
+        eq_(self._status(p), (3, 1, -2, 0))
+        c2 = p.connect()
+        is_not_(c2._connection_record, rec)
+        is_not_(c2.connection, None)
+        c2.close()
+
+    def _maintenance_dialect(self):
+        return Mock(
+            do_ping=Mock(return_value=True),
+            do_close=Mock(side_effect=lambda conn: conn.close()),
+        )
+
+    def _maintenance_fixture(self, **kw):
+        dialect = self._maintenance_dialect()
+        dbapi, p = self._queuepool_dbapi_fixture(
+            dialect=dialect, maintenance_interval=5, **kw
+        )
+        return dbapi, dialect, p
+
+    def test_maintenance_recycle(self):
+        dbapi, dialect, p = self._maintenance_fixture(pool_size=3, recycle=10)
+        eq_(p.prewarm(2), 2)
+        old, new = p._pool.items()
+        old_conn, new_conn = old.connection, new.connection
+
+        # will exceed the recycle time before the next run
+        old.starttime -= 6
+
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.checkedin(), 2)
+        is_true(old_conn.closed)
+        is_not_(old.connection, old_conn)
+        is_(new.connection, new_conn)
+
+        # no pinging unless pre_ping is set
+        eq_(dialect.do_ping.mock_calls, [])
+
+    def test_maintenance_invalidated(self):
+        dbapi, dialect, p = self._maintenance_fixture(pool_size=3)
+        eq_(p.prewarm(2), 2)
+        c1, c2 = p._pool.items()
+        conn = c1.connection
+
+        c1.invalidate(soft=True)
+        time.sleep(0.02)
+
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 3)
+        is_true(conn.closed)
+        is_not_(c1.connection, conn)
+
+    def test_maintenance_ping(self):
+        dbapi, dialect, p = self._maintenance_fixture(
+            pool_size=3, pre_ping=True
+        )
+        c1 = p.connect()
+        rec = c1._connection_record
+        c1.close()
+        eq_(dialect.do_ping.mock_calls, [])
+        is_(rec.fresh, False)
+
+        p._run_maintenance()
+        eq_(dialect.do_ping.mock_calls, [call(rec.connection)])
+        is_(rec.fresh, True)
+
+        # the connection was pinged ahead of time, so isn't pinged again
+        # on checkout
+        c1 = p.connect()
+        eq_(len(dialect.do_ping.mock_calls), 1)
+        c1.close()
+
+        p._run_maintenance()
+        eq_(len(dialect.do_ping.mock_calls), 2)
+        eq_(dbapi.connect.call_count, 1)
+
+    def test_maintenance_ping_fails(self):
+        dbapi, dialect, p = self._maintenance_fixture(
+            pool_size=3, pre_ping=True
+        )
+        c1, c2 = p.connect(), p.connect()
+        c1.close()
+        c2.close()
+        time.sleep(0.02)
+        conns = [rec.connection for rec in p._pool.items()]
+
+        dialect.do_ping.return_value = False
+        p._run_maintenance()
+
+        # the first failed ping invalidates the pool, so that the other
+        # connection is recycled without being pinged
+        eq_(len(dialect.do_ping.mock_calls), 1)
+        eq_(dbapi.connect.call_count, 4)
+        eq_(p.checkedin(), 2)
+        for conn in conns:
+            is_true(conn.closed)
+
+    def test_maintenance_connect_error(self):
+        dbapi, dialect, p = self._maintenance_fixture(pool_size=3, recycle=1)
+        eq_(p.prewarm(1), 1)
+
+        dbapi.shutdown(True)
+        with patch.object(p, "logger") as logger:
+            p._run_maintenance()
+        eq_(
+            logger.error.mock_calls,
+            [call("Exception during pool maintenance", exc_info=True)],
+        )
+
+        # the record stays in the pool, and connects on its next checkout
+        eq_(p.checkedin(), 1)
+        dbapi.shutdown(False)
+        c1 = p.connect()
+        is_not_(c1.connection, None)
+        c1.close()
+
+    def test_maintenance_lifo_order(self):
+        dbapi, dialect, p = self._maintenance_fixture(
+            pool_size=3, use_lifo=True
+        )
+        eq_(p.prewarm(), 3)
+        recs = p._pool.items()
+
+        p._run_maintenance()
+        eq_(p._pool.items(), recs)
+
+    def _slow_ping_fixture(self, **kw):
+        dbapi, dialect, p = self._maintenance_fixture(pre_ping=True, **kw)
+        pinging = threading.Event()
+        release = threading.Event()
+
+        def do_ping(conn):
+            # only the first ping is slow
+            if not pinging.is_set():
+                pinging.set()
+                release.wait(join_timeout)
+            return True
+
+        dialect.do_ping.side_effect = do_ping
+        return dbapi, p, pinging, release
+
+    def test_maintenance_checkout_during_ping(self):
+        dbapi, p, pinging, release = self._slow_ping_fixture(
+            pool_size=2, max_overflow=0, timeout=join_timeout
+        )
+        eq_(p.prewarm(), 2)
+        pinged, other = p._pool.items()
+        pinged.fresh = other.fresh = False
+
+        t = threading.Thread(target=p._run_maintenance)
+        t.start()
+        try:
+            pinging.wait(join_timeout)
+
+            # only the record being pinged is out of the pool
+            eq_(p.checkedin(), 1)
+            now = time.time()
+            c1 = p.connect()
+            is_(c1._connection_record, other)
+            assert time.time() - now < 1
+        finally:
+            release.set()
+            t.join(join_timeout)
+
+        c1.close()
+        eq_(p.checkedin(), 2)
+        eq_(dbapi.connect.call_count, 2)
+
+    def test_maintenance_dispose_during_ping(self):
+        dbapi, p, pinging, release = self._slow_ping_fixture(
+            pool_size=2, max_overflow=0
+        )
+        eq_(p.prewarm(), 2)
+        for rec in p._pool.items():
+            rec.fresh = False
+        conns = [rec.connection for rec in p._pool.items()]
+
+        # the pass below stands in for one run by the worker
+        p._start_maintenance()
+        t = threading.Thread(target=p._run_maintenance)
+        t.start()
+        try:
+            pinging.wait(join_timeout)
+            p.dispose()
+        finally:
+            release.set()
+            t.join(join_timeout)
+
+        # the record that was being pinged is closed, not returned to
+        # the disposed pool
+        eq_(p.checkedin(), 0)
+        for conn in conns:
+            is_true(conn.closed)
+
+    def test_maintenance_worker(self):
+        dialect = self._maintenance_dialect()
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3,
+            pre_ping=True,
+            dialect=dialect,
+            maintenance_interval=0.01,
+        )
+
+        # the worker isn't started until the pool is used
+        is_(p._maintenance_worker, None)
+
+        c1 = p.connect()
+        conn = c1.connection
+        worker, stop = p._maintenance_worker
+        c1.close()
+
+        for i in range(500):
+            if dialect.do_ping.mock_calls:
+                break
+            time.sleep(0.01)
+        eq_(dialect.do_ping.mock_calls[0], call(conn))
+
+        p.dispose()
+        worker.join(join_timeout)
+        assert not worker.is_alive()
+        is_(p._maintenance_worker, None)
+
+        p2 = p.recreate()
+        eq_(p2._maintenance_interval, 0.01)
+
 
 class ResetOnReturnTest(PoolTestBase):
     def _fixture(self, **kw):
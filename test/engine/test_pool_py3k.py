@@ -0,0 +1,179 @@
+import asyncio
+
+from sqlalchemy import pool
+from sqlalchemy import testing
+from sqlalchemy.testing import async_test
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_true
+from sqlalchemy.testing.mock import call
+from sqlalchemy.testing.mock import Mock
+from sqlalchemy.util import await_only
+from sqlalchemy.util import greenlet_spawn
+from sqlalchemy.util import queue as sqla_queue
+
+
+class AsyncAdaptedQueuePoolTest(fixtures.TestBase):
+    def _fixture(self, **kw):
+        connections = []
+
+        async def async_connect():
+            await asyncio.sleep(0)
+            conn = Mock()
+            connections.append(conn)
+            return conn
+
+        def creator():
+            return await_only(async_connect())
+
+        return connections, pool.AsyncAdaptedQueuePool(creator, **kw)
+
+    @async_test
+    async def test_prewarm(self):
+        connections, p = self._fixture(pool_size=3)
+
+        eq_(await greenlet_spawn(p.prewarm, 2), 2)
+        eq_(p.checkedin(), 2)
+        eq_(len(connections), 2)
+
+    @async_test
+    async def test_prewarm_background(self):
+        connections, p = self._fixture(pool_size=3)
+
+        p.prewarm(background=True)
+        await p._prewarm_worker
+
+        eq_(p.checkedin(), 3)
+        eq_(len(connections), 3)
+
+    @async_test
+    async def test_prewarm_background_dispose(self):
+        connecting = asyncio.Event()
+        proceed = asyncio.Event()
+        connections = []
+
+        async def async_connect():
+            conn = Mock()
+            connections.append(conn)
+            if len(connections) == 2:
+                connecting.set()
+                await proceed.wait()
+            return conn
+
+        def creator():
+            return await_only(async_connect())
+
+        p = pool.AsyncAdaptedQueuePool(creator, pool_size=3)
+        p.prewarm(background=True)
+        worker = p._prewarm_worker
+
+        await connecting.wait()
+        await greenlet_spawn(p.dispose)
+        is_(p._prewarm_worker, None)
+        proceed.set()
+        await worker
+
+        eq_(len(connections), 2)
+        for conn in connections:
+            eq_(conn.close.mock_calls, [call()])
+        eq_(p.checkedin(), 0)
+
+    @async_test
+    async def test_min_idle(self):
+        connections, p = self._fixture(pool_size=5, max_overflow=0, min_idle=2)
+
+        c1 = await greenlet_spawn(p.connect)
+        await p._prewarm_worker
+
+        eq_(p.checkedin(), 2)
+        eq_(p.checkedout(), 1)
+        eq_(len(connections), 3)
+
+        await greenlet_spawn(c1.close)
+        eq_(p.checkedin(), 3)
+
+    @async_test
+    async def test_maintenance(self):
+        dialect = Mock(do_ping=Mock(return_value=True))
+        connections, p = self._fixture(
+            pool_size=3,
+            pre_ping=True,
+            dialect=dialect,
+            maintenance_interval=0.01,
+        )
+
+        c1 = await greenlet_spawn(p.connect)
+        task, cancel = p._maintenance_worker
+        await greenlet_spawn(c1.close)
+
+        for i in range(500):
+            if dialect.do_ping.mock_calls:
+                break
+            await asyncio.sleep(0.01)
+        eq_(dialect.do_ping.mock_calls[0], call(connections[0]))
+
+        await greenlet_spawn(p.dispose)
+        await task
+        is_true(task.done())
+        is_(p._maintenance_worker, None)
+
+    @async_test
+    async def test_maintenance_dispose_during_ping(self):
+        pinging = asyncio.Event()
+        proceed = asyncio.Event()
+
+        def do_ping(conn):
+            pinging.set()
+            await_only(proceed.wait())
+            return True
+
+        dialect = Mock(do_ping=Mock(side_effect=do_ping))
+        connections, p = self._fixture(
+            pool_size=1,
+            pre_ping=True,
+            dialect=dialect,
+            maintenance_interval=0.01,
+        )
+
+        c1 = await greenlet_spawn(p.connect)
+        task, stop = p._maintenance_worker
+        await greenlet_spawn(c1.close)
+
+        await asyncio.wait_for(pinging.wait(), 5)
+        await greenlet_spawn(p.dispose)
+        proceed.set()
+        await task
+
+        # the record that was being pinged is closed, not returned to
+        # the disposed pool
+        eq_(len(connections), 1)
+        eq_(dialect.do_close.mock_calls, [call(connections[0])])
+        eq_(p.checkedin(), 0)
+
+
+class AsyncAdaptedQueueTest(fixtures.TestBase):
+    @testing.combinations((False, [1, 3]), (True, [3, 1]), argnames="lifo,get")
+    @async_test
+    async def test_remove(self, lifo, get):
+        q = sqla_queue.AsyncAdaptedQueue(maxsize=3, use_lifo=lifo)
+        for i in (1, 2, 3):
+            q.put_nowait(i)
+
+        is_true(q.remove(2))
+        is_(q.remove(2), False)
+        eq_(q.items(), [1, 3])
+        eq_([q.get_nowait() for i in range(2)], get)
+
+    @async_test
+    async def test_remove_wakes_put(self):
+        q = sqla_queue.AsyncAdaptedQueue(maxsize=1)
+        q.put_nowait(1)
+
+        put = asyncio.ensure_future(q._queue.put(2))
+        await asyncio.sleep(0)
+        is_(put.done(), False)
+
+        is_true(q.remove(1))
+        await asyncio.wait_for(put, 5)
+        eq_(q.items(), [2])
@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 import unicodedata
 
 import sqlalchemy as sa
@@ -14,6 +17,7 @@ from sqlalchemy import sql
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy import UniqueConstraint
+from sqlalchemy.engine.reflection import FileReflectionCache
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import AssertsCompiledSQL
@@ -1395,11 +1399,15 @@ class ReflectionTest(fixtures.TestBase, ComparesTables):
         sa.Index("x_ix", t.c.a, t.c.b)
         self.metadata.create_all()
 
-        def mock_get_columns(self, connection, table_name, **kw):
-            return [{"name": "b", "type": Integer, "primary_key": False}]
+        def mock_get_multi_columns(connection, schema=None, **kw):
+            return {
+                (schema, "x"): [
+                    {"name": "b", "type": Integer, "primary_key": False}
+                ]
+            }
 
         with testing.mock.patch.object(
-            testing.db.dialect, "get_columns", mock_get_columns
+            testing.db.dialect, "get_multi_columns", mock_get_multi_columns
         ):
             m = MetaData()
             with testing.expect_warnings(
@@ -2300,3 +2308,270 @@ class ComputedColumnTest(fixtures.ComputedReflectionFixtureTest):
             self.check_table_column(
                 table, "computed_stored", "normal-42", True,
             )
+
+
+class MultiReflectionTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column("user_id", sa.Integer, primary_key=True),
+            Column("user_name", sa.String(40), unique=True),
+        )
+        Table(
+            "email_addresses",
+            metadata,
+            Column("address_id", sa.Integer, primary_key=True),
+            Column("user_id", sa.Integer, sa.ForeignKey("users.user_id")),
+            Column("email_address", sa.String(40), index=True),
+        )
+        Table(
+            "orders",
+            metadata,
+            Column("order_id", sa.Integer, primary_key=True),
+            Column("user_id", sa.Integer, sa.ForeignKey("users.user_id")),
+        )
+
+    def test_get_multi_columns(self, connection):
+        insp = inspect(connection)
+        result = insp.get_multi_columns()
+
+        eq_(
+            set(result),
+            {(None, "users"), (None, "email_addresses"), (None, "orders")},
+        )
+        eq_(
+            [col["name"] for col in result[(None, "email_addresses")]],
+            ["address_id", "user_id", "email_address"],
+        )
+        eq_(
+            [col["name"] for col in result[(None, "users")]],
+            [col["name"] for col in insp.get_columns("users")],
+        )
+
+    def test_get_multi_filter_names(self, connection):
+        insp = inspect(connection)
+
+        result = insp.get_multi_pk_constraint(
+            filter_names=["users", "orders", "nonexistent"]
+        )
+        eq_(set(result), {(None, "users"), (None, "orders")})
+        eq_(
+            result[(None, "users")]["constrained_columns"], ["user_id"],
+        )
+
+        result = insp.get_multi_foreign_keys(filter_names=["orders"])
+        eq_(list(result), [(None, "orders")])
+        eq_(
+            [
+                (fk["referred_table"], fk["referred_columns"])
+                for fk in result[(None, "orders")]
+            ],
+            [("users", ["user_id"])],
+        )
+
+    def test_get_multi_matches_single(self, connection):
+        insp = inspect(connection)
+        for name in ("users", "email_addresses", "orders"):
+            eq_(
+                insp.get_multi_pk_constraint(filter_names=[name])[
+                    (None, name)
+                ],
+                insp.get_pk_constraint(name),
+            )
+            eq_(
+                insp.get_multi_foreign_keys(filter_names=[name])[(None, name)],
+                insp.get_foreign_keys(name),
+            )
+            eq_(
+                insp.get_multi_indexes(filter_names=[name])[(None, name)],
+                insp.get_indexes(name),
+            )
+
+    @testing.only_on(["sqlite", "postgresql", "oracle"])
+    def test_reflect_query_count(self, connection):
+        def count_statements(only):
+            stmts = []
+
+            @sa.event.listens_for(connection, "before_cursor_execute")
+            def before_cursor_execute(conn, cursor, stmt, *arg):
+                stmts.append(stmt)
+
+            try:
+                MetaData().reflect(connection, only=only)
+            finally:
+                sa.event.remove(
+                    connection, "before_cursor_execute", before_cursor_execute
+                )
+            return len(stmts)
+
+        # the catalog queries are run for all the tables at once, so
+        # reflecting more tables doesn't run more statements
+        eq_(
+            count_statements(["users"]),
+            count_statements(["users", "email_addresses", "orders"]),
+        )
+
+
+class MultiReflectionQuotingTest(fixtures.TablesTest):
+    """Bulk reflection of quoted and mixed case table names.
+
+    quoted_name.lower() returns a quoted name unchanged, so the names here
+    are mixed case in order that case folding is exercised.
+
+    """
+
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "QuotedTable",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            quote=True,
+        )
+        Table(
+            "MixedCase",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("q_id", Integer, ForeignKey("QuotedTable.id")),
+        )
+
+    def test_get_multi_filter_names(self, connection):
+        insp = inspect(connection)
+
+        result = insp.get_multi_columns(
+            filter_names=[
+                sql.quoted_name("QuotedTable", True),
+                sql.quoted_name("MixedCase", None),
+            ]
+        )
+        eq_(set(result), {(None, "QuotedTable"), (None, "MixedCase")})
+        eq_(
+            [col["name"] for col in result[(None, "MixedCase")]],
+            ["id", "q_id"],
+        )
+
+    def test_autoload_quoted(self, connection):
+        m = MetaData()
+        t1 = Table("QuotedTable", m, autoload_with=connection, quote=True)
+        eq_(list(t1.c.keys()), ["id"])
+
+    def test_autoload_mixed_case(self, connection):
+        m = MetaData()
+        t1 = Table("MixedCase", m, autoload_with=connection)
+        eq_(list(t1.c.keys()), ["id", "q_id"])
+        assert "QuotedTable" in m.tables
+
+    def test_reflect(self, connection):
+        m = MetaData()
+        m.reflect(connection, only=["QuotedTable", "MixedCase"])
+        eq_(set(m.tables), {"QuotedTable", "MixedCase"})
+
+
+class ReflectionCacheTest(fixtures.TestBase):
+    __only_on__ = "sqlite"
+
+    def setup(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = FileReflectionCache(self.directory)
+        self.engine = engines.testing_engine(
+            options={"reflection_cache": self.cache}
+        )
+        self.metadata = MetaData()
+        Table(
+            "parent",
+            self.metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(30), index=True),
+        )
+        Table(
+            "child",
+            self.metadata,
+            Column("id", Integer, primary_key=True),
+            Column("parent_id", Integer, ForeignKey("parent.id")),
+        )
+        self.metadata.create_all(self.engine)
+
+    def teardown(self):
+        self.metadata.drop_all(self.engine)
+        self.engine.dispose()
+        shutil.rmtree(self.directory)
+
+    def _reflect(self):
+        stmts = []
+
+        @sa.event.listens_for(self.engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, stmt, *arg):
+            stmts.append(stmt)
+
+        try:
+            m = MetaData()
+            m.reflect(self.engine)
+        finally:
+            sa.event.remove(
+                self.engine, "before_cursor_execute", before_cursor_execute
+            )
+        return m, [stmt for stmt in stmts if "pragma_" in stmt]
+
+    def test_reflect_uses_stored_info(self):
+        m1, stmts = self._reflect()
+        assert stmts
+        eq_(len(os.listdir(self.directory)), 1)
+
+        m2, stmts = self._reflect()
+        eq_(stmts, [])
+
+        for m in (m1, m2):
+            eq_(set(m.tables), {"parent", "child"})
+            eq_(list(m.tables["child"].c.keys()), ["id", "parent_id"])
+            eq_(
+                [
+                    fk.target_fullname
+                    for fk in m.tables["child"].c.parent_id.foreign_keys
+                ],
+                ["parent.id"],
+            )
+            eq_(
+                [ix.name for ix in m.tables["parent"].indexes],
+                ["ix_parent_name"],
+            )
+
+    def test_schema_change_invalidates(self):
+        self._reflect()
+
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("ALTER TABLE child ADD COLUMN data INTEGER")
+
+        m, stmts = self._reflect()
+        assert stmts
+        eq_(list(m.tables["child"].c.keys()), ["id", "parent_id", "data"])
+
+    def test_autoload_table(self):
+        Table("parent", MetaData(), autoload_with=self.engine)
+        t = Table("parent", MetaData(), autoload_with=self.engine)
+        eq_(list(t.c.keys()), ["id", "name"])
+        eq_(len(os.listdir(self.directory)), 1)
+
+    def test_unreadable_file(self):
+        self._reflect()
+        for name in os.listdir(self.directory):
+            with open(os.path.join(self.directory, name), "wb") as file_:
+                file_.write(b"garbage")
+
+        m, stmts = self._reflect()
+        assert stmts
+        eq_(set(m.tables), {"parent", "child"})
+
+    def test_clear(self):
+        self.cache.set(("some", "key"), {"some": "value"})
+        eq_(self.cache.get(("some", "key")), {"some": "value"})
+        is_(self.cache.get(("some", "other key")), None)
+
+        self.cache.clear()
+        is_(self.cache.get(("some", "key")), None)
+        eq_(os.listdir(self.directory), [])
@@ -76,6 +76,39 @@ class AsyncSessionQueryTest(AsyncFixture):
             ],
         )
 
+    @async_test
+    async def test_stream_expunge_per_chunk(self, async_session):
+        User = self.classes.User
+
+        stmt = (
+            select(User)
+            .options(selectinload(User.addresses))
+            .order_by(User.id)
+        )
+
+        result = await async_session.stream(
+            stmt, execution_options={"yield_per": 2, "expunge_per_chunk": True}
+        )
+
+        assert_result = []
+        async for partition in result.scalars().partitions():
+            for user in assert_result:
+                is_(user in async_session.sync_session, False)
+            eq_(
+                len(async_session.sync_session.identity_map),
+                len(partition) + sum(len(u.addresses) for u in partition),
+            )
+            assert_result.extend(partition)
+
+        # the objects are detached, so compare on the loaded attributes
+        eq_(
+            [(u.id, [a.id for a in u.addresses]) for u in assert_result],
+            [
+                (u.id, [a.id for a in u.addresses])
+                for u in self.static.user_address_result
+            ],
+        )
+
 
 class AsyncSessionTransactionTest(AsyncFixture):
     run_inserts = None
@@ -1,10 +1,13 @@
 import datetime
 import os
+import threading
+import time
 
 from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import delete
 from sqlalchemy import event
+from sqlalchemy import exc
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import inspect
@@ -17,10 +20,14 @@ from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy import update
 from sqlalchemy import util
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.horizontal_shard import _compares_as_python
 from sqlalchemy.ext.horizontal_shard import ShardedSession
 from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import create_session
 from sqlalchemy.orm import deferred
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import mapper
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import selectinload
@@ -28,6 +35,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import SingletonThreadPool
 from sqlalchemy.sql import operators
+from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
@@ -36,7 +44,7 @@ from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing.engines import testing_reaper
 
 
-class ShardTest(object):
+class _ShardFixture(object):
     __skip_if__ = (lambda: util.win32,)
     __requires__ = ("sqlite",)
 
@@ -193,6 +201,8 @@ class ShardTest(object):
         sess.close()
         return sess
 
+
+class ShardTest(_ShardFixture):
     def test_get(self):
         sess = self._fixture_data()
         tokyo = sess.query(WeatherLocation).get(1)
@@ -376,6 +386,168 @@ class ShardTest(object):
         t = bq(sess).with_post_criteria(lambda q: q.set_shard("asia")).one()
         eq_(t.city, tokyo.city)
 
+    @testing.only_on("sqlite")
+    def test_ordered_merge(self):
+        sess = self._fixture_data()
+        sess.ordered_merge = True
+
+        eq_(
+            [
+                c.city
+                for c in sess.query(WeatherLocation)
+                .order_by(WeatherLocation.city)
+                .all()
+            ],
+            [
+                "Brasila",
+                "Dublin",
+                "London",
+                "New York",
+                "Quito",
+                "Tokyo",
+                "Toronto",
+            ],
+        )
+
+    @testing.only_on("sqlite")
+    def test_ordered_merge_multiple_desc_limit(self):
+        sess = self._fixture_data()
+        sess.ordered_merge = True
+
+        stmt = (
+            select(WeatherLocation.continent, WeatherLocation.city)
+            .order_by(WeatherLocation.continent.desc(), WeatherLocation.city)
+            .limit(4)
+        )
+        eq_(
+            sess.execute(stmt).all(),
+            [
+                ("South America", "Brasila"),
+                ("South America", "Quito"),
+                ("North America", "New York"),
+                ("North America", "Toronto"),
+            ],
+        )
+
+    def test_ordered_merge_first(self):
+        sess = self._fixture_data()
+        sess.ordered_merge = True
+
+        eq_(
+            sess.query(WeatherLocation)
+            .order_by(WeatherLocation.id.desc())
+            .first()
+            .city,
+            "Quito",
+        )
+
+    @testing.only_on("sqlite")
+    def test_ordered_merge_no_attribute_load(self):
+        sess = self._fixture_data()
+        sess.ordered_merge = True
+
+        # "city" is deferred; it's also expired on objects that are
+        # already present
+        sess.query(WeatherLocation).filter(
+            WeatherLocation.continent == "Europe"
+        ).all()
+        sess.expire_all()
+
+        # engines may share their event listeners; collect the distinct
+        # execution contexts
+        contexts = set()
+        for db in self._dbs:
+            event.listen(
+                db,
+                "before_cursor_execute",
+                lambda conn, cursor, stmt, params, context, executemany: (
+                    contexts.add(context)
+                ),
+            )
+
+        result = (
+            sess.query(WeatherLocation).order_by(WeatherLocation.city).all()
+        )
+
+        # one SELECT per shard, no loads emitted for the sort key
+        eq_(len(contexts), 4)
+        eq_(
+            [c.city for c in result],
+            [
+                "Brasila",
+                "Dublin",
+                "London",
+                "New York",
+                "Quito",
+                "Tokyo",
+                "Toronto",
+            ],
+        )
+
+    def test_ordered_merge_joinedload_limit(self):
+        sess = self._fixture_data()
+        sess.ordered_merge = True
+
+        tokyo = (
+            sess.query(WeatherLocation)
+            .filter(WeatherLocation.continent == "Asia")
+            .one()
+        )
+        tokyo.reports.append(Report(82.0))
+        sess.commit()
+
+        # "Tokyo" is delivered in two rows; LIMIT counts locations
+        eq_(
+            [
+                (c.city, sorted(r.temperature for r in c.reports))
+                for c in sess.query(WeatherLocation)
+                .options(joinedload(WeatherLocation.reports))
+                .order_by(WeatherLocation.id)
+                .limit(2)
+            ],
+            [("Tokyo", [80.0, 82.0]), ("New York", [75.0])],
+        )
+
+    @testing.only_on("sqlite")
+    def test_ordered_merge_core(self):
+        sess = self._fixture_data()
+        sess.ordered_merge = True
+
+        eq_(
+            sess.execute(
+                select(weather_locations.c.city)
+                .order_by(weather_locations.c.city.desc())
+                .limit(3)
+            ).all(),
+            [("Toronto",), ("Tokyo",), ("Quito",)],
+        )
+
+    @testing.only_on("sqlite")
+    def test_ordered_merge_collation(self):
+        sess = self._fixture_data()
+        sess.ordered_merge = True
+
+        # the collation orders strings differently than Python, so results
+        # are concatenated and LIMIT is applied per shard only
+        city = weather_locations.c.city.collate("NOCASE")
+        eq_(len(sess.execute(select(city).order_by(city).limit(1)).all()), 4)
+
+    def test_ordered_merge_unresolvable_order_by(self):
+        sess = self._fixture_data()
+        sess.ordered_merge = True
+
+        # the ORDER BY expression is not present in the rows, so results
+        # are concatenated and LIMIT is applied per shard only
+        eq_(
+            len(
+                sess.query(WeatherLocation.city)
+                .order_by(WeatherLocation.continent)
+                .limit(1)
+                .all()
+            ),
+            4,
+        )
+
     def test_shard_id_event(self):
         # this test is kind of important, it's testing that
         # when the load event is emitted for an ORM result,
@@ -643,7 +815,7 @@ class ShardTest(object):
             assert inspect(t).deleted is (t.temperature >= 80)
 
 
-class DistinctEngineShardTest(ShardTest, fixtures.TestBase):
+class _DistinctEngineShardFixture(_ShardFixture, fixtures.TestBase):
     def _init_dbs(self):
         db1 = testing_engine(
             "sqlite:///shard1_%s.db" % provision.FOLLOWER_IDENT,
@@ -671,6 +843,186 @@ class DistinctEngineShardTest(ShardTest, fixtures.TestBase):
             os.remove("shard%d_%s.db" % (i, provision.FOLLOWER_IDENT))
 
 
+class DistinctEngineShardTest(_DistinctEngineShardFixture, ShardTest):
+    pass
+
+
+class _ConcurrentShardFixture(_DistinctEngineShardFixture):
+    __requires__ = ("sqlite", "python3")
+
+    max_concurrency = None
+
+    def _init_dbs(self):
+        connect_args = {"check_same_thread": False}
+        db1 = testing_engine(
+            "sqlite:///shard1_%s.db" % provision.FOLLOWER_IDENT,
+            options=dict(
+                poolclass=SingletonThreadPool, connect_args=connect_args
+            ),
+        )
+        db2, db3, db4 = [
+            testing_engine(
+                "sqlite:///shard%d_%s.db" % (i, provision.FOLLOWER_IDENT),
+                options=dict(connect_args=connect_args),
+            )
+            for i in range(2, 5)
+        ]
+
+        self.dbs = [db1, db2, db3, db4]
+        return self.dbs
+
+    @classmethod
+    def setup_session(cls):
+        super(_ConcurrentShardFixture, cls).setup_session()
+        create_session.configure(
+            concurrent_execution=True, max_concurrency=cls.max_concurrency
+        )
+
+    def _record_selects(self, fn):
+        # "city" is deferred and is loaded individually in the calling
+        # thread; only record the SELECT emitted against each shard
+        for db in self.dbs:
+
+            @event.listens_for(db, "before_cursor_execute")
+            def before_cursor_execute(
+                conn, cursor, stmt, params, context, executemany
+            ):
+                if stmt.startswith("SELECT weather_locations.id"):
+                    fn(conn)
+
+
+class ConcurrentShardTest(_ConcurrentShardFixture, ShardTest):
+    """Run the shard suite with concurrent_execution enabled."""
+
+    def test_selects_run_in_worker_threads(self):
+        sess = self._fixture_data()
+
+        threads = set()
+        self._record_selects(
+            lambda conn: threads.add(threading.current_thread())
+        )
+
+        eq_(
+            {c.city for c in sess.query(WeatherLocation).all()},
+            {
+                "New York",
+                "Toronto",
+                "London",
+                "Dublin",
+                "Brasila",
+                "Quito",
+                "Tokyo",
+            },
+        )
+        assert threads
+        assert threading.current_thread() not in threads
+
+    def test_shard_timeout(self):
+        sess = self._fixture_data()
+        sess.shard_timeout = 0.1
+
+        done = threading.Event()
+
+        @event.listens_for(db3, "before_cursor_execute")
+        def before_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            time.sleep(0.5)
+
+        @event.listens_for(db3, "after_cursor_execute")
+        def after_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            done.set()
+
+        assert_raises_message(
+            exc.TimeoutError,
+            "Statement for shard 'europe' did not complete within 0.1 "
+            "seconds",
+            sess.query(WeatherLocation).all,
+        )
+
+        # the statement that timed out has completed, and its connection
+        # is no longer in use
+        assert done.is_set()
+        sess.close()
+
+    def test_shard_error_waits_for_other_shards(self):
+        sess = self._fixture_data()
+
+        started = threading.Event()
+        done = threading.Event()
+
+        @event.listens_for(db1, "before_cursor_execute")
+        def raise_error(conn, cursor, stmt, params, context, executemany):
+            started.wait(5)
+            raise ValueError("shard error")
+
+        @event.listens_for(db2, "before_cursor_execute")
+        def before_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            started.set()
+            time.sleep(0.2)
+
+        @event.listens_for(db2, "after_cursor_execute")
+        def after_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            done.set()
+
+        assert_raises_message(
+            ValueError, "shard error", sess.query(WeatherLocation).all
+        )
+
+        # the other shard's statement has completed, and its connection
+        # is no longer in use
+        assert done.is_set()
+        sess.close()
+
+
+class ConcurrentLimitedShardTest(ConcurrentShardTest):
+    max_concurrency = 2
+
+
+class ConcurrentExecutionPy2KTest(fixtures.TestBase):
+    __requires__ = ("python2",)
+
+    def test_concurrent_execution_not_supported(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "concurrent_execution requires Python 3 or greater",
+            ShardedSession,
+            None,
+            None,
+            concurrent_execution=True,
+        )
+
+
+class OrderedMergeComparisonTest(fixtures.TestBase):
+    def test_compares_as_python(self):
+        t = Table(
+            "t",
+            MetaData(),
+            Column("id", Integer),
+            Column("name", String(50)),
+            Column("name_ci", String(50, collation="NOCASE")),
+        )
+        sqlite_dialect = sqlite.dialect()
+        pg_dialect = postgresql.dialect()
+
+        for element, dialects, expected in [
+            (t.c.id, [sqlite_dialect], True),
+            (t.c.id, [pg_dialect, sqlite_dialect], True),
+            (t.c.name, [sqlite_dialect, sqlite_dialect], True),
+            (t.c.name, [sqlite_dialect, pg_dialect], False),
+            (t.c.name, [pg_dialect], False),
+            (t.c.name_ci, [sqlite_dialect], False),
+            (t.c.name.collate("NOCASE"), [sqlite_dialect], False),
+        ]:
+            is_(_compares_as_python(element, dialects), expected)
+
+
 class AttachedFileShardTest(ShardTest, fixtures.TestBase):
     """Use modern schema conventions along with SQLite ATTACH."""
 
@@ -0,0 +1,79 @@
+import asyncio
+
+from sqlalchemy import event
+from sqlalchemy import util
+from sqlalchemy.testing import async_test
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises_message
+from . import test_horizontal_shard
+from .test_horizontal_shard import _ConcurrentShardFixture
+
+
+class ConcurrentShardAsyncTest(_ConcurrentShardFixture):
+    @async_test
+    async def test_selects_run_in_greenlets(self):
+        WeatherLocation = test_horizontal_shard.WeatherLocation
+        sess = self._fixture_data()
+
+        greenlets = []
+        self._record_selects(
+            lambda conn: greenlets.append(
+                util.concurrency.greenlet.getcurrent()
+            )
+        )
+
+        def go():
+            return {c.city for c in sess.query(WeatherLocation).all()}
+
+        eq_(
+            await util.greenlet_spawn(go),
+            {
+                "New York",
+                "Toronto",
+                "London",
+                "Dublin",
+                "Brasila",
+                "Quito",
+                "Tokyo",
+            },
+        )
+        eq_(len(set(greenlets)), 4)
+
+    @async_test
+    async def test_shard_error_cancels_other_shards(self):
+        WeatherLocation = test_horizontal_shard.WeatherLocation
+        sess = self._fixture_data()
+        db1, db2 = self.dbs[0:2]
+
+        events = []
+
+        @event.listens_for(db1, "before_cursor_execute")
+        def raise_error(conn, cursor, stmt, params, context, executemany):
+            util.await_only(asyncio.sleep(0.05))
+            raise ValueError("shard error")
+
+        @event.listens_for(db2, "before_cursor_execute")
+        def before_cursor_execute(
+            conn, cursor, stmt, params, context, executemany
+        ):
+            events.append("slow start")
+            try:
+                util.await_only(asyncio.sleep(5))
+            finally:
+                events.append("slow unwound")
+
+        def go():
+            return sess.query(WeatherLocation).all()
+
+        with expect_raises_message(ValueError, "shard error"):
+            await util.greenlet_spawn(go)
+        events.append("caller")
+
+        # the other shard's statement was cancelled, and unwound before
+        # the error was raised
+        eq_(events, ["slow start", "slow unwound", "caller"])
+        sess.close()
+
+
+class ConcurrentLimitedShardAsyncTest(ConcurrentShardAsyncTest):
+    max_concurrency = 2
@@ -0,0 +1,233 @@
+"""tests of "batch" lazy loaded attributes"""
+
+from sqlalchemy import testing
+from sqlalchemy.orm import batchload
+from sqlalchemy.orm import create_session
+from sqlalchemy.orm import mapper
+from sqlalchemy.orm import relationship
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import is_
+from sqlalchemy.testing.pickleable import Address as PickleAddress
+from sqlalchemy.testing.pickleable import User as PickleUser
+from sqlalchemy.testing.util import picklers
+from test.orm import _fixtures
+
+
+class BatchLazyTest(_fixtures.FixtureTest):
+    run_inserts = "once"
+    run_deletes = None
+
+    def _one_to_many_fixture(self, lazy="batch"):
+        Address, addresses, users, User = (
+            self.classes.Address,
+            self.tables.addresses,
+            self.tables.users,
+            self.classes.User,
+        )
+
+        mapper(Address, addresses)
+        mapper(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, lazy=lazy, order_by=addresses.c.id
+                )
+            },
+        )
+        return User, Address
+
+    def _many_to_one_fixture(self, lazy="batch"):
+        Address, addresses, users, User = (
+            self.classes.Address,
+            self.tables.addresses,
+            self.tables.users,
+            self.classes.User,
+        )
+
+        mapper(User, users)
+        mapper(
+            Address,
+            addresses,
+            properties={"user": relationship(User, lazy=lazy)},
+        )
+        return User, Address
+
+    def _assert_addresses(self, users):
+        eq_(
+            [(u.id, [a.id for a in u.addresses]) for u in users],
+            [(7, [1]), (8, [2, 3, 4]), (9, [5]), (10, [])],
+        )
+
+    def test_one_to_many(self):
+        User, Address = self._one_to_many_fixture()
+        sess = create_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        self.assert_sql_count(
+            testing.db, lambda: self._assert_addresses(users), 1
+        )
+
+    def test_one_to_many_option(self):
+        User, Address = self._one_to_many_fixture(lazy="select")
+        sess = create_session()
+
+        users = (
+            sess.query(User)
+            .options(batchload(User.addresses))
+            .order_by(User.id)
+            .all()
+        )
+        self.assert_sql_count(
+            testing.db, lambda: self._assert_addresses(users), 1
+        )
+
+    def test_lazyload_without_option(self):
+        User, Address = self._one_to_many_fixture(lazy="select")
+        sess = create_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        self.assert_sql_count(
+            testing.db, lambda: self._assert_addresses(users), 4
+        )
+
+    def test_many_to_one(self):
+        User, Address = self._many_to_one_fixture()
+        sess = create_session()
+
+        addresses = sess.query(Address).order_by(Address.id).all()
+
+        def go():
+            eq_(
+                [(a.id, a.user.id) for a in addresses],
+                [(1, 7), (2, 8), (3, 8), (4, 8), (5, 9)],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_many_to_one_identity_map(self):
+        User, Address = self._many_to_one_fixture()
+        sess = create_session()
+
+        u8 = sess.query(User).get(8)
+        addresses = sess.query(Address).order_by(Address.id).all()
+
+        # the related object is already present, no SQL is emitted
+        def go():
+            is_(addresses[1].user, u8)
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        def go():
+            eq_(
+                [(a.id, a.user.id) for a in addresses],
+                [(1, 7), (2, 8), (3, 8), (4, 8), (5, 9)],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_separate_queries_not_batched(self):
+        User, Address = self._one_to_many_fixture()
+        sess = create_session()
+
+        u7 = sess.query(User).filter(User.id == 7).one()
+        u8 = sess.query(User).filter(User.id == 8).one()
+
+        def go():
+            eq_([a.id for a in u7.addresses], [1])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            eq_([a.id for a in u8.addresses], [2, 3, 4])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_expired_attribute_reloads_individually(self):
+        User, Address = self._one_to_many_fixture()
+        sess = create_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        self.assert_sql_count(
+            testing.db, lambda: self._assert_addresses(users), 1
+        )
+
+        sess.expire(users[0], ["addresses"])
+        sess.expire(users[1], ["addresses"])
+
+        self.assert_sql_count(
+            testing.db, lambda: self._assert_addresses(users), 2
+        )
+
+    def test_populate_existing(self):
+        User, Address = self._one_to_many_fixture()
+        sess = create_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        self.assert_sql_count(
+            testing.db, lambda: self._assert_addresses(users), 1
+        )
+
+        users = sess.query(User).populate_existing().order_by(User.id).all()
+        self.assert_sql_count(
+            testing.db, lambda: self._assert_addresses(users), 1
+        )
+
+    def test_detached(self):
+        User, Address = self._one_to_many_fixture()
+        sess = create_session()
+
+        users = sess.query(User).order_by(User.id).all()
+        sess.expunge(users[0])
+
+        # the detached object is loaded from the batch by the others
+        def go():
+            eq_([a.id for a in users[1].addresses], [2, 3, 4])
+            eq_([a.id for a in users[2].addresses], [5])
+            eq_(users[3].addresses, [])
+
+        self.assert_sql_count(testing.db, go, 1)
+        assert "addresses" not in users[0].__dict__
+
+
+class BatchLazyPickleTest(_fixtures.FixtureTest):
+    run_inserts = "once"
+    run_deletes = None
+
+    def test_pickled_loads_individually(self):
+        users, addresses = self.tables.users, self.tables.addresses
+
+        mapper(
+            PickleUser,
+            users,
+            properties={
+                "addresses": relationship(
+                    PickleAddress, lazy="batch", order_by=addresses.c.id
+                )
+            },
+        )
+        mapper(PickleAddress, addresses)
+
+        sess = create_session()
+        users_ = sess.query(PickleUser).order_by(PickleUser.id).all()
+
+        for loads, dumps in picklers():
+            u2, u3 = loads(dumps(users_[1:3]))
+            sess2 = create_session()
+            sess2.add_all([u2, u3])
+
+            def go():
+                eq_([a.id for a in u2.addresses], [2, 3, 4])
+                eq_([a.id for a in u3.addresses], [5])
+
+            self.assert_sql_count(testing.db, go, 2)
+            sess2.close()
+
+        self.assert_sql_count(
+            testing.db,
+            lambda: eq_(
+                [[a.id for a in u.addresses] for u in users_],
+                [[1], [2, 3, 4], [5], []],
+            ),
+            1,
+        )
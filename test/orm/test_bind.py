@@ -1,25 +1,35 @@
+import collections
+import os
+import threading
+
 import sqlalchemy as sa
+from sqlalchemy import event
 from sqlalchemy import ForeignKey
+from sqlalchemy import func
 from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
 from sqlalchemy import select
+from sqlalchemy import String
 from sqlalchemy import table
 from sqlalchemy import testing
 from sqlalchemy import true
 from sqlalchemy.orm import backref
+from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import create_session
 from sqlalchemy.orm import mapper
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.query import Query
+from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import mock
+from sqlalchemy.testing import provision
 from sqlalchemy.testing.mock import Mock
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
@@ -713,3 +723,188 @@ class GetBindTest(fixtures.MappedTest):
             select(self.tables.concrete_sub_table)
         )
         is_(session.get_bind(clause=stmt), base_class_bind)
+
+
+class _ConcurrentFlushFixture(fixtures.TestBase):
+    __requires__ = ("sqlite", "python3")
+
+    def setup(self):
+        connect_args = {"check_same_thread": False}
+        self.engines = [
+            engines.testing_engine(
+                "sqlite:///concurrent_flush%d_%s.db"
+                % (i, provision.FOLLOWER_IDENT),
+                options=dict(connect_args=connect_args),
+            )
+            for i in (1, 2)
+        ]
+        e1, e2 = self.engines
+
+        metadata = MetaData()
+        a = Table(
+            "a",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(30)),
+        )
+        a_child = Table(
+            "a_child",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("a_id", ForeignKey("a.id")),
+        )
+        b = Table(
+            "b",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(30)),
+        )
+        metadata.create_all(e1, tables=[a, a_child])
+        metadata.create_all(e2, tables=[b])
+        self.tables = a, a_child, b
+
+        class A(object):
+            pass
+
+        class AChild(object):
+            pass
+
+        class B(object):
+            pass
+
+        mapper(A, a, properties={"children": relationship(AChild)})
+        mapper(AChild, a_child)
+        mapper(B, b)
+        self.classes = A, AChild, B
+
+    def teardown(self):
+        clear_mappers()
+        for e in self.engines:
+            e.dispose()
+        for i in (1, 2):
+            os.remove(
+                "concurrent_flush%d_%s.db" % (i, provision.FOLLOWER_IDENT)
+            )
+
+    def _session(self):
+        A, AChild, B = self.classes
+        e1, e2 = self.engines
+        return Session(binds={A: e1, AChild: e1, B: e2}, concurrent_flush=True)
+
+    def _fixture_objects(self, sess):
+        A, AChild, B = self.classes
+        for i in range(1, 4):
+            a = A()
+            a.id = i
+            a.data = "a%d" % i
+            a.children = [AChild(), AChild()]
+            sess.add(a)
+
+            b = B()
+            b.id = i
+            b.data = "b%d" % i
+            sess.add(b)
+
+    def _record_inserts(self, fn):
+        for e in self.engines:
+
+            @event.listens_for(e, "before_cursor_execute")
+            def before_cursor_execute(
+                conn, cursor, stmt, params, context, executemany
+            ):
+                if stmt.startswith("INSERT"):
+                    fn(stmt.split()[2])
+
+    def _assert_rows(self):
+        a, a_child, b = self.tables
+        e1, e2 = self.engines
+        with e1.connect() as conn:
+            eq_(
+                conn.execute(select(a.c.id, a.c.data).order_by(a.c.id)).all(),
+                [(1, "a1"), (2, "a2"), (3, "a3")],
+            )
+            eq_(
+                conn.execute(
+                    select(a_child.c.a_id).order_by(a_child.c.a_id)
+                ).all(),
+                [(1,), (1,), (2,), (2,), (3,), (3,)],
+            )
+        with e2.connect() as conn:
+            eq_(
+                conn.execute(select(b.c.id, b.c.data).order_by(b.c.id)).all(),
+                [(1, "b1"), (2, "b2"), (3, "b3")],
+            )
+
+
+class ConcurrentFlushPy2KTest(fixtures.TestBase):
+    __requires__ = ("python2",)
+
+    def test_concurrent_flush_not_supported(self):
+        assert_raises_message(
+            sa.exc.ArgumentError,
+            "concurrent_flush requires Python 3 or greater",
+            Session,
+            concurrent_flush=True,
+        )
+
+
+class ConcurrentFlushTest(_ConcurrentFlushFixture):
+    def test_binds_flushed_in_worker_threads(self):
+        threads = collections.defaultdict(set)
+
+        # "a" and "b" are flushed simultaneously, so their INSERT
+        # statements can wait for each other
+        barrier = threading.Barrier(2, timeout=5)
+
+        def record(table):
+            if table in ("a", "b") and not threads[table]:
+                barrier.wait()
+            threads[table].add(threading.current_thread())
+
+        self._record_inserts(record)
+
+        sess = self._session()
+        self._fixture_objects(sess)
+        sess.commit()
+
+        self._assert_rows()
+        eq_(set(threads), {"a", "a_child", "b"})
+
+        # "a_child" depends on "a" and is flushed afterwards, by itself
+        assert threading.current_thread() not in threads["a"] | threads["b"]
+        eq_(threads["a_child"], {threading.current_thread()})
+
+    def test_single_bind_not_concurrent(self):
+        A, AChild, B = self.classes
+        threads = set()
+        self._record_inserts(
+            lambda table: threads.add(threading.current_thread())
+        )
+
+        sess = self._session()
+        for i in range(1, 4):
+            b = B()
+            b.id = i
+            b.data = "b%d" % i
+            sess.add(b)
+        sess.commit()
+
+        eq_(threads, {threading.current_thread()})
+
+    def test_error_rolls_back_all_binds(self):
+        A, AChild, B = self.classes
+        a, a_child, b = self.tables
+        e1, e2 = self.engines
+
+        with e2.begin() as conn:
+            conn.execute(b.insert(), {"id": 2, "data": "existing"})
+
+        sess = self._session()
+        self._fixture_objects(sess)
+        assert_raises(sa.exc.IntegrityError, sess.flush)
+        sess.rollback()
+
+        with e1.connect() as conn:
+            eq_(conn.execute(select(func.count()).select_from(a)).scalar(), 0)
+        with e2.connect() as conn:
+            eq_(conn.execute(select(b.c.data)).all(), [("existing",)])
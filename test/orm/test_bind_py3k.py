@@ -0,0 +1,25 @@
+import collections
+
+from sqlalchemy import util
+from sqlalchemy.testing import async_test
+from .test_bind import _ConcurrentFlushFixture
+
+
+class ConcurrentFlushAsyncTest(_ConcurrentFlushFixture):
+    @async_test
+    async def test_binds_flushed_in_greenlets(self):
+        greenlets = collections.defaultdict(set)
+        self._record_inserts(
+            lambda table: greenlets[table].add(
+                util.concurrency.greenlet.getcurrent()
+            )
+        )
+
+        sess = self._session()
+        self._fixture_objects(sess)
+
+        await util.greenlet_spawn(sess.commit)
+
+        self._assert_rows()
+        assert greenlets["a"] and greenlets["b"]
+        assert not greenlets["a"].intersection(greenlets["b"])
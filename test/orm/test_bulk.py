@@ -1,3 +1,4 @@
+from sqlalchemy import exc as sa_exc
 from sqlalchemy import FetchedValue
 from sqlalchemy import ForeignKey
 from sqlalchemy import Integer
@@ -5,8 +6,10 @@ from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy.orm import mapper
 from sqlalchemy.orm import Session
+from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.assertsql import Conditional
@@ -301,6 +304,327 @@ class BulkInsertUpdateTest(BulkTest, _fixtures.FixtureTest):
         )
 
 
+class BulkUpsertTest(BulkTest, fixtures.RemovesEvents, fixtures.MappedTest):
+    __requires__ = ("bulk_upsert",)
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column(
+                "id", Integer, primary_key=True, test_needs_autoincrement=True
+            ),
+            Column("name", String(30), unique=True, nullable=False),
+            Column("fullname", String(50)),
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class User(cls.Comparable):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        User = cls.classes.User
+        users = cls.tables.users
+
+        mapper(User, users)
+
+    def _fixture(self):
+        User = self.classes.User
+
+        s = Session()
+        s.add_all(
+            [
+                User(id=1, name="u1", fullname="User One"),
+                User(id=2, name="u2", fullname="User Two"),
+            ]
+        )
+        s.commit()
+        return s
+
+    def _executions(self):
+        """Record the number of parameter sets sent with each statement."""
+
+        executions = []
+
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            executions.append(len(parameters) if executemany else 1)
+
+        self.event_listen(
+            testing.db, "before_cursor_execute", before_cursor_execute
+        )
+        return executions
+
+    def _assert_users(self, s, expected):
+        User = self.classes.User
+
+        s.expunge_all()
+        eq_(
+            s.query(User).order_by(User.id).all(),
+            [
+                User(id=id_, name=name, fullname=fullname)
+                for id_, name, fullname in expected
+            ],
+        )
+
+    def test_upsert_primary_key(self):
+        User = self.classes.User
+        s = self._fixture()
+
+        executions = self._executions()
+        result = s.bulk_upsert_mappings(
+            User,
+            [
+                {"id": 2, "name": "u2", "fullname": "User Two New"},
+                {"id": 3, "name": "u3", "fullname": "User Three"},
+            ],
+        )
+        is_(result, None)
+
+        # both rows are sent in one executemany
+        eq_(executions, [2])
+
+        self._assert_users(
+            s,
+            [
+                (1, "u1", "User One"),
+                (2, "u2", "User Two New"),
+                (3, "u3", "User Three"),
+            ],
+        )
+
+    def test_upsert_index_elements(self):
+        User = self.classes.User
+        s = self._fixture()
+
+        s.bulk_upsert_mappings(
+            User,
+            [
+                {"name": "u1", "fullname": "User One New"},
+                {"name": "u3", "fullname": "User Three"},
+            ],
+            index_elements=["name"],
+        )
+
+        self._assert_users(
+            s,
+            [
+                (1, "u1", "User One New"),
+                (2, "u2", "User Two"),
+                (3, "u3", "User Three"),
+            ],
+        )
+
+    def test_upsert_update_keys(self):
+        User = self.classes.User
+        s = self._fixture()
+
+        s.bulk_upsert_mappings(
+            User,
+            [{"id": 1, "name": "u1 new", "fullname": "User One New"}],
+            update_keys=["fullname"],
+        )
+
+        self._assert_users(
+            s, [(1, "u1", "User One New"), (2, "u2", "User Two")]
+        )
+
+    def test_upsert_update_keys_not_in_mapping(self):
+        User = self.classes.User
+        s = self._fixture()
+
+        s.bulk_upsert_mappings(
+            User,
+            [
+                {"id": 1, "name": "u1 new"},
+                {"id": 2, "name": "u2 new", "fullname": "User Two New"},
+            ],
+            update_keys=["name", "fullname"],
+        )
+
+        # fullname is left alone for the mapping that doesn't include it
+        self._assert_users(
+            s, [(1, "u1 new", "User One"), (2, "u2 new", "User Two New")]
+        )
+
+    def test_upsert_do_nothing(self):
+        User = self.classes.User
+        s = self._fixture()
+
+        s.bulk_upsert_mappings(
+            User,
+            [
+                {"id": 1, "name": "u1", "fullname": "User One New"},
+                {"id": 3, "name": "u3", "fullname": "User Three"},
+            ],
+            update_keys=(),
+        )
+
+        self._assert_users(
+            s,
+            [
+                (1, "u1", "User One"),
+                (2, "u2", "User Two"),
+                (3, "u3", "User Three"),
+            ],
+        )
+
+    def test_upsert_none_renders_null(self):
+        User = self.classes.User
+        s = self._fixture()
+
+        s.bulk_upsert_mappings(
+            User, [{"id": 1, "name": "u1", "fullname": None}]
+        )
+
+        self._assert_users(s, [(1, "u1", None), (2, "u2", "User Two")])
+
+    def test_upsert_groups_by_keys(self):
+        User = self.classes.User
+        s = self._fixture()
+
+        executions = self._executions()
+        s.bulk_upsert_mappings(
+            User,
+            [
+                {"id": 1, "name": "u1", "fullname": "User One New"},
+                {"id": 3, "name": "u3", "fullname": "User Three"},
+                {"id": 2, "name": "u2 new"},
+            ],
+        )
+        eq_(executions, [2, 1])
+
+        self._assert_users(
+            s,
+            [
+                (1, "u1", "User One New"),
+                (2, "u2 new", "User Two"),
+                (3, "u3", "User Three"),
+            ],
+        )
+
+    def test_return_primary_keys_given(self):
+        User = self.classes.User
+        s = self._fixture()
+
+        eq_(
+            s.bulk_upsert_mappings(
+                User,
+                [
+                    {"id": 3, "name": "u3", "fullname": "User Three"},
+                    {"id": 1, "name": "u1", "fullname": "User One New"},
+                ],
+                return_primary_keys=True,
+            ),
+            [(3,), (1,)],
+        )
+
+    @testing.requires.returning
+    def test_return_primary_keys_returning(self):
+        User = self.classes.User
+        s = self._fixture()
+
+        eq_(
+            s.bulk_upsert_mappings(
+                User,
+                [
+                    {"name": "u3", "fullname": "User Three"},
+                    {"name": "u2", "fullname": "User Two New"},
+                    {"name": "u4", "fullname": "User Four"},
+                ],
+                index_elements=["name"],
+                return_primary_keys=True,
+            ),
+            [(3,), (2,), (4,)],
+        )
+
+    @testing.requires.returning
+    def test_return_primary_keys_returning_do_nothing(self):
+        User = self.classes.User
+        s = self._fixture()
+
+        eq_(
+            s.bulk_upsert_mappings(
+                User,
+                [{"name": "u2"}, {"name": "u3"}],
+                index_elements=["name"],
+                update_keys=(),
+                return_primary_keys=True,
+            ),
+            [(2,), (3,)],
+        )
+        self._assert_users(
+            s, [(1, "u1", "User One"), (2, "u2", "User Two"), (3, "u3", None)],
+        )
+
+    @testing.only_on("postgresql")
+    def test_return_primary_keys_returning_mixed_conflicts(self):
+        """a conflicting row returns its existing, lower primary key value;
+        the rows must still line up with the mappings when the backend
+        renders the parameter sets into a multiple-row VALUES clause."""
+
+        User = self.classes.User
+        s = self._fixture()
+
+        eq_(
+            s.bulk_upsert_mappings(
+                User,
+                [
+                    {"name": "u3", "fullname": "User Three"},
+                    {"name": "u1", "fullname": "User One New"},
+                    {"name": "u4", "fullname": "User Four"},
+                    {"name": "u2", "fullname": "User Two New"},
+                ],
+                index_elements=["name"],
+                return_primary_keys=True,
+            ),
+            [(3,), (1,), (4,), (2,)],
+        )
+        self._assert_users(
+            s,
+            [
+                (1, "u1", "User One New"),
+                (2, "u2", "User Two New"),
+                (3, "u3", "User Three"),
+                (4, "u4", "User Four"),
+            ],
+        )
+
+    @testing.requires.returning.not_()
+    def test_return_primary_keys_no_returning(self):
+        User = self.classes.User
+        s = self._fixture()
+
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "bulk_upsert\\(\\) can only return primary key values",
+            s.bulk_upsert_mappings,
+            User,
+            [{"name": "u3", "fullname": "User Three"}],
+            index_elements=["name"],
+            return_primary_keys=True,
+        )
+
+    def test_unknown_attribute(self):
+        User = self.classes.User
+        s = Session()
+
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "mapped class User->users has no column-based attribute "
+            "'nonexistent'",
+            s.bulk_upsert_mappings,
+            User,
+            [{"name": "u3"}],
+            index_elements=["nonexistent"],
+        )
+
+
 class BulkUDPostfetchTest(BulkTest, fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
@@ -1,16 +1,25 @@
+from sqlalchemy import event
 from sqlalchemy import exc
+from sqlalchemy import inspect
 from sqlalchemy import select
 from sqlalchemy import testing
 from sqlalchemy.engine import result_tuple
 from sqlalchemy.orm import aliased
+from sqlalchemy.orm import exc as orm_exc
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import loading
 from sqlalchemy.orm import mapper
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import subqueryload
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import assert_raises_message
 from sqlalchemy.testing.assertions import eq_
+from sqlalchemy.testing.assertions import is_
+from sqlalchemy.testing.assertions import is_not_
+from sqlalchemy.testing.assertions import is_true
 from . import _fixtures
 
 # class GetFromIdentityTest(_fixtures.FixtureTest):
@@ -57,6 +66,184 @@ class InstanceProcessorTest(_fixtures.FixtureTest):
 
         self.assert_sql_count(testing.db, go, 1)
 
+    def test_new_and_existing_instances(self):
+        User, users = self.classes.User, self.tables.users
+
+        mapper(User, users)
+
+        s = Session(autoflush=False)
+        u8 = s.query(User).get(8)
+        u8.name = "ed modified"
+
+        result = s.query(User).order_by(User.id).all()
+        eq_(
+            [(u.id, u.name) for u in result],
+            [(7, "jack"), (8, "ed modified"), (9, "fred"), (10, "chuck")],
+        )
+        is_(result[1], u8)
+        eq_(list(s.dirty), [u8])
+
+        for user in result:
+            state = inspect(user)
+            is_true(state.persistent)
+            is_(s.identity_map[state.key], user)
+            eq_(state.modified, user is u8)
+
+    def test_null_primary_key_returns_none(self):
+        User, users = self.classes.User, self.tables.users
+        Address, addresses = self.classes.Address, self.tables.addresses
+
+        mapper(User, users)
+        mapper(Address, addresses)
+
+        s = Session()
+        result = (
+            s.query(User, Address)
+            .outerjoin(Address, User.id == Address.user_id)
+            .filter(User.id.in_([9, 10]))
+            .order_by(User.id)
+            .all()
+        )
+        eq_(
+            [(u.id, a.id if a is not None else None) for u, a in result],
+            [(9, 5), (10, None)],
+        )
+
+    def test_load_event(self):
+        User, users = self.classes.User, self.tables.users
+
+        mapper(User, users)
+
+        canary = mock.Mock()
+        event.listen(User, "load", canary)
+
+        s = Session()
+        result = s.query(User).order_by(User.id).all()
+        eq_([c[1][0] for c in canary.mock_calls], result)
+
+
+class ReadonlyLoadTest(_fixtures.FixtureTest):
+    run_inserts = "once"
+    run_deletes = None
+
+    def _assert_detached(self, sess, obj):
+        state = inspect(obj)
+        is_true(state.detached)
+        is_(sess.identity_map.get(state.key), None)
+
+    def test_basic(self):
+        User, users = self.classes.User, self.tables.users
+
+        mapper(User, users)
+
+        sess = Session()
+        result = (
+            sess.query(User)
+            .execution_options(readonly=True)
+            .order_by(User.id)
+            .all()
+        )
+        eq_(
+            [(u.id, u.name) for u in result],
+            [(7, "jack"), (8, "ed"), (9, "fred"), (10, "chuck")],
+        )
+        for user in result:
+            self._assert_detached(sess, user)
+        eq_(len(sess.identity_map), 0)
+
+    def test_future_execute(self):
+        User, users = self.classes.User, self.tables.users
+
+        mapper(User, users)
+
+        sess = Session(testing.db, future=True)
+        u7 = sess.get(User, 7)
+
+        result = (
+            sess.execute(
+                select(User).order_by(User.id),
+                execution_options={"readonly": True},
+            )
+            .scalars()
+            .all()
+        )
+        eq_([u.id for u in result], [7, 8, 9, 10])
+
+        # distinct from the object present in the Session
+        is_not_(result[0], u7)
+        is_true(inspect(result[0]).detached)
+        eq_(list(sess.identity_map.values()), [u7])
+
+    def test_lazyload_raises(self):
+        User, users = self.classes.User, self.tables.users
+        Address, addresses = self.classes.Address, self.tables.addresses
+
+        mapper(User, users, properties={"addresses": relationship(Address)})
+        mapper(Address, addresses)
+
+        sess = Session()
+        u7 = (
+            sess.query(User)
+            .execution_options(readonly=True)
+            .filter_by(id=7)
+            .one()
+        )
+        assert_raises(orm_exc.DetachedInstanceError, getattr, u7, "addresses")
+
+    @testing.combinations(
+        (joinedload, 1), (selectinload, 2), (subqueryload, 2)
+    )
+    def test_eagerload(self, loader, count):
+        User, users = self.classes.User, self.tables.users
+        Address, addresses = self.classes.Address, self.tables.addresses
+
+        mapper(
+            User,
+            users,
+            properties={
+                "addresses": relationship(Address, order_by=addresses.c.id)
+            },
+        )
+        mapper(Address, addresses)
+
+        sess = Session()
+        result = []
+
+        def go():
+            result.extend(
+                sess.query(User)
+                .options(loader(User.addresses))
+                .execution_options(readonly=True)
+                .order_by(User.id)
+            )
+            eq_(
+                [(u.id, [a.id for a in u.addresses]) for u in result],
+                [(7, [1]), (8, [2, 3, 4]), (9, [5]), (10, [])],
+            )
+
+        self.assert_sql_count(testing.db, go, count)
+        for user in result:
+            self._assert_detached(sess, user)
+            for address in user.addresses:
+                self._assert_detached(sess, address)
+        eq_(len(sess.identity_map), 0)
+
+    def test_merge(self):
+        User, users = self.classes.User, self.tables.users
+
+        mapper(User, users)
+
+        sess = Session()
+        u7 = (
+            sess.query(User)
+            .execution_options(readonly=True)
+            .filter_by(id=7)
+            .one()
+        )
+        merged = sess.merge(u7, load=False)
+        is_true(inspect(merged).persistent)
+        eq_(merged.name, "jack")
+
 
 class InstancesTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"
@@ -4525,6 +4525,95 @@ class YieldTest(_fixtures.FixtureTest):
 
         self.assert_sql_count(testing.db, go, 1)
 
+    def test_expunge_per_chunk(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+        sess = create_session()
+        q = iter(
+            sess.query(User)
+            .order_by(User.id)
+            .execution_options(yield_per=2, expunge_per_chunk=True)
+        )
+
+        u1, u2 = next(q), next(q)
+        eq_(len(sess.identity_map), 2)
+        assert u1 in sess and u2 in sess
+
+        u3 = next(q)
+        eq_(len(sess.identity_map), 2)
+        assert u1 not in sess and u2 not in sess
+        assert u3 in sess
+
+        # objects remain usable while their chunk is current
+        eq_([a.id for a in u3.addresses], [5])
+
+        next(q)
+        assert_raises(StopIteration, next, q)
+
+        # only the lazy loaded Address, which wasn't loaded by the query
+        # itself, remains
+        eq_(len(sess.identity_map), 1)
+
+    def test_expunge_per_chunk_selectinload(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+        sess = create_session()
+        result = sess.execute(
+            select(User).options(selectinload(User.addresses)),
+            execution_options={"yield_per": 2, "expunge_per_chunk": True},
+            future=True,
+        )
+
+        previous = []
+        for partition in result.scalars().partitions():
+            for user in previous:
+                assert user not in sess
+                for address in user.addresses:
+                    assert address not in sess
+
+            eq_(
+                len(sess.identity_map),
+                len(partition) + sum(len(u.addresses) for u in partition),
+            )
+            previous = partition
+
+    def test_expunge_per_chunk_retains_modified(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+        sess = create_session()
+        u8 = sess.query(User).get(8)
+
+        q = iter(
+            sess.query(User)
+            .order_by(User.id)
+            .execution_options(yield_per=1, expunge_per_chunk=True)
+        )
+        u7 = next(q)
+        u7.name = "u7 modified"
+
+        # u8 was present in the session before the query
+        is_(next(q), u8)
+        assert u7 in sess
+
+        sess.flush()
+        next(q)
+        assert u7 not in sess
+        assert u8 in sess
+
+    def test_expunge_per_chunk_no_yield_per(self):
+        self._eagerload_mappings()
+
+        User = self.classes.User
+        sess = create_session()
+        users = (
+            sess.query(User).execution_options(expunge_per_chunk=True).all()
+        )
+        for user in users:
+            assert user in sess
+
 
 class HintsTest(QueryTest, AssertsCompiledSQL):
     __dialect__ = "default"
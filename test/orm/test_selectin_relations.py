@@ -1,3 +1,5 @@
+import uuid
+
 import sqlalchemy as sa
 from sqlalchemy import bindparam
 from sqlalchemy import ForeignKey
@@ -6,6 +8,7 @@ from sqlalchemy import Integer
 from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import testing
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import create_session
@@ -31,6 +34,7 @@ from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertsql import AllOf
 from sqlalchemy.testing.assertsql import assert_engine
 from sqlalchemy.testing.assertsql import CompiledSQL
+from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
 from test.orm import _fixtures
@@ -2197,6 +2201,56 @@ class TupleTest(fixtures.DeclarativeMappedTest):
             ],
         )
 
+    def test_max_parameters(self):
+        A, B = self.classes("A", "B")
+
+        session = Session()
+
+        def go():
+            q = (
+                session.query(A)
+                .options(selectinload(A.bs))
+                .order_by(A.id1, A.id2)
+            )
+            return q.all()
+
+        # ten parameters allows five tuples per statement
+        with mock.patch.object(
+            testing.db.dialect, "in_list_max_parameters", 10
+        ):
+            result = self.assert_sql_execution(
+                testing.db,
+                go,
+                CompiledSQL(
+                    "SELECT a.id1 AS a_id1, a.id2 AS a_id2 "
+                    "FROM a ORDER BY a.id1, a.id2",
+                    {},
+                ),
+                *[
+                    CompiledSQL(
+                        "SELECT b.a_id1 AS b_a_id1, b.a_id2 AS b_a_id2, "
+                        "b.id AS b_id FROM b WHERE (b.a_id1, b.a_id2) IN "
+                        "([POSTCOMPILE_primary_keys]) ORDER BY b.id",
+                        [
+                            {
+                                "primary_keys": [
+                                    (i, i + 2)
+                                    for i in range(start, min(start + 5, 20))
+                                ]
+                            }
+                        ],
+                    )
+                    for start in (1, 6, 11, 16)
+                ]
+            )
+        eq_(
+            result,
+            [
+                A(id1=i, id2=i + 2, bs=[B(id=(i * 6) + j) for j in range(6)])
+                for i in range(1, 20)
+            ],
+        )
+
 
 class ChunkingTest(fixtures.DeclarativeMappedTest):
     """test IN chunking.
@@ -2215,6 +2269,9 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
             __tablename__ = "a"
             id = Column(Integer, primary_key=True)
             bs = relationship("B", order_by="B.id", back_populates="a")
+            bs_chunked = relationship(
+                "B", order_by="B.id", viewonly=True, selectin_chunksize=47
+            )
 
         class B(fixtures.ComparableEntity, Base):
             __tablename__ = "b"
@@ -2235,19 +2292,104 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
         )
         session.commit()
 
+    def _assert_chunks(self, go, chunks):
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL("SELECT a.id AS a_id FROM a ORDER BY a.id", {}),
+            *[
+                CompiledSQL(
+                    "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                    "FROM b WHERE b.a_id IN "
+                    "([POSTCOMPILE_primary_keys]) ORDER BY b.id",
+                    {"primary_keys": list(range(start, end))},
+                )
+                for start, end in chunks
+            ]
+        )
+
+    def test_relationship_chunksize(self):
+        A, B = self.classes("A", "B")
+
+        session = Session()
+
+        def go():
+            q = (
+                session.query(A)
+                .options(selectinload(A.bs_chunked))
+                .order_by(A.id)
+            )
+
+            for a in q:
+                eq_(a.bs_chunked, [B(id=(a.id * 6) + j) for j in range(1, 6)])
+
+        self._assert_chunks(go, [(1, 48), (48, 95), (95, 101)])
+
+    def test_option_overrides_relationship_chunksize(self):
+        A, B = self.classes("A", "B")
+
+        session = Session()
+
+        def go():
+            q = (
+                session.query(A)
+                .options(selectinload(A.bs_chunked, chunksize=60))
+                .order_by(A.id)
+            )
+
+            for a in q:
+                a.bs_chunked
+
+        self._assert_chunks(go, [(1, 61), (61, 101)])
+
+    def test_dialect_chunksize(self):
+        A, B = self.classes("A", "B")
+
+        session = Session()
+
+        def go():
+            q = session.query(A).options(selectinload(A.bs)).order_by(A.id)
+
+            for a in q:
+                a.bs
+
+        with mock.patch.object(testing.db.dialect, "in_list_chunksize", 30):
+            self._assert_chunks(go, [(1, 31), (31, 61), (61, 91), (91, 101)])
+
+    def test_max_parameters_limits_chunksize(self):
+        A, B = self.classes("A", "B")
+
+        session = Session()
+
+        def go():
+            q = (
+                session.query(A)
+                .options(selectinload(A.bs, chunksize=1000))
+                .order_by(A.id)
+            )
+
+            for a in q:
+                a.bs
+
+        with mock.patch.object(
+            testing.db.dialect, "in_list_max_parameters", 40
+        ):
+            self._assert_chunks(go, [(1, 41), (41, 81), (81, 101)])
+
     def test_odd_number_chunks(self):
         A, B = self.classes("A", "B")
 
         session = Session()
 
         def go():
-            with mock.patch(
-                "sqlalchemy.orm.strategies.SelectInLoader._chunksize", 47
-            ):
-                q = session.query(A).options(selectinload(A.bs)).order_by(A.id)
+            q = (
+                session.query(A)
+                .options(selectinload(A.bs, chunksize=47))
+                .order_by(A.id)
+            )
 
-                for a in q:
-                    a.bs
+            for a in q:
+                a.bs
 
         self.assert_sql_execution(
             testing.db,
@@ -2314,13 +2456,14 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
         session = Session()
 
         def go():
-            with mock.patch(
-                "sqlalchemy.orm.strategies.SelectInLoader._chunksize", 47
-            ):
-                q = session.query(B).options(selectinload(B.a)).order_by(B.id)
+            q = (
+                session.query(B)
+                .options(selectinload(B.a, chunksize=47))
+                .order_by(B.id)
+            )
 
-                for b in q:
-                    b.a
+            for b in q:
+                b.a
 
         self.assert_sql_execution(
             testing.db,
@@ -2350,6 +2493,173 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
         )
 
 
+class AnyArrayTest(fixtures.DeclarativeMappedTest):
+    __only_on__ = "postgresql"
+
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class A(fixtures.ComparableEntity, Base):
+            __tablename__ = "a"
+            id = Column(Integer, primary_key=True)
+            bs = relationship("B", order_by="B.id", back_populates="a")
+
+        class B(fixtures.ComparableEntity, Base):
+            __tablename__ = "b"
+            id = Column(Integer, primary_key=True)
+            a_id = Column(ForeignKey("a.id"))
+            a = relationship("A", back_populates="bs")
+
+    @classmethod
+    def insert_data(cls, connection):
+        A, B = cls.classes("A", "B")
+
+        session = Session(connection)
+        session.add_all(
+            [
+                A(id=i, bs=[B(id=(i * 6) + j) for j in range(1, 6)])
+                for i in range(1, 11)
+            ]
+        )
+        session.commit()
+
+    def test_load_o2m(self):
+        A, B = self.classes("A", "B")
+
+        session = Session()
+
+        def go():
+            q = (
+                session.query(A)
+                .options(selectinload(A.bs, chunksize=7))
+                .order_by(A.id)
+            )
+            return q.all()
+
+        result = self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL("SELECT a.id AS a_id FROM a ORDER BY a.id", {}),
+            CompiledSQL(
+                "SELECT b.a_id AS b_a_id, b.id AS b_id FROM b "
+                "WHERE b.a_id = ANY (CAST(%(primary_keys)s AS INTEGER[])) "
+                "ORDER BY b.id",
+                {"primary_keys": list(range(1, 8))},
+                dialect="postgresql",
+            ),
+            CompiledSQL(
+                "SELECT b.a_id AS b_a_id, b.id AS b_id FROM b "
+                "WHERE b.a_id = ANY (CAST(%(primary_keys)s AS INTEGER[])) "
+                "ORDER BY b.id",
+                {"primary_keys": list(range(8, 11))},
+                dialect="postgresql",
+            ),
+        )
+        eq_(
+            result,
+            [
+                A(id=i, bs=[B(id=(i * 6) + j) for j in range(1, 6)])
+                for i in range(1, 11)
+            ],
+        )
+
+    def test_load_m2o(self):
+        A, B = self.classes("A", "B")
+
+        session = Session()
+
+        def go():
+            q = session.query(B).options(selectinload(B.a)).order_by(B.id)
+            return q.all()
+
+        result = self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT b.id AS b_id, b.a_id AS b_a_id FROM b ORDER BY b.id",
+                {},
+            ),
+            CompiledSQL(
+                "SELECT a.id AS a_id FROM a "
+                "WHERE a.id = ANY (CAST(%(primary_keys)s AS INTEGER[]))",
+                {"primary_keys": list(range(1, 11))},
+                dialect="postgresql",
+            ),
+        )
+        eq_([b.a.id for b in result], [b.a_id for b in result])
+
+
+class AnyArrayCastTest(fixtures.TestBase):
+    """test that the ARRAY of keys sent to = ANY() is CAST to the type of
+    the key, so that non-text keys aren't compared to a text[] parameter."""
+
+    def teardown(self):
+        clear_mappers()
+
+    def test_uuid_key(self):
+        a1, a2, b1, b2 = [uuid.uuid4() for i in range(4)]
+        results = [
+            (["a_id"], [(a1,), (a2,)]),
+            (["b_a_id", "b_id"], [(a1, b1), (a2, b2)]),
+        ]
+
+        def execute(statement, parameters=()):
+            names, rows = results.pop(0)
+            cursor.description = [
+                (name, None, None, None, None, None, None) for name in names
+            ]
+            cursor.fetchall.return_value = rows
+
+        cursor = mock.Mock(execute=mock.Mock(side_effect=execute))
+        dbapi = mock.Mock(
+            paramstyle="format",
+            __version__="1.16.6",
+            connect=mock.Mock(
+                return_value=mock.Mock(cursor=mock.Mock(return_value=cursor))
+            ),
+        )
+        eng = testing_engine(
+            "postgresql+pg8000://",
+            options=dict(module=dbapi, _initialize=False),
+        )
+
+        metadata = sa.MetaData()
+        a = Table(
+            "a",
+            metadata,
+            Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        )
+        b = Table(
+            "b",
+            metadata,
+            Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            Column("a_id", ForeignKey("a.id")),
+        )
+
+        class A(object):
+            pass
+
+        class B(object):
+            pass
+
+        mapper(A, a, properties={"bs": relationship(B)})
+        mapper(B, b)
+
+        sess = Session(eng)
+        result = sess.query(A).options(selectinload(A.bs)).all()
+        eq_([[b_.id for b_ in a_.bs] for a_ in result], [[b1], [b2]])
+
+        eq_(
+            cursor.execute.mock_calls[1],
+            mock.call(
+                "SELECT b.a_id AS b_a_id, b.id AS b_id \nFROM b \n"
+                "WHERE b.a_id = ANY (CAST(%s AS UUID[]))",
+                ([a1, a2],),
+            ),
+        )
+
+
 class SubRelationFromJoinedSubclassMultiLevelTest(_Polymorphic):
     @classmethod
     def define_tables(cls, metadata):
@@ -1902,6 +1902,7 @@ class SessionInterface(fixtures.TestBase):
                 [
                     "bulk_update_mappings",
                     "bulk_insert_mappings",
+                    "bulk_upsert_mappings",
                     "bulk_save_objects",
                 ]
             )
@@ -0,0 +1,92 @@
+"""Measure the throughput of util.LRUCache under multi-threaded load,
+as well as the total and longest time spent pruning it.
+
+Most keys are drawn from a "hot" set half the size of the cache, while
+the remainder are drawn from a long tail which causes regular pruning;
+this resembles the use of the compiled cache by an application that
+renders many distinct statements.  Note that under the GIL, the time
+measured for a pruning step includes time spent waiting for other
+threads, so that it's best compared using a single thread.
+
+    python test/perf/lru_cache_threaded.py --threads 8 --capacity 500
+
+"""
+from __future__ import print_function
+
+import argparse
+import random
+import threading
+
+from sqlalchemy import util
+
+
+class TimedLRUCache(util.LRUCache):
+    __slots__ = ("pauses",)
+
+    def __init__(self, *arg, **kw):
+        super(TimedLRUCache, self).__init__(*arg, **kw)
+        self.pauses = []
+
+    def _manage_size(self):
+        size = len(self)
+        now = util.perf_counter()
+        super(TimedLRUCache, self)._manage_size()
+        if len(self) < size:
+            self.pauses.append(util.perf_counter() - now)
+
+
+def run(capacity, threads, operations, keyspace, hot_ratio):
+    cache = TimedLRUCache(capacity)
+
+    def worker(seed):
+        rnd = random.Random(seed)
+        for i in range(operations):
+            if rnd.random() < hot_ratio:
+                key = rnd.randint(0, capacity // 2)
+            else:
+                key = rnd.randint(0, keyspace)
+            if cache.get(key) is None:
+                cache[key] = key
+
+    workers = [
+        threading.Thread(target=worker, args=(seed,))
+        for seed in range(threads)
+    ]
+    now = util.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    total = util.perf_counter() - now
+
+    print(
+        "%d threads x %d operations: %.3fs, %d ops/sec; "
+        "%d prunes, total %.4fs, max %.6fs"
+        % (
+            threads,
+            operations,
+            total,
+            threads * operations / total,
+            len(cache.pauses),
+            sum(cache.pauses),
+            max(cache.pauses) if cache.pauses else 0,
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--capacity", type=int, default=500)
+    parser.add_argument("--operations", type=int, default=200000)
+    parser.add_argument("--keyspace", type=int, default=100000)
+    parser.add_argument("--hot-ratio", type=float, default=0.9)
+    args = parser.parse_args()
+
+    run(
+        args.capacity,
+        args.threads,
+        args.operations,
+        args.keyspace,
+        args.hot_ratio,
+    )
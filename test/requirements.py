@@ -204,10 +204,12 @@ class DefaultRequirements(SuiteRequirements):
             [
                 "mysql+mysqldb",
                 "mysql+pymysql",
+                "mysql+aiomysql",
                 "mysql+cymysql",
                 "mysql+mysqlconnector",
                 "mariadb+mysqldb",
                 "mariadb+pymysql",
+                "mariadb+aiomysql",
                 "mariadb+cymysql",
                 "mariadb+mysqlconnector",
                 "postgresql+pg8000",
@@ -224,9 +226,11 @@ class DefaultRequirements(SuiteRequirements):
                 "postgresql+pygresql",
                 "mysql+mysqlconnector",
                 "mysql+pymysql",
+                "mysql+aiomysql",
                 "mysql+cymysql",
                 "mariadb+mysqlconnector",
                 "mariadb+pymysql",
+                "mariadb+aiomysql",
                 "mariadb+cymysql",
                 "mssql+pymssql",
             ]
@@ -282,6 +286,15 @@ class DefaultRequirements(SuiteRequirements):
     def insert_from_select(self):
         return skip_if(["firebird"], "crashes for unknown reason")
 
+    @property
+    def bulk_upsert(self):
+        """Target backends that have an INSERT construct which can update
+        conflicting rows, as used by Session.bulk_upsert_mappings()."""
+
+        return only_on(
+            ["postgresql >= 9.5", "mysql", "mariadb", "sqlite >= 3.24.0"]
+        )
+
     @property
     def fetch_rows_post_commit(self):
         return skip_if(["firebird"], "not supported")
@@ -875,6 +888,7 @@ class DefaultRequirements(SuiteRequirements):
             "mysql",
             "mariadb",
             "sqlite+pysqlite",
+            "sqlite+aiosqlite",
             "sqlite+pysqlcipher",
             "sybase",
             "mssql",
@@ -890,6 +904,7 @@ class DefaultRequirements(SuiteRequirements):
             "mysql",
             "mariadb",
             "sqlite+pysqlite",
+            "sqlite+aiosqlite",
             "sqlite+pysqlcipher",
             "sybase",
         )
@@ -910,6 +925,7 @@ class DefaultRequirements(SuiteRequirements):
             "mysql",
             "mariadb",
             "sqlite+pysqlite",
+            "sqlite+aiosqlite",
             "sqlite+pysqlcipher",
             "mssql",
         )
@@ -1299,7 +1315,14 @@ class DefaultRequirements(SuiteRequirements):
     def async_dialect(self):
         """dialect makes use of await_() to invoke operations on the DBAPI."""
 
-        return only_on(["postgresql+asyncpg"])
+        return only_on(
+            [
+                "postgresql+asyncpg",
+                "sqlite+aiosqlite",
+                "mysql+aiomysql",
+                "mariadb+aiomysql",
+            ]
+        )
 
     @property
     def oracle_test_dblink(self):
@@ -800,6 +800,154 @@ class QueryTest(fixtures.TestBase):
 
         eq_(len(compiled._bind_processors), 1)
 
+    def test_expanding_in_cached_by_length(self, connection):
+        connection.execute(
+            users.insert(),
+            [
+                dict(user_id=7, user_name="jack"),
+                dict(user_id=8, user_name="fred"),
+                dict(user_id=9, user_name="ed"),
+            ],
+        )
+
+        stmt = (
+            select([users])
+            .where(users.c.user_name.in_(bindparam("uname", expanding=True)))
+            .order_by(users.c.user_id)
+        )
+        compiled = stmt.compile(testing.db)
+
+        eq_(
+            connection.execute(
+                compiled, {"uname": ["jack", "fred"]}
+            ).fetchall(),
+            [(7, "jack"), (8, "fred")],
+        )
+        eq_(
+            connection.execute(compiled, {"uname": ["fred", "ed"]}).fetchall(),
+            [(8, "fred"), (9, "ed")],
+        )
+        eq_(list(compiled._expanded_state_cache), [((2, None),)])
+
+        eq_(
+            connection.execute(compiled, {"uname": ["ed"]}).fetchall(),
+            [(9, "ed")],
+        )
+        eq_(connection.execute(compiled, {"uname": []}).fetchall(), [])
+        eq_(
+            set(compiled._expanded_state_cache),
+            {((2, None),), ((1, None),), ((0, None),)},
+        )
+
+    @testing.requires.tuple_in
+    def test_expanding_in_composite_cached_by_length(self, connection):
+        connection.execute(
+            users.insert(),
+            [
+                dict(user_id=7, user_name="jack"),
+                dict(user_id=8, user_name="fred"),
+                dict(user_id=9, user_name="ed"),
+            ],
+        )
+
+        stmt = (
+            select([users])
+            .where(
+                tuple_(users.c.user_id, users.c.user_name).in_(
+                    bindparam("uname", expanding=True)
+                )
+            )
+            .order_by(users.c.user_id)
+        )
+        compiled = stmt.compile(testing.db)
+
+        eq_(
+            connection.execute(
+                compiled, {"uname": [(7, "jack"), (8, "fred")]}
+            ).fetchall(),
+            [(7, "jack"), (8, "fred")],
+        )
+        eq_(
+            connection.execute(
+                compiled, {"uname": [(8, "fred"), (9, "ed")]}
+            ).fetchall(),
+            [(8, "fred"), (9, "ed")],
+        )
+        eq_(list(compiled._expanded_state_cache), [((2, 2),)])
+
+    def test_expanding_in_not_cached_literal_execute(self, connection):
+        connection.execute(
+            users.insert(),
+            [
+                dict(user_id=7, user_name="jack"),
+                dict(user_id=8, user_name="fred"),
+            ],
+        )
+
+        stmt = select([users]).where(
+            users.c.user_id.in_(
+                bindparam("userid", expanding=True, literal_execute=True)
+            )
+        )
+        compiled = stmt.compile(testing.db)
+
+        eq_(
+            connection.execute(compiled, {"userid": [7]}).fetchall(),
+            [(7, "jack")],
+        )
+        eq_(
+            connection.execute(compiled, {"userid": [8]}).fetchall(),
+            [(8, "fred")],
+        )
+        is_(compiled._post_compile_bind_names, None)
+        eq_(len(compiled._expanded_state_cache), 0)
+
+    def test_expanding_in_padding(self, connection):
+        connection.execute(
+            users.insert(),
+            [
+                dict(user_id=7, user_name="jack"),
+                dict(user_id=8, user_name="fred"),
+                dict(user_id=9, user_name="ed"),
+            ],
+        )
+
+        stmt = (
+            select([users])
+            .where(users.c.user_name.in_(bindparam("uname", expanding=True)))
+            .where(users.c.user_id.in_(bindparam("userid", expanding=True)))
+            .order_by(users.c.user_id)
+        )
+        compiled = stmt.compile(testing.db)
+        conn = connection.execution_options(expanding_parameter_padding=True)
+
+        eq_(
+            conn.execute(
+                compiled, {"uname": ["jack", "fred", "ed"], "userid": [7, 9]}
+            ).fetchall(),
+            [(7, "jack"), (9, "ed")],
+        )
+        eq_(
+            conn.execute(
+                compiled, {"uname": ["fred", "ed", "jack", "x"], "userid": [8]}
+            ).fetchall(),
+            [(8, "fred")],
+        )
+        eq_(
+            conn.execute(
+                compiled, {"uname": ["jack", "ed"], "userid": []}
+            ).fetchall(),
+            [],
+        )
+        eq_(
+            set(compiled._expanded_state_cache),
+            {
+                ((4, None), (2, None)),
+                ((4, None), (1, None)),
+                ((2, None), (0, None)),
+            },
+        )
+
     @testing.fails_on("firebird", "uses sql-92 rules")
     @testing.fails_on("sybase", "uses sql-92 rules")
     @testing.skip_if(["mssql"])